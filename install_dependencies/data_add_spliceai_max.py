@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+import sys
+import pathlib
+import logging
+import os
+import argparse
+
+from cyvcf2 import VCF, Writer
+
+sys.path.append(str(pathlib.Path(__file__).parent.parent / "variant_classification"))
+from format_spliceai import get_spliceai_max
+
+logger = logging.getLogger("Download_data.add_spliceai_max")
+
+parser = argparse = argparse.ArgumentParser()
+
+parser.add_argument(
+    "-i",
+    "--input",
+    default="",
+    help="path to ClinVar file annotated with SpliceAI",
+    type=str,
+)
+parser.add_argument(
+    "-o",
+    "--output",
+    default="",
+    help="output file path. If not given the input file is replaced.",
+    type=str,
+)
+args = parser.parse_args()
+
+
+def add_spliceai_max(clinvar_path: pathlib.Path, out_path: pathlib.Path) -> None:
+    """
+    Add maximum SpliceAI score of each ClinVar entry as INFO field SpliceAI_max
+    """
+    clinvar = VCF(clinvar_path)
+    clinvar.add_info_to_header(
+        {
+            "ID": "SpliceAI_max",
+            "Description": "Maximum SpliceAI delta score of all SpliceAI predictions",
+            "Type": "Float",
+            "Number": "1",
+        }
+    )
+    tmp_path = clinvar_path.parent / (clinvar_path.name.split(".")[0] + "_max.vcf")
+    w = Writer(tmp_path, clinvar)
+    for entry in clinvar:
+        spliceai = entry.INFO.get("SpliceAI")
+        if spliceai is not None:
+            spliceai_max = get_spliceai_max(spliceai)
+            # Missing value marks entries that are discarded by format_spliceai
+            entry.INFO["SpliceAI_max"] = (
+                spliceai_max if spliceai_max is not None else "."
+            )
+        w.write_record(entry)
+    w.close()
+    clinvar.close()
+    path_comp = compress_vcf(tmp_path)
+    os.replace(path_comp, out_path)
+    index_vcf(out_path)
+
+
+def compress_vcf(path: pathlib.Path) -> pathlib.Path:
+    """
+    Compress vcf file and output path to compressed file
+    Return path of compressed file
+    """
+    cmd_compress = f"bgzip -f {path}"
+    os.system(cmd_compress)
+    path_compressed = path.parent / str(path.stem + ".vcf.gz")
+    return path_compressed
+
+
+def index_vcf(path: pathlib.Path) -> None:
+    """
+    Index compressed vcf file
+    """
+    cmd_index = f"tabix -f {path}"
+    os.system(cmd_index)
+
+
+def main():
+    if args.input == "":
+        raise ValueError("No input file provided")
+    input_path = pathlib.Path(args.input)
+    if args.output == "":
+        out_path = input_path
+    else:
+        out_path = pathlib.Path(args.output)
+    add_spliceai_max(input_path, out_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+
+import sys
+import pathlib
+import logging
+import argparse
+from typing import Optional
+
+import pandas as pd
+import pyensembl
+from cyvcf2 import VCF
+from Bio.Seq import Seq
+from Bio.Data import IUPACData
+
+sys.path.append(str(pathlib.Path(__file__).parent.parent / "variant_classification"))
+from index_source import create_index_source, write_index
+from format_spliceai import get_spliceai_max
+
+logger = logging.getLogger("Download_data.create_clinvar_codon_index")
+
+parser = argparse = argparse.ArgumentParser()
+
+parser.add_argument(
+    "-c",
+    "--clinvar",
+    nargs="+",
+    default=[],
+    help="paths to filtered ClinVar SNV files, e.g. ClinVar SNV file and ClinVar SNV file annotated with SpliceAI",
+    type=str,
+)
+parser.add_argument(
+    "-o",
+    "--output",
+    default="",
+    help="output file path. If not given will default to clinvar_codon_index.tsv next to the first ClinVar file.",
+    type=str,
+)
+args = parser.parse_args()
+
+ensembl = pyensembl.EnsemblRelease(110)
+
+INDEX_COLUMNS = [
+    "source",
+    "transcript_id",
+    "codon",
+    "pos",
+    "ref",
+    "alt",
+    "id",
+    "CLNSIG",
+    "GENEINFO",
+    "prot_ref",
+    "prot_alt",
+    "SpliceAI_max",
+]
+
+COMP_BASES = {"C": "G", "G": "C", "A": "T", "T": "A"}
+
+
+def create_clinvar_codon_index(
+    clinvar_paths: list[pathlib.Path], out_path: pathlib.Path
+) -> None:
+    """
+    Collect amino acid change of all (likely) pathogenic ClinVar SNVs for every coding transcript they lie in
+    Size and modification time of the ClinVar files are written to the header, so that the index is not used for other versions of them
+    """
+    entries = []
+    for clinvar_path in clinvar_paths:
+        entries.extend(extract_codon_entries(clinvar_path))
+    index = pd.DataFrame(entries, columns=INDEX_COLUMNS)
+    index = index.sort_values(
+        ["source", "transcript_id", "codon", "pos"], kind="stable"
+    )
+    index_sources = [
+        create_index_source(clinvar_path.name, clinvar_path)
+        for clinvar_path in clinvar_paths
+    ]
+    write_index(index, index_sources, out_path)
+
+
+def extract_codon_entries(clinvar_path: pathlib.Path) -> list[list]:
+    """
+    Extract (likely) pathogenic SNVs from ClinVar and construct their amino acid change per transcript
+    Only these entries can influence PS1 and PM5 on protein level
+    """
+    clinvar = VCF(clinvar_path)
+    entries = []
+    for entry in clinvar:
+        clnsig = entry.INFO.get("CLNSIG")
+        if clnsig is None:
+            continue
+        if not (clnsig == "Pathogenic" or "Likely_pathogenic" in clnsig):
+            continue
+        if len(entry.REF) != 1 or len(entry.ALT) != 1 or len(entry.ALT[0]) != 1:
+            continue
+        spliceai_max = entry.INFO.get("SpliceAI_max")
+        if spliceai_max is None:
+            spliceai_max = get_spliceai_max(entry.INFO.get("SpliceAI"))
+        contig = entry.CHROM.removeprefix("chr")
+        for transcript in ensembl.transcripts_at_locus(contig, entry.POS):
+            codon_info = get_codon_change(transcript, entry.POS, entry.ALT[0])
+            if codon_info is None:
+                continue
+            codon, prot_ref, prot_alt = codon_info
+            entries.append(
+                [
+                    clinvar_path.name,
+                    transcript.transcript_id,
+                    codon,
+                    entry.POS,
+                    entry.REF,
+                    entry.ALT[0],
+                    entry.ID if entry.ID is not None else ".",
+                    clnsig,
+                    entry.INFO.get("GENEINFO", ""),
+                    prot_ref,
+                    prot_alt,
+                    spliceai_max,
+                ]
+            )
+    clinvar.close()
+    return entries
+
+
+def get_codon_change(
+    transcript: pyensembl.transcript.Transcript, pos: int, alt: str
+) -> Optional[tuple[int, str, str]]:
+    """
+    Get codon index (1-based), reference and alternative amino acid of SNV in transcript
+    Returns None in case SNV is not located in coding sequence of transcript
+    """
+    if not transcript.complete:
+        return None
+    try:
+        coding_sequence = transcript.coding_sequence
+        coding_offset = (
+            transcript.spliced_offset(pos) - transcript.first_start_codon_spliced_offset
+        )
+    except ValueError:
+        return None
+    if coding_sequence is None or not 0 <= coding_offset < len(coding_sequence):
+        return None
+    codon = coding_offset // 3 + 1
+    pos_in_codon = coding_offset % 3
+    codon_seq_ref = coding_sequence[(codon - 1) * 3 : codon * 3]
+    if len(codon_seq_ref) != 3 or alt not in COMP_BASES:
+        return None
+    if transcript.strand == "-":
+        alt = COMP_BASES[alt]
+    codon_seq_alt = (
+        codon_seq_ref[:pos_in_codon] + alt + codon_seq_ref[pos_in_codon + 1 :]
+    )
+    return codon, convert_codon_to_aa(codon_seq_ref), convert_codon_to_aa(codon_seq_alt)
+
+
+def convert_codon_to_aa(codon: str) -> str:
+    """
+    Get 3 letter amino acid code corresponding to given codon
+    Termination codon is returned as 'Ter'
+    """
+    aa_1let = str(Seq(codon).translate())
+    try:
+        return IUPACData.protein_letters_1to3[aa_1let]
+    except KeyError:
+        return "Ter"
+
+
+def main():
+    if not args.clinvar:
+        raise ValueError("No input file provided")
+    clinvar_paths = [pathlib.Path(path) for path in args.clinvar]
+    if args.output == "":
+        out_path = clinvar_paths[0].parent / "clinvar_codon_index.tsv"
+    else:
+        out_path = pathlib.Path(args.output)
+    create_clinvar_codon_index(clinvar_paths, out_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+import sys
+import pathlib
+import logging
+import argparse
+
+import pandas as pd
+from cyvcf2 import VCF
+
+sys.path.append(str(pathlib.Path(__file__).parent.parent / "variant_classification"))
+from index_source import create_index_source, write_index
+
+logger = logging.getLogger("Download_data.create_clinvar_lof_index")
+
+parser = argparse = argparse.ArgumentParser()
+
+parser.add_argument(
+    "-s", "--snv", default="", help="path to filtered ClinVar SNV file", type=str
+)
+parser.add_argument(
+    "-i",
+    "--indel",
+    default="",
+    help="path to filtered ClinVar small indel file",
+    type=str,
+)
+parser.add_argument(
+    "-o",
+    "--output",
+    default="",
+    help="output file path. If not given will default to clinvar_lof_index.tsv next to the SNV file.",
+    type=str,
+)
+args = parser.parse_args()
+
+INDEX_COLUMNS = ["source", "chrom", "pos", "end", "id", "CLNSIG", "GENEINFO"]
+
+
+def create_clinvar_lof_index(
+    clinvar_snv_path: pathlib.Path,
+    clinvar_indel_path: pathlib.Path,
+    out_path: pathlib.Path,
+) -> None:
+    """
+    Collect all (likely) pathogenic loss of function variants from ClinVar SNV and indel file
+    Size and modification time of the ClinVar files are written to the header, so that the index is not used for other versions of them
+    """
+    entries = extract_lof_entries(clinvar_snv_path, "snv") + extract_lof_entries(
+        clinvar_indel_path, "indel"
+    )
+    index = pd.DataFrame(entries, columns=INDEX_COLUMNS)
+    index = index.sort_values(["source", "chrom", "pos"], kind="stable")
+    index_sources = [
+        create_index_source("snv", clinvar_snv_path),
+        create_index_source("indel", clinvar_indel_path),
+    ]
+    write_index(index, index_sources, out_path)
+
+
+def extract_lof_entries(clinvar_path: pathlib.Path, source: str) -> list[list]:
+    """
+    Extract ClinVar entries with frameshift or nonsense molecular consequence classified as (likely) pathogenic
+    Only these entries can influence ClinVar region assessment of truncated regions
+    """
+    clinvar = VCF(clinvar_path)
+    entries = []
+    for entry in clinvar:
+        consequence = entry.INFO.get("MC")
+        clnsig = entry.INFO.get("CLNSIG")
+        if consequence is None or clnsig is None:
+            continue
+        if not ("frameshift" in consequence or "nonsense" in consequence):
+            continue
+        if not (clnsig == "Pathogenic" or "Likely_pathogenic" in clnsig):
+            continue
+        entries.append(
+            [
+                source,
+                entry.CHROM,
+                entry.POS,
+                entry.POS + len(entry.REF) - 1,
+                entry.ID if entry.ID is not None else ".",
+                clnsig,
+                entry.INFO.get("GENEINFO", ""),
+            ]
+        )
+    clinvar.close()
+    return entries
+
+
+def main():
+    if args.snv == "" or args.indel == "":
+        raise ValueError("No input file provided")
+    snv_path = pathlib.Path(args.snv)
+    indel_path = pathlib.Path(args.indel)
+    if args.output == "":
+        out_path = snv_path.parent / "clinvar_lof_index.tsv"
+    else:
+        out_path = pathlib.Path(args.output)
+    create_clinvar_lof_index(snv_path, indel_path, out_path)
+
+
+if __name__ == "__main__":
+    main()
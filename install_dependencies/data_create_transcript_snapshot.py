@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+
+import json
+import pathlib
+import logging
+import argparse
+
+import yaml
+import pyensembl
+
+logger = logging.getLogger("Download_data.create_transcript_snapshot")
+
+parser = argparse = argparse.ArgumentParser()
+
+parser.add_argument(
+    "-g",
+    "--genes",
+    nargs="+",
+    default=[],
+    help="names of genes whose transcripts are exported, e.g. BRCA1 BRCA2",
+    type=str,
+)
+parser.add_argument(
+    "-c",
+    "--config",
+    default="",
+    help="path to configuration, transcripts of all genes with a gene specific configuration are exported",
+    type=str,
+)
+parser.add_argument(
+    "-o",
+    "--output",
+    default="",
+    help="output file path. If not given will default to transcript_snapshot.bin in the current directory.",
+    type=str,
+)
+args = parser.parse_args()
+
+ensembl = pyensembl.EnsemblRelease(110)
+
+# Transcript properties that require the Ensembl database, they are restored by variant_classification/transcript_snapshot.py
+SNAPSHOT_VALUES = [
+    "exon_intervals",
+    "contains_start_codon",
+    "contains_stop_codon",
+    "start_codon_complete",
+    "stop_codon_complete",
+    "start_codon_positions",
+    "stop_codon_positions",
+    "coding_sequence_position_ranges",
+    "transcript_version",
+    "protein_id",
+]
+SNAPSHOT_SEQUENCES = ["sequence", "protein_sequence"]
+
+
+def create_transcript_snapshot(genes: list[str], out_path: pathlib.Path) -> None:
+    """
+    Export all transcripts of genes into a snapshot file
+    The snapshot consists of a single line JSON header followed by all sequences
+    Sequences are referenced in the header by their offset and length, so that they can be read from a memory map
+    """
+    header = {"release": ensembl.release, "genes": {}, "transcripts": {}}
+    sequences = bytearray()
+    for gene_name in genes:
+        for gene in ensembl.genes_by_name(gene_name):
+            header["genes"][gene.gene_id] = export_gene(gene)
+            for transcript in gene.transcripts:
+                header["transcripts"][transcript.transcript_id] = export_transcript(
+                    transcript, sequences
+                )
+    logger.info(
+        f"Exported {len(header['transcripts'])} transcripts of {len(header['genes'])} genes"
+    )
+    with open(out_path, "wb") as out_file:
+        out_file.write(json.dumps(header, separators=(",", ":")).encode() + b"\n")
+        out_file.write(sequences)
+
+
+def export_gene(gene: pyensembl.gene.Gene) -> dict:
+    """
+    Export gene and the IDs of its transcripts
+    """
+    return {
+        "gene_name": gene.gene_name,
+        "contig": gene.contig,
+        "start": gene.start,
+        "end": gene.end,
+        "strand": gene.strand,
+        "biotype": gene.biotype,
+        "transcripts": [transcript.transcript_id for transcript in gene.transcripts],
+    }
+
+
+def export_transcript(
+    transcript: pyensembl.transcript.Transcript, sequences: bytearray
+) -> dict:
+    """
+    Export transcript with its exon table, coding sequence and codon coordinates
+    Sequences are appended to sequences
+    Properties that can not be determined for the transcript are exported as error messages
+    """
+    values = {}
+    for name in SNAPSHOT_VALUES:
+        try:
+            values[name] = getattr(transcript, name)
+        except ValueError as error:
+            values[name] = {"error": str(error)}
+    locations = {}
+    for name in SNAPSHOT_SEQUENCES:
+        sequence = getattr(transcript, name)
+        if sequence is None:
+            locations[name] = None
+            continue
+        locations[name] = [len(sequences), len(sequence)]
+        sequences.extend(str(sequence).encode())
+    return {
+        "transcript_name": transcript.transcript_name,
+        "contig": transcript.contig,
+        "start": transcript.start,
+        "end": transcript.end,
+        "strand": transcript.strand,
+        "biotype": transcript.biotype,
+        "gene_id": transcript.gene_id,
+        "support_level": transcript.support_level,
+        "exons": [[exon.exon_id, exon.start, exon.end] for exon in transcript.exons],
+        "values": values,
+        "sequences": locations,
+    }
+
+
+def get_genes_from_config(path_config: pathlib.Path) -> list[str]:
+    """
+    Get names of all genes with a gene specific configuration
+    """
+    with open(path_config) as config_file:
+        config = yaml.safe_load(config_file)
+    return [
+        gene.upper()
+        for gene in config.get("gene_specific_configs", {}).keys()
+        if gene != "root"
+    ]
+
+
+def main():
+    genes = [gene.upper() for gene in args.genes]
+    if args.config != "":
+        genes = genes + get_genes_from_config(pathlib.Path(args.config))
+    if len(genes) == 0:
+        raise ValueError("No genes provided")
+    if args.output == "":
+        out_path = pathlib.Path("transcript_snapshot.bin")
+    else:
+        out_path = pathlib.Path(args.output)
+    create_transcript_snapshot(list(dict.fromkeys(genes)), out_path)
+
+
+if __name__ == "__main__":
+    main()
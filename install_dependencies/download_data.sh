@@ -43,8 +43,11 @@ wget https://ftp.ncbi.nlm.nih.gov/pub/clinvar/vcf_GRCh38/clinvar.vcf.gz
 wget https://ftp.ncbi.nlm.nih.gov/pub/clinvar/vcf_GRCh38/clinvar.vcf.gz.tbi
 in_path_clinvar=$clinvar/clinvar.vcf.gz
 python $basedir/variant_classification/install_dependencies/data_filter_clinvar.py -i $in_path_clinvar -f true
+python $basedir/variant_classification/install_dependencies/data_create_clinvar_lof_index.py -s $clinvar/clinvar_snv_two_star.vcf.gz -i $clinvar/clinvar_small_indel_two_star.vcf.gz
+python $basedir/variant_classification/install_dependencies/data_create_clinvar_codon_index.py -c $clinvar/clinvar_snv_two_star.vcf.gz
 #bash $basedir/variant_classification/install_dependencies/merge_clinvar_spliceai.sh
 #in_path_spliceai_clinvar = $clinvar/clinvar_spliceai_all_sorted.vcf.gz
+#python $basedir/variant_classification/install_dependencies/data_add_spliceai_max.py -i $in_path_spliceai_clinvar
 #python $basedir/variant_classification/install_dependencies/data_filter_clinvar.py -i $in_path_spliceai_clinvar
 
 
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+import pathlib
+
+from variant_classification.clinvar_codon_index import (
+    load_clinvar_codon_index,
+    get_covering_codon_index,
+)
+from variant_classification.format_spliceai import format_spliceai
+from variant_classification.index_source import (
+    create_index_source,
+    format_index_source,
+)
+
+
+def create_codon_index_file(path: pathlib.Path) -> pathlib.Path:
+    """
+    Create small codon index file created from ClinVar file clinvar_snv.vcf.gz
+    """
+    path_clinvar = path / "clinvar_snv.vcf.gz"
+    path_clinvar.write_text("ClinVar")
+    entries = [
+        format_index_source(create_index_source(path_clinvar.name, path_clinvar)),
+        "source\ttranscript_id\tcodon\tpos\tref\talt\tid\tCLNSIG\tGENEINFO\tprot_ref\tprot_alt\tSpliceAI_max",
+        "clinvar_snv.vcf.gz\tENST1\t10\t100\tA\tG\t1\tPathogenic\tBRCA1:672\tArg\tGly\t0.01",
+        "clinvar_snv.vcf.gz\tENST1\t10\t101\tC\tT\t2\tLikely_pathogenic\tBRCA1:672\tArg\tTrp\t",
+        "clinvar_snv.vcf.gz\tENST2\t4\t300\tG\tT\t3\tPathogenic\tNBR2:10230\tGly\tVal\t0.5",
+    ]
+    path_index = path / "clinvar_codon_index.tsv"
+    path_index.write_text("\n".join(entries) + "\n")
+    return path_index
+
+
+def test_get_codon(tmp_path):
+    """
+    Test that entries of codon are returned in the format of construct_clinvar_prot_change
+    """
+    index = load_clinvar_codon_index(create_codon_index_file(tmp_path))
+    codon = index.get_codon(tmp_path / "clinvar_snv.vcf.gz", "ENST1", 10)
+    assert list(codon.id) == ["1", "2"]
+    assert list(codon.pos) == ["100", "101"]
+    assert list(codon.prot_alt) == ["Gly", "Trp"]
+    assert list(codon.prot_start) == [10, 10]
+    assert list(format_spliceai(codon).id) == ["1"]
+    assert index.get_codon("clinvar_snv.vcf.gz", "ENST1", 11).empty
+
+
+def test_index_not_created_from_clinvar_file(tmp_path):
+    """
+    Test that index is only used for ClinVar files it was created from
+    """
+    path_index = create_codon_index_file(tmp_path)
+    path_clinvar = tmp_path / "clinvar_snv.vcf.gz"
+    path_clinvar_spliceai = tmp_path / "clinvar_spliceai.vcf.gz"
+    path_clinvar_spliceai.write_text("ClinVar")
+    assert get_covering_codon_index(path_index, path_clinvar) is not None
+    assert get_covering_codon_index(path_index, path_clinvar_spliceai) is None
+    assert get_covering_codon_index(None, path_clinvar) is None
+
+
+def test_index_created_from_other_clinvar_version(tmp_path):
+    """
+    Test that index is not used for a newer ClinVar file of the same name
+    """
+    path_index = create_codon_index_file(tmp_path)
+    path_clinvar_new = tmp_path / "new" / "clinvar_snv.vcf.gz"
+    path_clinvar_new.parent.mkdir()
+    path_clinvar_new.write_text("Newer ClinVar")
+    assert get_covering_codon_index(path_index, path_clinvar_new) is None
+
+
+def test_outdated_index_warned_once(tmp_path, caplog):
+    """
+    Test that an index created from another version of a ClinVar file is reported once
+    """
+    path_index = create_codon_index_file(tmp_path)
+    path_clinvar_new = tmp_path / "new" / "clinvar_snv.vcf.gz"
+    path_clinvar_new.parent.mkdir()
+    path_clinvar_new.write_text("Newer ClinVar")
+    for _ in range(3):
+        assert get_covering_codon_index(path_index, path_clinvar_new) is None
+    assert caplog.text.count("different version") == 1
+    path_clinvar_new.write_text("Newest ClinVar")
+    assert get_covering_codon_index(path_index, path_clinvar_new) is None
+    assert caplog.text.count("different version") == 2
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+from variant_classification.clinvar_index import (
+    create_contig_index,
+    merge_regions,
+    ClinVar_Index,
+    fetch_clinvar_region,
+    load_clinvar_index,
+    resource_registry,
+)
+from test.test_clinvar_reader import write_clinvar
+
+
+def create_records(entries: list[tuple[int, str]]) -> dict[str, list]:
+    """
+    Create ClinVar columns from position and reference allele
+    """
+    return {
+        "pos": [str(pos) for pos, _ in entries],
+        "ref": [ref for _, ref in entries],
+        "id": [str(i) for i, _ in enumerate(entries)],
+    }
+
+
+def test_merge_regions():
+    """
+    Test that overlapping and adjacent regions are merged per chromosome
+    """
+    regions = [("17", 100, 200), ("17", 150, 300), ("17", 301, 400), ("13", 5, 10)]
+    merged = merge_regions(regions)
+    assert merged == {"13": [(5, 10)], "17": [(100, 400)]}
+
+
+def test_query_overlapping_deletion():
+    """
+    Test that deletions starting upstream of the region are returned
+    """
+    records = create_records([(100, "A"), (95, "ACGTACGT"), (120, "C"), (90, "AC")])
+    contig = create_contig_index(records)
+    hits = contig.query(100, 110)
+    assert hits["pos"] == ["95", "100"]
+    assert contig.query(121, 130)["pos"] == []
+
+
+def test_covers():
+    """
+    Test that only regions within loaded regions are covered by the index
+    """
+    index = ClinVar_Index("path", merge_regions([("17", 100, 200), ("17", 300, 400)]))
+    assert index.covers("17", 100, 200)
+    assert index.covers("17", 310, 320)
+    assert not index.covers("17", 150, 350)
+    assert not index.covers("13", 150, 160)
+
+
+def test_query_batch():
+    """
+    Test that batch query returns the entries of each region
+    """
+    records = create_records([(100, "A"), (95, "ACGTACGT"), (120, "C"), (90, "AC")])
+    contig = create_contig_index(records)
+    hits = contig.query_batch([(121, 130), (100, 110), (90, 91)])
+    assert [hit["pos"] for hit in hits] == [[], ["95", "100"], ["90"]]
+
+
+def test_fetch_replaced_clinvar_file(tmp_path):
+    """
+    Test that ClinVar entries are read from the new file after the ClinVar file was replaced
+    Queries in and outside of the loaded ClinVar index are tested
+    """
+    path_vcf = tmp_path / "clinvar.vcf"
+    path_clinvar = write_clinvar(path_vcf, [(100, "1")])
+    resource_registry.load(
+        "clinvar_index",
+        path_clinvar,
+        lambda path: load_clinvar_index(path, [("17", 1, 150)]),
+    )
+    assert fetch_clinvar_region(path_clinvar, "17", 50, 120)["id"] == ["1"]
+    assert fetch_clinvar_region(path_clinvar, "17", 1, 1000)["id"] == ["1"]
+    write_clinvar(path_vcf, [(100, "2"), (200, "3")])
+    assert fetch_clinvar_region(path_clinvar, "17", 50, 120)["id"] == ["2"]
+    assert resource_registry.peek("clinvar_index", path_clinvar) is None
+    assert fetch_clinvar_region(path_clinvar, "17", 1, 1000)["id"] == ["2", "3"]
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+import pathlib
+
+import pandas as pd
+
+from variant_classification.clinvar_lof_index import (
+    ClinVar_LoF_Index,
+    ClinVar_Status,
+    get_covering_lof_index,
+)
+from variant_classification.index_source import create_index_source, write_index
+
+
+def create_lof_entries() -> pd.DataFrame:
+    """
+    Create entries of small loss of function index
+    """
+    return pd.DataFrame(
+        [
+            ["snv", "17", 100, 100, "1", "Likely_pathogenic", "BRCA1:672"],
+            ["snv", "17", 200, 200, "2", "Pathogenic", "BRCA1:672"],
+            ["indel", "17", 150, 160, "3", "Pathogenic/Likely_pathogenic", "BRCA1:672"],
+            ["indel", "17", 300, 310, "4", "Pathogenic", "NBR2:10230"],
+        ],
+        columns=["source", "chrom", "pos", "end", "id", "CLNSIG", "GENEINFO"],
+    )
+
+
+def create_lof_index() -> ClinVar_LoF_Index:
+    """
+    Create small loss of function index
+    """
+    return ClinVar_LoF_Index("path", create_lof_entries())
+
+
+def test_pathogenic_region():
+    """
+    Test that pathogenic entries are reported with likely pathogenic entries as associated IDs
+    """
+    index = create_lof_index()
+    clinvar = index.check_region("17", "BRCA1", 90, 250)
+    assert clinvar.pathogenic
+    assert clinvar.highest_classification == ClinVar_Status.PATHOGENIC
+    assert clinvar.ids == ["2"]
+    assert clinvar.associated_ids == ["1", "3"]
+
+
+def test_likely_pathogenic_overlapping_deletion():
+    """
+    Test that deletion starting upstream of region is found
+    """
+    index = create_lof_index()
+    clinvar = index.check_region("17", "BRCA1", 155, 190)
+    assert clinvar.highest_classification == ClinVar_Status.LIKELY_PATHOGENIC
+    assert clinvar.ids == ["3"]
+
+
+def test_other_gene():
+    """
+    Test that entries of other genes are ignored
+    """
+    index = create_lof_index()
+    clinvar = index.check_region("17", "BRCA1", 290, 400)
+    assert not clinvar.pathogenic and clinvar.ids == []
+
+
+def test_index_created_from_clinvar_files(tmp_path):
+    """
+    Test that index is only used for the versions of the ClinVar files it was created from
+    """
+    path_snv = tmp_path / "clinvar_snv.vcf.gz"
+    path_indel = tmp_path / "clinvar_indel.vcf.gz"
+    path_snv.write_text("ClinVar SNV")
+    path_indel.write_text("ClinVar indel")
+    path_index = tmp_path / "clinvar_lof_index.tsv"
+    index_sources = [
+        create_index_source("snv", path_snv),
+        create_index_source("indel", path_indel),
+    ]
+    write_index(create_lof_entries(), index_sources, path_index)
+    lof_index = get_covering_lof_index(path_index, path_snv, path_indel)
+    assert lof_index is not None
+    assert lof_index.check_region("17", "BRCA1", 90, 250).ids == ["2"]
+    assert get_covering_lof_index(path_index, path_indel, path_snv) is None
+    assert get_covering_lof_index(None, path_snv, path_indel) is None
+    path_snv.write_text("Newer ClinVar SNV")
+    assert get_covering_lof_index(path_index, path_snv, path_indel) is None
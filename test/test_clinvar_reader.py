@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+import pathlib
+
+import pysam
+
+from variant_classification.clinvar_reader import (
+    VCF_Reader_Pool,
+    collect_vcf_records,
+)
+
+VCF_HEADER = [
+    "##fileformat=VCFv4.1",
+    "##contig=<ID=17>",
+    '##INFO=<ID=CLNSIG,Number=.,Type=String,Description="Clinical significance">',
+    "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO",
+]
+
+
+def write_clinvar(path: pathlib.Path, entries: list[tuple[int, str]]) -> pathlib.Path:
+    """
+    Write bgzipped and indexed ClinVar file with entries given as (position, ID)
+    """
+    lines = VCF_HEADER + [
+        f"17\t{pos}\t{id}\tA\tG\t.\t.\tCLNSIG=Pathogenic" for pos, id in entries
+    ]
+    path.write_text("\n".join(lines) + "\n")
+    return pathlib.Path(pysam.tabix_index(str(path), preset="vcf", force=True))
+
+
+def test_reader_pool_replaced_file(tmp_path):
+    """
+    Test that a ClinVar file replaced on disk is read through a new handle
+    """
+    path_vcf = tmp_path / "clinvar.vcf"
+    path_clinvar = write_clinvar(path_vcf, [(100, "1")])
+    pool = VCF_Reader_Pool()
+    reader = pool.get(path_clinvar)
+    assert pool.get(path_clinvar) is reader
+    assert collect_vcf_records(reader("17:1-1000"))["id"] == ["1"]
+    write_clinvar(path_vcf, [(100, "2"), (200, "3")])
+    assert collect_vcf_records(pool.get(path_clinvar)("17:1-1000"))["id"] == [
+        "2",
+        "3",
+    ]
+    pool.close()
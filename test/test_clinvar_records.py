@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+from typing import Optional
+
+import pandas as pd
+
+from variant_classification.clinvar_utils import (
+    ClinVar_Record,
+    ClinVar_Type,
+    create_ClinVar,
+    create_ClinVar_from_records,
+    filter_gene_records,
+)
+from variant_classification.clinvar_region import filter_lof_variants
+
+
+def create_record(
+    id: str, clnsig: str, geneinfo: str, mc: Optional[str]
+) -> ClinVar_Record:
+    """
+    Create ClinVar record of SNV
+    """
+    return ClinVar_Record(
+        "17", "100", id, "A", "G", ".", ".", clnsig, geneinfo, mc, None, None
+    )
+
+
+def create_records() -> list[ClinVar_Record]:
+    """
+    Create small set of ClinVar records
+    """
+    return [
+        create_record("1", "Likely_pathogenic", "BRCA1:672", "SO:0001587|nonsense"),
+        create_record("2", "Pathogenic", "BRCA1:672", "SO:0001583|missense_variant"),
+        create_record("3", "Pathogenic/Likely_pathogenic", "NBR2:10230", None),
+        create_record("4", "Benign", "BRCA1:672", "SO:0001589|frameshift_variant"),
+    ]
+
+
+def test_create_ClinVar_from_records():
+    """
+    Test that records result in the same ClinVar object as the pd.DataFrame
+    """
+    records = create_records()
+    for subset in [records, records[:1], records[2:], records[3:], []]:
+        clinvar_df = pd.DataFrame(subset, columns=ClinVar_Record._fields, dtype=object)
+        ClinVar_records = create_ClinVar_from_records(subset, ClinVar_Type.REGION)
+        assert ClinVar_records == create_ClinVar(clinvar_df, ClinVar_Type.REGION)
+
+
+def test_filter_records():
+    """
+    Test filtering of records for gene and loss of function variants
+    """
+    records = create_records()
+    clinvar_gene = filter_gene_records(records, "BRCA1")
+    assert [entry.id for entry in clinvar_gene] == ["1", "2", "4"]
+    clinvar_lof = filter_lof_variants(records)
+    assert [entry.id for entry in clinvar_lof] == ["1", "4"]
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+
+import pyensembl
+
+from variant_classification.ensembl import Transcript_Model
+from variant_classification.exon_index import get_exon_index
+
+
+def create_transcript(strand: str, exons: list[tuple[int, int]]) -> Transcript_Model:
+    """
+    Create transcript with given exons in transcript order
+    """
+    transcript = Transcript_Model(
+        "ENST1", "GENE1-201", "17", 100, 219, strand, "protein_coding", "ENSG1", None
+    )
+    transcript._exons = [
+        pyensembl.exon.Exon(f"ENSE{i}", "17", start, end, strand, "GENE1", "ENSG1")
+        for i, (start, end) in enumerate(exons)
+    ]
+    return transcript
+
+
+def test_exon_index_negative_strand():
+    """
+    Test exon lookup by genomic and cDNA position for transcript on negative strand
+    """
+    transcript = create_transcript("-", [(200, 219), (150, 159), (100, 109)])
+    exon_index = get_exon_index(transcript)
+    assert exon_index is get_exon_index(transcript)
+    assert exon_index.get_exon_offsets(True) == [[219, 200], [159, 150], [109, 100]]
+    assert exon_index.get_exon_offsets(False) == [[1, 20], [21, 30], [31, 40]]
+    assert exon_index.find_exon(219, True) == (0, 0)
+    assert exon_index.find_exon(152, True) == (1, 7)
+    assert exon_index.find_exon(120, True) == (-1, -1)
+    assert exon_index.find_exon(21, False) == (1, 0)
+    assert exon_index.find_exon(41, False) == (-1, -1)
+
+
+def test_exon_index_coding_exon():
+    """
+    Test that coding exons are extended by one position in strand direction
+    """
+    transcript = create_transcript("+", [(100, 109), (150, 159), (200, 219)])
+    transcript._coding_sequence_position_ranges = [(105, 109), (150, 159), (200, 205)]
+    transcript._stop_codon_positions = [203, 204, 205]
+    exon_index = get_exon_index(transcript)
+    assert not exon_index.is_in_coding_exon(104)
+    assert exon_index.is_in_coding_exon(105)
+    assert exon_index.is_in_coding_exon(110)
+    assert not exon_index.is_in_coding_exon(111)
+    assert exon_index.is_in_coding_exon(206)
+    assert not exon_index.is_in_coding_exon(207)
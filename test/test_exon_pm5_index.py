@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+import pathlib
+
+import pytest
+
+from variant_classification.exon_pm5_index import Exon_PM5_Index
+
+HEADER = "start\tend\tgene\trule_status\tevidence_strength\tcomment\n"
+
+
+def test_exon_pm5_index_strongest_evidence(tmp_path: pathlib.Path):
+    """
+    Test that entry with strongest evidence is selected for PTC in overlapping regions
+    """
+    path = tmp_path / "exon_pm5.csv"
+    path.write_text(
+        HEADER
+        + "1\t27\tBRCA1\tTRUE\tstrong\texon 2\n"
+        + "27\t45\tBRCA1\tTRUE\tstrong\texon 3\n"
+        + "45\t71\tBRCA1\tFALSE\tmoderate\texon 4\n"
+        + "71\t101\tBRCA1\tTRUE\tsupporting\texon 5\n"
+        + "101\t147\tBRCA1\tTRUE\tsupporting\texon 6\n"
+    )
+    exon_pm5_index = Exon_PM5_Index(path)
+    assert exon_pm5_index.get_entry(0) is None
+    assert exon_pm5_index.get_entry(148) is None
+    assert exon_pm5_index.get_entry(10).comment == "exon 2"
+    assert exon_pm5_index.get_entry(27).comment == " exon 2 exon 3"
+    entry = exon_pm5_index.get_entry(45)
+    assert entry.evidence_strength == "strong"
+    assert entry.comment == "exon 3"
+    entry = exon_pm5_index.get_entry(71)
+    assert entry.rule_status is False
+    assert entry.evidence_strength == "moderate"
+    assert exon_pm5_index.get_entry(101).comment == " exon 5 exon 6"
+
+
+def test_exon_pm5_index_unknown_evidence(tmp_path: pathlib.Path):
+    """
+    Test that regions with unknown evidence strength only affect PTC in these regions
+    """
+    path = tmp_path / "exon_pm5.csv"
+    path.write_text(
+        HEADER
+        + "1\t27\tBRCA1\tTRUE\tstrong\texon 2\n"
+        + "45\t71\tBRCA1\tTRUE\tunknown\texon 4\n"
+        + "60\t80\tBRCA1\tTRUE\tunknown\texon 5\n"
+    )
+    exon_pm5_index = Exon_PM5_Index(path)
+    assert exon_pm5_index.get_entry(10).comment == "exon 2"
+    assert exon_pm5_index.get_entry(50).comment == "exon 4"
+    with pytest.raises(ValueError):
+        exon_pm5_index.get_entry(65)
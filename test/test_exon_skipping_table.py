@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+
+import json
+import pathlib
+
+import hgvs.parser
+
+from variant_classification.ensembl import Transcript_Model
+from variant_classification.transcript_snapshot import (
+    ensembl,
+    Snapshot_Transcript,
+    Transcript_Snapshot,
+)
+from variant_classification.variant import TranscriptInfo, VariantInfo
+from variant_classification.genotoscope_exon_skipping import (
+    VARTYPE,
+    predict_exon_skipping,
+)
+from variant_classification.exon_skipping_table import (
+    Exon_Skipping_Consequence,
+    Exon_Skipping_Table,
+    assess_exon_skipping_consequence,
+    assess_exon_skipping_region_verdict,
+    get_exon_skipping_consequence,
+    get_exon_skipping_region_verdict,
+    get_exon_skipping_table,
+)
+
+BED_HEADER = (
+    "#chr\tstart\tend\tgene\tdomain_name\tstrand\tprot_start\tprot_end\tsource\n"
+)
+
+
+def test_exon_skipping_table():
+    """
+    Test that consequence of skipping an exon is assessed once per transcript
+    """
+    transcript = Transcript_Model(
+        "ENST1", "GENE1-201", "17", 100, 219, "+", "protein_coding", "ENSG1", None
+    )
+    assessed = []
+
+    def assess() -> Exon_Skipping_Consequence:
+        assessed.append(True)
+        return Exon_Skipping_Consequence(
+            exons_skipped=[2],
+            are_exons_skipped=True,
+            start_codon_exon_skipped=False,
+            stop_codon_exon_skipped=False,
+            coding_exon_skipped=True,
+            diff_len=-10,
+            diff_len_protein_percent=0.5,
+            ptc=20,
+            is_reading_frame_preserved=False,
+            is_NMD=True,
+            NMD_affected_exons=[],
+            affected_exon={},
+        )
+
+    exon_skipping_table = get_exon_skipping_table(transcript)
+    assert exon_skipping_table is get_exon_skipping_table(transcript)
+    consequence = exon_skipping_table.get_consequence((2,), assess)
+    assert exon_skipping_table.get_consequence((2,), assess) is consequence
+    assert len(assessed) == 1
+
+
+def create_transcript(path: pathlib.Path) -> Snapshot_Transcript:
+    """
+    Create transcript with four exons from snapshot, skipping the second exon shifts the reading frame
+    """
+    coding_sequence = "ATG" + "AAAGAT" * 22 + "AAA" + "TAA"
+    sequence = "GGGGG" + coding_sequence + "CCCCC"
+    protein_sequence = "M" + "KD" * 22 + "K"
+    exons = [[100, 129], [200, 230], [300, 329], [400, 459]]
+    gene = {
+        "gene_name": "GENE1",
+        "contig": "17",
+        "start": 100,
+        "end": 459,
+        "strand": "+",
+        "biotype": "protein_coding",
+        "transcripts": ["ENST_SKIP"],
+    }
+    transcript = {
+        "transcript_name": "GENE1-201",
+        "contig": "17",
+        "start": 100,
+        "end": 459,
+        "strand": "+",
+        "biotype": "protein_coding",
+        "gene_id": "ENSG1",
+        "support_level": None,
+        "exons": [[f"ENSE{i + 1}", start, end] for i, (start, end) in enumerate(exons)],
+        "values": {
+            "exon_intervals": exons,
+            "contains_start_codon": True,
+            "contains_stop_codon": True,
+            "start_codon_complete": True,
+            "stop_codon_complete": True,
+            "start_codon_positions": [105, 106, 107],
+            "stop_codon_positions": [452, 453, 454],
+            "coding_sequence_position_ranges": [
+                [105, 129],
+                [200, 230],
+                [300, 329],
+                [400, 454],
+            ],
+            "transcript_version": 1,
+            "protein_id": "ENSP1",
+        },
+        "sequences": {
+            "sequence": [0, len(sequence)],
+            "protein_sequence": [len(sequence), len(protein_sequence)],
+        },
+    }
+    header = {
+        "release": ensembl.release,
+        "genes": {"ENSG1": gene},
+        "transcripts": {"ENST_SKIP": transcript},
+    }
+    path_snapshot = path / "transcript_snapshot.bin"
+    with open(path_snapshot, "wb") as snapshot_file:
+        snapshot_file.write(json.dumps(header).encode() + b"\n")
+        snapshot_file.write((sequence + protein_sequence).encode())
+    return Transcript_Snapshot(path_snapshot).get_transcript("ENST_SKIP")
+
+
+def create_splice_variants() -> list[tuple[TranscriptInfo, VariantInfo]]:
+    """
+    Create splice donor and splice acceptor variant that both lead to skipping of the second exon
+    """
+    hgvs_parser = hgvs.parser.Parser()
+    donor = TranscriptInfo(
+        "ENST_SKIP",
+        [VARTYPE.SPLICE_DONOR_VARIANT],
+        hgvs_parser.parse_c_posedit("56+1G>A"),
+        0,
+        0,
+        None,
+        None,
+        2,
+    )
+    acceptor = TranscriptInfo(
+        "ENST_SKIP",
+        [VARTYPE.SPLICE_ACCEPTOR_VARIANT],
+        hgvs_parser.parse_c_posedit("26-1G>A"),
+        0,
+        0,
+        None,
+        None,
+        1,
+    )
+    return [
+        (donor, VariantInfo("17", 231, 231, "GENE1", donor.var_type, "G", "A")),
+        (acceptor, VariantInfo("17", 199, 199, "GENE1", acceptor.var_type, "G", "A")),
+    ]
+
+
+def create_annotation_files(path: pathlib.Path) -> list[pathlib.Path]:
+    """
+    Create ClinVar, repetitive region and critical region files used for region verdicts
+    """
+    path_clinvar = path / "clinvar_snv.vcf.gz"
+    path_clinvar.write_text("ClinVar")
+    path_clinvar_indel = path / "clinvar_small_indel.vcf.gz"
+    path_clinvar_indel.write_text("ClinVar")
+    path_uniprot_rep = path / "uniprot_rep.bed"
+    path_uniprot_rep.write_text(BED_HEADER)
+    path_critical_region = path / "critical_region.bed"
+    path_critical_region.write_text(BED_HEADER)
+    return [
+        path_clinvar,
+        path_clinvar_indel,
+        None,
+        path_uniprot_rep,
+        None,
+        path_critical_region,
+    ]
+
+
+def test_exon_skipping_table_donor_acceptor(tmp_path):
+    """
+    Test that donor and acceptor variant skipping the same exon share consequence and region verdict
+    Shared consequence and region verdict equal a fresh assessment of each variant
+    """
+    ref_transcript = create_transcript(tmp_path)
+    paths = create_annotation_files(tmp_path)
+    results = []
+    for transcript, variant in create_splice_variants():
+        consequence = get_exon_skipping_consequence(transcript, variant, ref_transcript)
+        region_verdict = get_exon_skipping_region_verdict(
+            transcript, variant, ref_transcript, consequence, *paths
+        )
+        fresh_consequence = assess_exon_skipping_consequence(
+            transcript,
+            variant,
+            ref_transcript,
+            predict_exon_skipping(transcript, variant, ref_transcript),
+        )
+        assert consequence == fresh_consequence
+        assert region_verdict == assess_exon_skipping_region_verdict(
+            variant, ref_transcript, fresh_consequence, *paths
+        )
+        results.append((consequence, region_verdict))
+    assert results[0][0] is results[1][0]
+    assert results[0][1] is results[1][1]
+    assert results[0][0].exons_skipped == [2]
+    exon_skipping_table = get_exon_skipping_table(ref_transcript)
+    assert exon_skipping_table.consequences.info()["hits"] == 1
+    assert exon_skipping_table.region_verdicts.info()["hits"] == 1
+
+
+def test_exon_skipping_table_region_file_changed(tmp_path):
+    """
+    Test that region verdict is assessed again after an annotation file changed
+    """
+    ref_transcript = create_transcript(tmp_path)
+    paths = create_annotation_files(tmp_path)
+    transcript, variant = create_splice_variants()[0]
+    consequence = get_exon_skipping_consequence(transcript, variant, ref_transcript)
+    region_verdict = get_exon_skipping_region_verdict(
+        transcript, variant, ref_transcript, consequence, *paths
+    )
+    assert not region_verdict.is_truncated_region_disease_relevant
+    paths[-1].write_text(
+        BED_HEADER + "chr17\t210\t220\tGENE1\tDOMAIN\t+\t10\t15\tVCEP\n"
+    )
+    region_verdict = get_exon_skipping_region_verdict(
+        transcript, variant, ref_transcript, consequence, *paths
+    )
+    assert region_verdict.is_truncated_region_disease_relevant
+    assert get_exon_skipping_table(ref_transcript).region_verdicts.info()["misses"] == 2
+
+
+def test_exon_skipping_table_size():
+    """
+    Test that least recently used consequences are evicted
+    """
+    exon_skipping_table = Exon_Skipping_Table(maxsize=2)
+    for exon in [2, 3, 4]:
+        exon_skipping_table.get_consequence((exon,), lambda: exon)
+    assert exon_skipping_table.consequences.info()["size"] == 2
+    assert exon_skipping_table.get_consequence((2,), lambda: None) is None
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+import pandas as pd
+
+from variant_classification.format_spliceai import format_spliceai, get_spliceai_max
+
+
+def test_precomputed_spliceai_max():
+    """
+    Test that precomputed SpliceAI_max is used and entries marked as missing are discarded
+    """
+    clinvar = pd.DataFrame(
+        {
+            "id": ["1", "2", "3"],
+            "SpliceAI": [
+                "G|BRCA1|0.48|0.03|0.00|0.00|2|-3|10|4",
+                "T|BRCA1|.|.|.|.|.|.|.|.",
+                None,
+            ],
+            "SpliceAI_max": ["0.48", ".", None],
+        },
+        dtype=object,
+    )
+    clinvar_formatted = format_spliceai(clinvar)
+    assert list(clinvar_formatted.id) == ["1"]
+    assert list(clinvar_formatted.SpliceAI_max) == [0.48]
+
+
+def test_spliceai_max_not_precomputed():
+    """
+    Test that SpliceAI_max is calculated for files without precomputed score
+    """
+    clinvar = pd.DataFrame(
+        {
+            "id": ["1", "2"],
+            "SpliceAI": [
+                "G|BRCA1|0.48|0.03|0.00|0.00|2|-3|10|4",
+                "C|BRCA1|0.01|0.20|0.00|0.03|2|-3|10|4",
+            ],
+            "SpliceAI_max": [None, None],
+        },
+        dtype=object,
+    )
+    clinvar_formatted = format_spliceai(clinvar)
+    assert list(clinvar_formatted.id) == ["1", "2"]
+    assert list(clinvar_formatted.SpliceAI_max) == [0.48, 0.2]
+
+
+def test_get_spliceai_max():
+    """
+    Test that maximum SpliceAI score of SpliceAI field is computed as in format_spliceai
+    """
+    assert get_spliceai_max("G|BRCA1|0.48|0.03|0.00|0.00|2|-3|10|4") == 0.48
+    assert get_spliceai_max("T|BRCA1|.|.|.|.|.|.|.|.") is None
+    assert get_spliceai_max(None) is None
+    assert (
+        get_spliceai_max(
+            "G|BRCA1|0.48|0.03|0.00|0.00|2|-3|10|4&G|NBR2|0.01|0.60|0.00|0.00|2|-3|10|4"
+        )
+        == 0.6
+    )
+    assert get_spliceai_max("T|BRCA1|.|.|.|.|.|.|.|.,T|NBR2|.|.|.|.|.|.|.|.") == 0.0
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+
+from variant_classification.lru_cache import LRU_Cache
+
+
+def test_lru_eviction():
+    """
+    Test that least recently used entry is evicted and hits and misses are counted
+    """
+    cache = LRU_Cache(maxsize=2)
+    assert cache.get("a", lambda: 1) == 1
+    assert cache.get("b", lambda: 2) == 2
+    assert cache.get("a", lambda: 3) == 1
+    assert cache.get("c", lambda: 4) == 4
+    assert cache.get("b", lambda: 5) == 5
+    assert cache.info() == {"hits": 1, "misses": 4, "size": 2, "maxsize": 2}
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+
+import pathlib
+
+from variant_classification.mane_index import MANE_Index
+
+
+def test_mane_index(tmp_path: pathlib.Path):
+    """
+    Test that MANE transcripts are matched without version
+    """
+    path = tmp_path / "mane.csv"
+    path.write_text("transcript\nENST00000357654.9\nENST00000380152.8\n")
+    mane_index = MANE_Index(path)
+    assert mane_index.is_mane("ENST00000357654")
+    assert mane_index.is_mane("ENST00000380152.8")
+    assert not mane_index.is_mane("ENST0000035765")
+    transcript_ids = ["ENST00000471181", "ENST00000357654", "ENST00000380152"]
+    assert mane_index.select_transcript_id(transcript_ids) == "ENST00000357654"
+    assert mane_index.select_transcript_id(["ENST00000471181"]) is None
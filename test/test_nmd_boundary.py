@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+import pyensembl
+import hgvs.parser
+
+from variant_classification.ensembl import Transcript_Model
+from variant_classification.variant import TranscriptInfo, VariantInfo
+from variant_classification.genotoscope_exon_skipping import VARTYPE
+from variant_classification.genotoscope_construct_variant_sequence import (
+    construct_variant_coding_seq_exonic_variant,
+)
+from variant_classification.genotoscope_assess_NMD import (
+    NMD_memo,
+    assess_NMD_boundary,
+)
+from test.test_exon_skipping_table import (
+    create_transcript as create_snapshot_transcript,
+)
+from variant_classification.nmd_boundary import get_nmd_boundary
+from variant_classification.genotoscope_protein_len_diff import (
+    calculate_prot_len_diff,
+    correct_position_ptc_for_indels,
+    get_observed_position_ptc,
+)
+
+
+def create_transcript(exons: list[tuple[int, int]]) -> Transcript_Model:
+    """
+    Create transcript on positive strand with start codon at position 105
+    """
+    transcript = Transcript_Model(
+        "ENST1", "GENE1-201", "17", 100, 1199, "+", "protein_coding", "ENSG1", None
+    )
+    transcript._exons = [
+        pyensembl.exon.Exon(f"ENSE{i}", "17", start, end, "+", "GENE1", "ENSG1")
+        for i, (start, end) in enumerate(exons)
+    ]
+    transcript._start_codon_spliced_offsets = [5, 6, 7]
+    return transcript
+
+
+def test_nmd_boundary():
+    """
+    Test NMD prediction by position of PTC relative to last exon junction
+    """
+    transcript = create_transcript([(100, 399), (500, 799), (900, 1199)])
+    nmd_boundary = get_nmd_boundary(transcript)
+    assert nmd_boundary is get_nmd_boundary(transcript)
+    assert nmd_boundary.last_exon_junction == 595
+    assert nmd_boundary.nmd_escape_start == 546
+    assert nmd_boundary.assess_ptc(0, 0) == (False, "PTC after reference stop codon")
+    assert nmd_boundary.assess_ptc(66, 0)[0] is False
+    assert nmd_boundary.assess_ptc(67, 0) == (True, "PTC before last EJC")
+    assert nmd_boundary.assess_ptc(182, 0) == (True, "PTC before last EJC")
+    assert nmd_boundary.assess_ptc(183, 0)[0] is False
+
+
+def test_nmd_boundary_indel():
+    """
+    Test that PTC corrected for indels by calculate_prot_len_diff is shifted to its reference position only once
+    """
+    transcript = create_transcript([(100, 399), (500, 799), (900, 1199)])
+    nmd_boundary = get_nmd_boundary(transcript)
+    # Deletion of 30 bases, PTC starts at reference position 544 before NMD escape start 546
+    corrected_ptc = correct_position_ptc_for_indels(-30, 172)
+    assert corrected_ptc == 182
+    observed_ptc = get_observed_position_ptc(-30, corrected_ptc)
+    assert observed_ptc == 172
+    assert nmd_boundary.assess_ptc(observed_ptc, -30) == (True, "PTC before last EJC")
+    # Deletion of 30 bases, PTC starts at reference position 547
+    assert nmd_boundary.assess_ptc(173, -30)[0] is False
+    # Insertion of 3 bases, PTC starts at observed position 547 and reference position 544
+    assert nmd_boundary.assess_ptc(183, 3) == (True, "PTC before last EJC")
+    # Insertion of 30 bases, distance from start codon is measured in observed coding sequence
+    assert nmd_boundary.assess_ptc(67, 30) == (True, "PTC before last EJC")
+    assert nmd_boundary.assess_ptc(66, 30)[0] is False
+    # No PTC found, the corrected position of 0 is shifted by the deleted codons
+    assert get_observed_position_ptc(-30, correct_position_ptc_for_indels(-30, 0)) == 0
+
+
+def test_nmd_boundary_single_exon():
+    """
+    Test that NMD is not predicted for single exon transcripts
+    """
+    transcript = create_transcript([(100, 1199)])
+    assert get_nmd_boundary(transcript).assess_ptc(100, 0) == (False, "Single exon")
+
+
+def test_nmd_boundary_penultimate_exon():
+    """
+    Test that only PTC in the 3'-most 50 bases of the penultimate exon escape NMD
+    assess_NMD_exonic_variant predicts no NMD for any PTC in the penultimate exon
+    """
+    transcript = create_transcript([(100, 399), (500, 799), (900, 1199)])
+    nmd_boundary = get_nmd_boundary(transcript)
+    # Penultimate exon covers coding positions 296 to 595
+    assert nmd_boundary.assess_ptc(99, 0) == (True, "PTC before last EJC")
+    assert nmd_boundary.assess_ptc(100, 0) == (True, "PTC before last EJC")
+    assert nmd_boundary.assess_ptc(183, 0) == (
+        False,
+        "PTC in last exon or 3'-most 50 bases of penultimate exon",
+    )
+    assert nmd_boundary.assess_ptc(250, 0)[0] is False
+
+
+def test_nmd_boundary_utr_intron():
+    """
+    Test that the last exon junction of transcripts with an intron in the 3' UTR lies after the stop codon
+    PTC in the exon containing the stop codon lead to NMD unless they are in its 3'-most 50 bases
+    assess_NMD_exonic_variant predicts no NMD for PTC in the exon containing the stop codon, as it is the penultimate exon
+    """
+    transcript = create_transcript([(100, 399), (500, 799), (900, 999), (1100, 1199)])
+    nmd_boundary = get_nmd_boundary(transcript)
+    assert nmd_boundary.last_exon_junction == 695
+    assert nmd_boundary.nmd_escape_start == 646
+    # Exon containing the stop codon covers coding positions 596 to 695
+    assert nmd_boundary.assess_ptc(200, 0) == (True, "PTC before last EJC")
+    assert nmd_boundary.assess_ptc(215, 0) == (True, "PTC before last EJC")
+    assert nmd_boundary.assess_ptc(216, 0)[0] is False
+
+
+def test_nmd_memo(tmp_path):
+    """
+    Test that frameshift variants leading to the same PTC share the memoized NMD verdict
+    """
+    ref_transcript = create_snapshot_transcript(tmp_path)
+    hgvs_parser = hgvs.parser.Parser()
+    NMD_memo.clear()
+    results = []
+    for pos in [40, 41, 42]:
+        transcript = TranscriptInfo(
+            "ENST_SKIP",
+            [VARTYPE.FRAMESHIFT_VARIANT],
+            hgvs_parser.parse_c_posedit(f"{pos}_{pos + 1}del"),
+            pos,
+            pos + 1,
+            None,
+            2,
+            None,
+        )
+        # Second exon starts with c.26 at genomic position 200
+        variant = VariantInfo(
+            "17", pos + 174, pos + 175, "GENE1", transcript.var_type, "AA", ""
+        )
+        var_seq, diff_len = construct_variant_coding_seq_exonic_variant(
+            transcript, variant, ref_transcript
+        )
+        _, ptc = calculate_prot_len_diff(ref_transcript, var_seq, diff_len)
+        assert (ptc, diff_len) == (15, -2)
+        results.append(
+            assess_NMD_boundary(
+                transcript, variant, ptc, ref_transcript, var_seq, diff_len
+            )
+        )
+    assert NMD_memo.info()["hits"] == 2 and NMD_memo.info()["misses"] == 1
+    assert results[0][0] is results[2][0] is False
+    assert results[0][1][0]["exon_no"] == 2
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+import pathlib
+
+import pytest
+
+from variant_classification.region_index import Region_Index
+from variant_classification.utils import create_comment_from_bed_hits
+from variant_classification.variant import VariantInfo
+from variant_classification.check_coldspot_hotspot import (
+    check_variant_intersection_with_bed,
+)
+
+BED = (
+    "#chr\tstart\tend\tgene\tdomain_name\tstrand\tprot_start\tprot_end\tsource\n"
+    "chr17\t300\t400\tBRCA1\tBRCT\t-\t10\t20\tVCEP\n"
+    "chr17\t100\t200\tBRCA1\tRING\t-\t1\t5\tVCEP\n"
+    "chr17\t150\t1000\tBRCA1\t\t+\t1\t100\tVCEP\n"
+    "chr13\t100\t200\tBRCA2\tDBD\t+\t1\t5\tVCEP\n"
+)
+
+
+@pytest.fixture
+def region_index(tmp_path: pathlib.Path) -> Region_Index:
+    path_bed = tmp_path / "regions.bed"
+    path_bed.write_text(BED)
+    return Region_Index(path_bed)
+
+
+def test_region_index_overlaps(region_index: Region_Index):
+    """
+    Test that overlaps include region boundaries
+    """
+    hits = region_index.get_overlaps("chr17", 99, 100, "-")
+    assert [hit.fields["domain_name"] for hit in hits] == ["RING"]
+    assert region_index.get_overlaps("chr17", 99, 99, "-") == []
+    assert region_index.get_overlaps("chr17", 201, 299, "-") == []
+    hits = region_index.get_overlaps("chr17", 200, 300, "-")
+    assert [(hit.start, hit.end) for hit in hits] == [(100, 200), (300, 400)]
+    assert region_index.get_overlaps("chr1", 100, 200) == []
+
+
+def test_region_index_strand(region_index: Region_Index):
+    """
+    Test that strand is only checked if given
+    """
+    assert len(region_index.get_overlaps("chr17", 500, 600, "-")) == 0
+    hits = region_index.get_overlaps("chr17", 500, 600)
+    assert [hit.fields["domain_name"] for hit in hits] == [""]
+    assert len(region_index.get_overlaps("chr17", 160, 170)) == 2
+    assert region_index.get_column("gene").count("BRCA1") == 3
+    with pytest.raises(ValueError):
+        region_index.get_overlaps("chr17", 200, 100)
+
+
+def test_create_comment_from_bed_hits(region_index: Region_Index):
+    """
+    Test that comment is created from annotation of overlapping regions
+    """
+    hits = region_index.get_overlaps("chr17", 150, 350, "-")
+    assert create_comment_from_bed_hits(hits) == "RING in BRCA1 BRCT in BRCA1"
+    assert create_comment_from_bed_hits([]) == ""
+
+
+def test_region_index_overlaps_batch(region_index: Region_Index):
+    """
+    Test that batch query returns overlaps of each query in order of the queries
+    """
+    intervals = [(500, 600), (99, 100), (160, 170), (201, 299)]
+    hits = region_index.get_overlaps_batch("chr17", intervals)
+    assert hits == [
+        region_index.get_overlaps("chr17", *interval) for interval in intervals
+    ]
+    assert [len(hit) for hit in hits] == [1, 1, 2, 1]
+    hits = region_index.get_overlaps_batch("chr17", intervals, "-")
+    assert [len(hit) for hit in hits] == [0, 1, 1, 0]
+    assert region_index.get_overlaps_batch("chr1", intervals) == [[], [], [], []]
+
+
+def test_check_variant_intersection_with_bed(tmp_path: pathlib.Path):
+    """
+    Test that hotspot regions are checked on both strands without transcript information
+    """
+    path_bed = tmp_path / "hotspots.bed"
+    path_bed.write_text(BED)
+    variant = VariantInfo("17", 350, 350, "BRCA1", [], "A", "G")
+    assert check_variant_intersection_with_bed(path_bed, variant)
+    variant = VariantInfo("13", 350, 350, "BRCA2", [], "A", "G")
+    assert not check_variant_intersection_with_bed(path_bed, variant)
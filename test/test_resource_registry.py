@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+
+import os
+import pathlib
+
+import test.paths as paths
+from variant_classification.resource_registry import (
+    Resource_Registry,
+    get_file_version,
+)
+from variant_classification.resource_preload import (
+    preload_resources,
+    resource_registry,
+)
+
+
+def read_lines(path: pathlib.Path) -> list[str]:
+    with open(path) as file:
+        return file.read().splitlines()
+
+
+def test_resource_registry_shared(tmp_path: pathlib.Path):
+    """
+    Test that resource is loaded once for different paths to the same file
+    """
+    path = tmp_path / "resource.txt"
+    path.write_text("a\nb\n")
+    (tmp_path / "link.txt").symlink_to(path)
+    registry = Resource_Registry()
+    resource = registry.get("lines", path, read_lines)
+    assert resource == ["a", "b"]
+    assert registry.get("lines", tmp_path / "link.txt", read_lines) is resource
+    assert (
+        registry.get("lines", tmp_path / "." / "resource.txt", read_lines) is resource
+    )
+    info = registry.info()
+    assert len(info) == 1
+    assert info[0]["kind"] == "lines"
+    assert info[0]["file_size"] == 4
+    assert info[0]["memory"] > 0
+
+
+def test_resource_registry_reload(tmp_path: pathlib.Path):
+    """
+    Test that resource is loaded again if the content of the file changed
+    """
+    path = tmp_path / "resource.txt"
+    path.write_text("a\nb\n")
+    registry = Resource_Registry()
+    resource = registry.get("lines", path, read_lines)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert registry.get("lines", path, read_lines) is resource
+    path.write_text("a\nc\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+    assert registry.peek("lines", path) is None
+    assert registry.get("lines", path, read_lines) == ["a", "c"]
+
+
+def test_resource_registry_invalidation_listener(tmp_path: pathlib.Path):
+    """
+    Test that listeners are told about resources dropped after their file changed
+    """
+    path = tmp_path / "resource.txt"
+    path.write_text("a\nb\n")
+    registry = Resource_Registry()
+    dropped = []
+    registry.add_invalidation_listener(lambda kind, path: dropped.append((kind, path)))
+    registry.get("lines", path, read_lines)
+    stat = path.stat()
+    path.write_text("a\nbc\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert registry.peek("lines", path) is None
+    assert dropped == [("lines", path.resolve())]
+
+
+def test_file_version(tmp_path: pathlib.Path):
+    """
+    Test that file version changes with the content of the file
+    """
+    path = tmp_path / "resource.txt"
+    path.write_text("a\nb\n")
+    version = get_file_version(path)
+    assert version == get_file_version(tmp_path / "." / "resource.txt")
+    stat = path.stat()
+    path.write_text("a\nc\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert get_file_version(path) != version
+    assert get_file_version(None) is None
+
+
+def test_preload_resources():
+    """
+    Test that annotation files in configuration are loaded into the registry
+    """
+    config = {
+        "annotation_files": {
+            "root": str(paths.ROOT),
+            "critical_regions": {
+                "root": "data/critical_region",
+                "critical_region": "VCEP_defined_critical_regions.bed",
+                "disease_irrelevant_exons": "VCEP_disease_irrelevant_exons.bed",
+            },
+        }
+    }
+    preload_resources(config)
+    loaded_paths = [resource["path"] for resource in resource_registry.info()]
+    for file_name in [
+        "VCEP_defined_critical_regions.bed",
+        "VCEP_disease_irrelevant_exons.bed",
+    ]:
+        path = paths.ROOT / "data" / "critical_region" / file_name
+        assert str(path.resolve()) in loaded_paths
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pandas as pd
+
+import test.paths as paths
+from variant_classification.similarity_score import (
+    get_similarity_matrix,
+    get_similarity_score_clinvar,
+)
+
+PATH_GRANTHAM = (
+    paths.ROOT / "data" / "similarity_score" / "grantham_score_formatted.csv"
+)
+
+
+def test_similarity_matrix_score():
+    """
+    Test look up of Grantham score for one and three letter amino acid codes
+    """
+    similarity_matrix = get_similarity_matrix(PATH_GRANTHAM)
+    assert similarity_matrix.get_score("C", "A") == 195
+    assert similarity_matrix.get_score("Cys", "Ala") == 195
+    assert similarity_matrix.get_score("A", "*") is None
+
+
+def test_similarity_score_clinvar():
+    """
+    Test scoring of several amino acid exchanges at once
+    """
+    clinvar = pd.DataFrame(
+        {"prot_ref": ["Cys", "Ala", "Ala"], "prot_alt": ["Ala", "Ala", "*"]}
+    )
+    scores = get_similarity_score_clinvar(clinvar, PATH_GRANTHAM).similarity_score
+    assert np.array_equal(scores, [195, 0, np.nan], equal_nan=True)
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+import os
+import pathlib
+
+from variant_classification.splice_table import get_splice_table
+
+HEADER = "position\talternative_allele\trule_status\tevidence_strength\tcomment\n"
+
+
+def test_splice_table_entry(tmp_path: pathlib.Path):
+    """
+    Test that first entry for position and alternative allele is returned
+    """
+    path = tmp_path / "splice_table.csv"
+    path.write_text(
+        HEADER
+        + "72+1\tA\tTrue\tvery_strong\tfirst\n"
+        + "72+1\tA\tFalse\tmoderate\tsecond\n"
+        + "72+1\tC\tFalse\tmoderate\tthird\n"
+    )
+    splice_table = get_splice_table(path)
+    entry = splice_table.get_entry("72+1", "A")
+    assert entry.rule_status is True
+    assert entry.evidence_strength == "very_strong"
+    assert entry.comment == "first"
+    assert splice_table.get_entry("c.72+1", "C").comment == "third"
+    assert splice_table.get_entry("72+1", "G") is None
+    assert splice_table.get_position_entry("72+1").comment == "first"
+    assert splice_table.get_position_entry("72+2") is None
+
+
+def test_splice_table_reload(tmp_path: pathlib.Path):
+    """
+    Test that splice table is reloaded after the file was modified
+    """
+    path = tmp_path / "splice_table.csv"
+    path.write_text(HEADER + "48\tA\tTrue\tmoderate\tfirst\n")
+    splice_table = get_splice_table(path)
+    assert get_splice_table(path) is splice_table
+    path.write_text(HEADER + "48\tA\tFalse\tmoderate\tsecond\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert get_splice_table(path).get_entry("48", "A").comment == "second"
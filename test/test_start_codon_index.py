@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+
+from variant_classification.start_codon_index import (
+    Start_Codon_Index,
+    Variant_Coding_Sequence,
+)
+
+
+class Transcript_Stub:
+    """
+    Transcript with coding sequence
+    """
+
+    def __init__(self, coding_sequence: str):
+        self.coding_sequence = coding_sequence
+
+
+def test_find_start_codon():
+    """
+    Test that first in frame start codon is found in observed sequence
+    """
+    start_codon_index = Start_Codon_Index(Transcript_Stub("ATGCATGCCAAGATGTAA"))
+    assert start_codon_index.atg_positions == ([0, 12], [4], [])
+    assert start_codon_index.find_start_codon("ATGCATGCCAAGATGTAA") == 0
+    var_coding_seq = Variant_Coding_Sequence("ATGCATGCCAAGATGTAA", [(2, 3, "a")])
+    assert start_codon_index.find_start_codon(var_coding_seq) == 4
+    # deletion shifts ATG at position 4 in frame
+    var_coding_seq = Variant_Coding_Sequence("ATGCATGCCAAGATGTAA", [(0, 1, "")])
+    assert start_codon_index.find_start_codon(var_coding_seq) == 1
+    # start codon spanning inserted sequence and reference
+    var_coding_seq = Variant_Coding_Sequence(
+        "ATGCATGCCAAGATGTAA", [(0, 3, ""), (6, 6, "AT")]
+    )
+    assert str(var_coding_seq) == "CATATGCCAAGATGTAA"
+    assert start_codon_index.find_start_codon(var_coding_seq) == 1
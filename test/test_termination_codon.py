@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+
+from variant_classification.termination_codon import (
+    find_termination_codon,
+    search_termination_codon,
+)
+
+
+def test_find_termination_codon():
+    """
+    Test that only in frame termination codons are found
+    """
+    assert find_termination_codon("ATGTTAAGTGAC") == -1
+    assert find_termination_codon("ATGTTAAGTGAC", 1) == 1
+    assert find_termination_codon("ATGTTAAGTGAC", 2) == 2
+
+
+def test_search_termination_codon():
+    """
+    Test that termination codon in last searched codon is not reported
+    and that only the last 17 codons of the penultimate exon are searched
+    """
+    assert search_termination_codon("ATGTAAGGC", False) == (True, 2)
+    assert search_termination_codon("ATGGGCTAA", False) == (False, -1)
+    sequence = "TAA" + "GGC" * 17 + "TGA" + "GGC" * 2
+    assert search_termination_codon(sequence, False) == (True, 1)
+    assert search_termination_codon(sequence, True) == (True, 15)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+from variant_classification.ensembl import (
+    Transcript_Cache,
+    ensembl,
+    clear_ensembl_cache,
+)
+
+
+class Transcript_Stub:
+    """
+    Transcript with sequence of given length
+    """
+
+    def __init__(self, transcript_id: str, length: int):
+        self.transcript_id = transcript_id
+        self._sequence = "A" * length
+
+
+def test_transcript_cache_eviction():
+    """
+    Test that transcripts are loaded once and evicted by number and memory
+    """
+    loaded = []
+
+    def load(transcript_id: str) -> Transcript_Stub:
+        loaded.append(transcript_id)
+        length = 10000 if transcript_id == "ENST_LONG" else 10
+        return Transcript_Stub(transcript_id, length)
+
+    cache = Transcript_Cache(max_transcripts=2, max_memory=5000, load=load)
+    cache.get("ENST1")
+    cache.get("ENST2")
+    cache.get("ENST1")
+    cache.get("ENST3")
+    assert loaded == ["ENST1", "ENST2", "ENST3"]
+    assert cache.info()["size"] == 2
+    cache.get("ENST2")
+    assert loaded[-1] == "ENST2"
+    cache.get("ENST_LONG")
+    info = cache.info()
+    assert info["size"] == 1 and info["memory"] > 5000
+    cache.evict("ENST_LONG")
+    assert cache.info()["size"] == 0
+
+
+def test_clear_ensembl_cache(monkeypatch):
+    """
+    Test that memoized pyensembl objects are cleared while sequences are kept
+    """
+    cleared = []
+
+    class Sequences_Stub:
+        def clear_cache(self):
+            cleared.append("sequences")
+
+    monkeypatch.setattr(ensembl, "_transcript_sequences", Sequences_Stub())
+    monkeypatch.setattr(ensembl, "_protein_sequences", Sequences_Stub())
+    ensembl._transcripts["ENST1"] = Transcript_Stub("ENST1", 10)
+    clear_ensembl_cache()
+    assert "ENST1" not in ensembl._transcripts
+    assert cleared == []
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+import json
+import pathlib
+
+import pytest
+
+from variant_classification.transcript_snapshot import (
+    ensembl,
+    transcript_sources,
+    use_transcript_snapshot,
+)
+
+SEQUENCE = "GG" + "ATG" + "AAA" * 5 + "TAA" + "CCCCCCC"
+
+
+def create_snapshot(path: pathlib.Path) -> None:
+    """
+    Create snapshot of a gene with a coding and a non coding transcript
+    """
+    gene = {
+        "gene_name": "GENE1",
+        "contig": "17",
+        "start": 100,
+        "end": 219,
+        "strand": "+",
+        "biotype": "protein_coding",
+        "transcripts": ["ENST1", "ENST2"],
+    }
+    coding = {
+        "transcript_name": "GENE1-201",
+        "contig": "17",
+        "start": 100,
+        "end": 219,
+        "strand": "+",
+        "biotype": "protein_coding",
+        "gene_id": "ENSG1",
+        "support_level": None,
+        "exons": [["ENSE1", 100, 109], ["ENSE2", 200, 219]],
+        "values": {
+            "exon_intervals": [[100, 109], [200, 219]],
+            "contains_start_codon": True,
+            "contains_stop_codon": True,
+            "start_codon_complete": True,
+            "stop_codon_complete": True,
+            "start_codon_positions": [102, 103, 104],
+            "stop_codon_positions": [210, 211, 212],
+            "coding_sequence_position_ranges": [[102, 109], [200, 212]],
+            "transcript_version": 1,
+            "protein_id": "ENSP1",
+        },
+        "sequences": {"sequence": [0, 30], "protein_sequence": [30, 6]},
+    }
+    message = "Expected 3 positions for start_codon of ENST2 but got 0"
+    non_coding = dict(
+        coding,
+        transcript_name="GENE1-202",
+        values=dict(
+            coding["values"],
+            contains_start_codon=False,
+            start_codon_positions={"error": message},
+            protein_id=None,
+        ),
+        sequences={"sequence": [0, 30], "protein_sequence": None},
+    )
+    header = {
+        "release": ensembl.release,
+        "genes": {"ENSG1": gene},
+        "transcripts": {"ENST1": coding, "ENST2": non_coding},
+    }
+    with open(path, "wb") as snapshot_file:
+        snapshot_file.write(json.dumps(header).encode() + b"\n")
+        snapshot_file.write((SEQUENCE + "MKKKKK").encode())
+
+
+def test_transcript_snapshot(tmp_path):
+    """
+    Test that transcripts are restored from snapshot without access to Ensembl
+    """
+    path = tmp_path / "transcript_snapshot.bin"
+    create_snapshot(path)
+    snapshot = use_transcript_snapshot(path)
+    assert transcript_sources[0] == snapshot.get_transcript
+    transcript_sources.remove(snapshot.get_transcript)
+    transcript = snapshot.get_transcript("ENST1")
+    assert transcript.exons[1].start == 200
+    assert transcript.exon_intervals == [(100, 109), (200, 219)]
+    assert transcript.spliced_offset(200) == 10
+    assert transcript.coding_sequence == "ATG" + "AAA" * 5 + "TAA"
+    assert transcript.three_prime_utr_sequence == "CCCCCCC"
+    assert transcript.protein_sequence == "MKKKKK"
+    assert [entry.transcript_id for entry in transcript.gene.transcripts] == [
+        "ENST1",
+        "ENST2",
+    ]
+    non_coding = snapshot.get_transcript("ENST2")
+    assert non_coding.protein_sequence is None
+    with pytest.raises(ValueError):
+        non_coding.start_codon_positions
+    assert snapshot.get_transcript("ENST3") is None
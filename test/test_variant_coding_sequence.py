@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+from variant_classification.termination_codon import (
+    find_termination_codon,
+    TERMINATION_CODON_PATTERN,
+)
+from variant_classification.variant_coding_sequence import Variant_Coding_Sequence
+
+
+def test_variant_coding_sequence_slicing():
+    """
+    Test that slicing of variant coding sequence equals slicing of constructed sequence
+    """
+    reference = "ATGGCCAAGTTTGGCTAA"
+    var_coding_seq = Variant_Coding_Sequence(
+        reference, [(3, 6, ""), (9, 9, "ccc"), (12, 13, "a")]
+    )
+    observed = "ATG" + "AAG" + "ccc" + "TTT" + "a" + "GCTAA"
+    assert str(var_coding_seq) == observed
+    assert len(var_coding_seq) == len(observed)
+    assert var_coding_seq[4:11] == observed[4:11]
+    assert var_coding_seq[-3:] == observed[-3:]
+    assert var_coding_seq[7] == observed[7]
+    assert var_coding_seq == observed
+
+
+def test_variant_coding_sequence_find_codon():
+    """
+    Test that codons spanning edits are found in frame
+    """
+    var_coding_seq = Variant_Coding_Sequence("ATGGCCAAGTTT", [(4, 4, "t"), (5, 5, "a")])
+    assert str(var_coding_seq) == "ATGGtCaCAAGTTT"
+    assert find_termination_codon(var_coding_seq) == -1
+    assert var_coding_seq.upper().find_codon(TERMINATION_CODON_PATTERN) == -1
+    var_coding_seq = Variant_Coding_Sequence(
+        "ATGGCCAAGTTT", [(4, 5, "T"), (5, 6, "G"), (6, 7, "A")]
+    )
+    assert str(var_coding_seq) == "ATGGTGAAGTTT"
+    assert find_termination_codon(var_coding_seq) == -1
+    assert find_termination_codon(var_coding_seq, 1) == 1
+
+
+def test_variant_coding_sequence_is_reference():
+    """
+    Test comparison to reference ignoring case
+    """
+    assert Variant_Coding_Sequence("ATGGCC", [(3, 4, "g")]).is_reference()
+    assert not Variant_Coding_Sequence("ATGGCC", [(3, 4, "a")]).is_reference()
+    assert not Variant_Coding_Sequence(
+        "ATGGCC", [(4, 6, ""), (6, 6, "CA")]
+    ).is_reference()
@@ -19,7 +19,7 @@ from acmg_rules.computation_evidence_utils import (
 )
 from variant import TranscriptInfo, VariantInfo
 from utils import check_intersection_with_bed
-from ensembl import ensembl
+from ensembl import get_transcript
 
 
 class Bp4_protein_mult_strength(abstract_rule):
@@ -160,7 +160,7 @@ class Bp4_protein_enigma_mult_strength(abstract_rule):
                 evidence_strength.SUPPORTING,
                 f"Variant is not coding in disease relevant transcript and is therfore located outside of the disease relevant region defined by the VCEP.",
             )
-        ref_transcript = ensembl.transcript_by_id(transcripts[0].transcript_id)
+        ref_transcript = get_transcript(transcripts[0].transcript_id)
         in_critical_region, _ = check_intersection_with_bed(
             variant,
             variant.genomic_start,
@@ -243,7 +243,7 @@ class Bp4_splicing_enigma_mult_strength(abstract_rule):
                 evidence_strength.SUPPORTING,
                 f"Variant is not coding in disease relevant transcript and is therfore located outside of the disease relevant region defined by the VCEP.",
             )
-        ref_transcript = ensembl.transcript_by_id(transcripts[0].transcript_id)
+        ref_transcript = get_transcript(transcripts[0].transcript_id)
         in_critical_region, _ = check_intersection_with_bed(
             variant,
             variant.genomic_start,
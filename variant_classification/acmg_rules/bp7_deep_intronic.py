@@ -22,7 +22,7 @@ from acmg_rules.functional_splicing_assay_utils import (
 from variant import RNAData, TranscriptInfo, VariantInfo
 from var_type import VARTYPE
 from utils import select_mane_transcript, check_intersection_with_bed
-from ensembl import ensembl
+from ensembl import get_transcript
 
 
 class Bp7_deep_intronic_enigma_check_disease_region(abstract_rule):
@@ -95,7 +95,7 @@ class Bp7_deep_intronic_enigma_check_disease_region(abstract_rule):
                 evidence_strength.SUPPORTING,
                 f"Variant is not coding in disease relevant transcript and is therfore located outside of the disease relevant region defined by the VCEP.",
             )
-        ref_transcript = ensembl.transcript_by_id(transcripts[0].transcript_id)
+        ref_transcript = get_transcript(transcripts[0].transcript_id)
         in_critical_region, _ = check_intersection_with_bed(
             variant,
             variant.genomic_start,
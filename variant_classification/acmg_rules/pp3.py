@@ -16,7 +16,7 @@ from information import Classification_Info, Info
 from var_type import VARTYPE_GROUPS
 from variant import TranscriptInfo, VariantInfo
 from utils import check_intersection_with_bed
-from ensembl import ensembl
+from ensembl import get_transcript
 
 
 class Pp3_protein(abstract_rule):
@@ -118,7 +118,7 @@ class Pp3_protein_enigma(abstract_rule):
                 evidence_strength.SUPPORTING,
                 f"Variant is not coding in disease relevant transcript and is therfore located outside of the disease relevant region defined by the VCEP.",
             )
-        ref_transcript = ensembl.transcript_by_id(transcripts[0].transcript_id)
+        ref_transcript = get_transcript(transcripts[0].transcript_id)
         in_critical_region, _ = check_intersection_with_bed(
             variant,
             variant.genomic_start,
@@ -241,7 +241,7 @@ class Pp3_splicing_enigma(abstract_rule):
                 evidence_strength.SUPPORTING,
                 f"Variant is not coding in disease relevant transcript and is therfore located outside of the disease relevant region defined by the VCEP.",
             )
-        ref_transcript = ensembl.transcript_by_id(transcripts[0].transcript_id)
+        ref_transcript = get_transcript(transcripts[0].transcript_id)
         in_critical_region, _ = check_intersection_with_bed(
             variant,
             variant.genomic_start,
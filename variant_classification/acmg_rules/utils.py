@@ -7,9 +7,8 @@ from typing import Callable, Optional
 from dataclasses import dataclass
 from enum import Enum
 
-import pandas as pd
-
 from information import Classification_Info, Info
+from mane_index import get_mane_index
 
 
 class evidence_strength(Enum):
@@ -109,12 +108,7 @@ def get_mane_transcript_id(
     """
     From a list of transcript, select get the MANE transcript id
     """
-    mane_transcripts_df = pd.read_csv(mane_path, sep="\t")
-    mane_transcripts = mane_transcripts_df.transcript.dropna()
-    for transcript_id in transcript_ids:
-        if any(mane_transcripts.str.contains(transcript_id)):
-            return transcript_id
-    return None
+    return get_mane_index(mane_path).select_transcript_id(transcript_ids)
 
 
 def construct_compound_comment_for_all_assessed_transcripts(
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 
 import pathlib
-import pandas as pd
+
+from region_index import get_region_index
 
 
 def check_exon_disease_relevant(
@@ -11,11 +12,12 @@ def check_exon_disease_relevant(
     Check if NMD affected exon has been listed as not relevant for disease
     Usually means there is a rescue transcript for the cases where the affected exon is skipped/truncated
     """
-    disease_irrelevant_exons = pd.read_csv(path_disease_irrelevant_exons, sep="\t")
-    disease_irrelevant_exon_ids = disease_irrelevant_exons["exon_name"]
+    disease_irrelevant_exon_ids = get_region_index(
+        path_disease_irrelevant_exons
+    ).get_column_values("exon_name")
     is_exon_disease_relevant = True
     for NMD_affected_exon in NMD_affected_exons:
-        if NMD_affected_exon["exon_id"] in disease_irrelevant_exon_ids.values:
+        if NMD_affected_exon["exon_id"] in disease_irrelevant_exon_ids:
             is_exon_disease_relevant = False
         else:
             return True
@@ -6,7 +6,6 @@ import logging
 from collections.abc import Callable
 from typing import Optional
 
-import pandas as pd
 from acmg_rules.utils import (
     RuleResult,
     evidence_strength,
@@ -16,6 +15,7 @@ from acmg_rules.utils import (
 
 from information import Classification_Info, Info
 from variant import TranscriptInfo
+from splice_table import get_splice_table
 from var_type import VARTYPE_GROUPS
 
 
@@ -58,7 +58,7 @@ def annotate_splice_site_classification_pm5(
             evidence_strength.VERY_STRONG,
             f"Accessing PM5_splice does not apply to this variant, as PM5_splice does not apply to variant types {', '.join([var_type.value for var_type in transcript.var_type])}.",
         )
-    splice_table = pd.read_csv(path_splice_table, sep="\t")
+    splice_table = get_splice_table(path_splice_table)
     try:
         non_snp = ["ins", "del", "dup"]
         if any(entry in str(transcript.var_hgvs) for entry in non_snp):
@@ -67,35 +67,34 @@ def annotate_splice_site_classification_pm5(
                 if abs(transcript.var_hgvs.pos.start.offset) < abs(
                     transcript.var_hgvs.pos.end.offset
                 ):
-                    splice_table_entry = splice_table[
-                        splice_table.position == str(transcript.var_hgvs.pos.start)
-                    ]
+                    splice_table_entry = splice_table.get_position_entry(
+                        transcript.var_hgvs.pos.start
+                    )
                 else:
-                    splice_table_entry = splice_table[
-                        splice_table.position == str(transcript.var_hgvs.pos.end)
-                    ]
+                    splice_table_entry = splice_table.get_position_entry(
+                        transcript.var_hgvs.pos.end
+                    )
 
             # In case only a single nucleotide is deletet, inserted or duplicated
             else:
-                splice_table_entry = splice_table[
-                    splice_table.position == str(transcript.var_hgvs.pos)
-                ]
+                splice_table_entry = splice_table.get_position_entry(
+                    transcript.var_hgvs.pos
+                )
         # Select correct row for single nucleotide exchanges
         else:
-            splice_table_entry = splice_table[
-                (splice_table.position == str(transcript.var_hgvs.pos))
-                & (splice_table.alternative_allele == transcript.var_hgvs.edit.alt)
-            ]
+            splice_table_entry = splice_table.get_entry(
+                transcript.var_hgvs.pos, transcript.var_hgvs.edit.alt
+            )
     except AttributeError:
         return None
-    if splice_table_entry.empty:
+    if splice_table_entry is None:
         return None
     else:
         return RuleResult(
             "PM5",
             rule_type.SPLICING,
             evidence_type.PATHOGENIC,
-            bool(splice_table_entry.rule_status.values[0]),
-            evidence_strength(splice_table_entry.evidence_strength.values[0]),
-            splice_table_entry.comment.values[0],
+            splice_table_entry.rule_status,
+            evidence_strength(splice_table_entry.evidence_strength),
+            splice_table_entry.comment,
         )
@@ -3,7 +3,7 @@
 import pathlib
 import argparse
 
-from ensembl import ensembl
+from ensembl import clear_ensembl_cache
 from load_config import load_config, get_gene_specific_config
 from load_variant import load_variant
 from check_disease_relevant_transcript import check_disease_relevant_transcript
@@ -52,7 +52,7 @@ def classify(config_path: pathlib.Path, variant_str: str) -> tuple[dict, str]:
     )
     rule_final_class = get_final_classifications(rule_dict_checked, final_config)
     out_result = create_output(rule_final_class)
-    ensembl.clear_cache()
+    clear_ensembl_cache()
     return final_config, out_result
 
 
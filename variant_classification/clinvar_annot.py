@@ -2,6 +2,7 @@
 
 import pathlib
 import logging
+from typing import Optional
 from collections.abc import Callable
 
 from information import Classification_Info, Info
@@ -18,6 +19,7 @@ def annotate_clinvar(
     variant: VariantInfo,
     transcripts: list[TranscriptInfo],
     path_clinvar: pathlib.Path,
+    path_clinvar_codon_index: Optional[pathlib.Path] = None,
 ) -> dict[ClinVar_Type, ClinVar]:
     """
     Manage ClinVar annotation
@@ -25,7 +27,7 @@ def annotate_clinvar(
     """
     if any(var_type in VARTYPE_GROUPS.MISSENSE.value for var_type in variant.var_type):
         clinvar_same_aa, clinvar_diff_aa = check_clinvar_missense(
-            variant, transcripts, path_clinvar
+            variant, transcripts, path_clinvar, path_clinvar_codon_index
         )
     else:
         clinvar_same_aa = ClinVar(False, ClinVar_Type.SAME_AA_CHANGE, None, [])
@@ -58,5 +60,6 @@ def get_annotate_clinvar(
             class_info.VARIANT,
             class_info.TRANSCRIPT,
             class_info.CLINVAR_PATH,
+            class_info.CLINVAR_CODON_INDEX_PATH,
         ),
     )
@@ -2,11 +2,11 @@
 
 import pathlib
 import logging
+from typing import Optional
 from collections.abc import Callable
 
 import pandas as pd
 
-from cyvcf2 import VCF
 
 from information import Classification_Info, Info
 from var_type import VARTYPE_GROUPS
@@ -16,9 +16,12 @@ from clinvar_utils import (
     ClinVar_Type,
     filter_gene,
     create_ClinVar,
+    create_ClinVar_from_records,
     get_affected_transcript,
-    convert_vcf_gen_to_df,
+    get_clinvar_records,
+    filter_same_nucleotide_records,
 )
+from clinvar_codon_index import get_covering_codon_index
 from custom_exceptions import No_transcript_with_var_type_found
 from clinvar_missense import (
     extract_var_codon_info,
@@ -27,7 +30,7 @@ from clinvar_missense import (
 )
 from clinvar_splicing import find_corresponding_splice_site
 from acmg_rules.computation_evidence_utils import Threshold, assess_thresholds
-from format_spliceai import format_spliceai
+from format_spliceai import format_spliceai, format_spliceai_records
 
 logger = logging.getLogger("GenOtoScope_Classify.clinvar_annot_spliceai")
 
@@ -37,6 +40,7 @@ def annotate_clinvar_spliceai_protein(
     transcripts: list[TranscriptInfo],
     path_clinvar: pathlib.Path,
     threshold: Threshold,
+    path_clinvar_codon_index: Optional[pathlib.Path] = None,
 ) -> dict[ClinVar_Type, ClinVar]:
     """
     Manage ClinVar annotation
@@ -69,23 +73,39 @@ def annotate_clinvar_spliceai_protein(
     var_codon_info = extract_var_codon_info(
         variant, ref_transcript, affected_transcript
     )
-    clinvar_same_codon = extract_clinvar_entries_missense(
-        path_clinvar,
-        variant.chr,
-        var_codon_info["genomic_pos"],
-        var_codon_info["intersects_intron_at"],
-    )
-    if "SpliceAI" not in clinvar_same_codon.columns and not clinvar_same_codon.empty:
+    codon_index = get_covering_codon_index(path_clinvar_codon_index, path_clinvar)
+    if codon_index is not None:
+        clinvar_same_codon = codon_index.get_codon(
+            path_clinvar,
+            affected_transcript.transcript_id,
+            var_codon_info["prot_start"],
+        )
+    else:
+        clinvar_same_codon = extract_clinvar_entries_missense(
+            path_clinvar,
+            variant.chr,
+            var_codon_info["genomic_pos"],
+            var_codon_info["intersects_intron_at"],
+        )
+    if (
+        "SpliceAI" not in clinvar_same_codon.columns
+        and "SpliceAI_max" not in clinvar_same_codon.columns
+        and not clinvar_same_codon.empty
+    ):
         logger.warning(f"No SpliceAI column availabel for ClinVar entries.")
         clinvar_diff_aa = pd.DataFrame()
         clinvar_same_aa = pd.DataFrame()
     elif not clinvar_same_codon.empty:
         clinvar_same_codon_splicing = format_spliceai(clinvar_same_codon)
-        clinvar_same_codon_aa: pd.DataFrame = clinvar_same_codon_splicing.apply(
-            construct_clinvar_prot_change,
-            var_codon_info=var_codon_info,
-            axis=1,
-        )
+        if codon_index is not None:
+            # Amino acid change of entries is already stored in codon index
+            clinvar_same_codon_aa = clinvar_same_codon_splicing
+        else:
+            clinvar_same_codon_aa: pd.DataFrame = clinvar_same_codon_splicing.apply(
+                construct_clinvar_prot_change,
+                var_codon_info=var_codon_info,
+                axis=1,
+            )
         # Filter out all ClinVar entries with termination codon
         if not clinvar_same_codon_aa.empty:
             clinvar_same_codon_no_ter = clinvar_same_codon_aa[
@@ -141,6 +161,7 @@ def get_annotate_clinvar_spliceai_protein(
             class_info.TRANSCRIPT,
             class_info.CLINVAR_PATH_SPLICEAI,
             class_info.THRESHOLD_SPLICING_PREDICTION_BENIGN,
+            class_info.CLINVAR_CODON_INDEX_PATH,
         ),
     )
 
@@ -160,11 +181,11 @@ def annotate_clinvar_spliceai_splicing(
         logger.warning(
             "Variant is not a SNV. PS1/PM5 currently not implemented for delins."
         )
-        ClinVar_same_nucleotide = create_ClinVar(
-            pd.DataFrame(), ClinVar_Type.SAME_NUCLEOTIDE
+        ClinVar_same_nucleotide = create_ClinVar_from_records(
+            [], ClinVar_Type.SAME_NUCLEOTIDE
         )
-        ClinVar_same_splice_site = create_ClinVar(
-            pd.DataFrame(), ClinVar_Type.SAME_SPLICE_SITE
+        ClinVar_same_splice_site = create_ClinVar_from_records(
+            [], ClinVar_Type.SAME_SPLICE_SITE
         )
         return {
             ClinVar_Type.SAME_NUCLEOTIDE: ClinVar_same_nucleotide,
@@ -178,11 +199,11 @@ def annotate_clinvar_spliceai_splicing(
         logger.warning(
             "No transcript with variant type splice donor or splice acceptor."
         )
-        ClinVar_same_nucleotide = create_ClinVar(
-            pd.DataFrame(), ClinVar_Type.SAME_NUCLEOTIDE
+        ClinVar_same_nucleotide = create_ClinVar_from_records(
+            [], ClinVar_Type.SAME_NUCLEOTIDE
         )
-        ClinVar_same_splice_site = create_ClinVar(
-            pd.DataFrame(), ClinVar_Type.SAME_SPLICE_SITE
+        ClinVar_same_splice_site = create_ClinVar_from_records(
+            [], ClinVar_Type.SAME_SPLICE_SITE
         )
         return {
             ClinVar_Type.SAME_NUCLEOTIDE: ClinVar_same_nucleotide,
@@ -194,11 +215,11 @@ def annotate_clinvar_spliceai_splicing(
         logger.warning(
             "No SpliceAI prediction is given for the variant. ClinVar for splicing variants with SpliceAI assessment can not be assessed."
         )
-        ClinVar_same_nucleotide = create_ClinVar(
-            pd.DataFrame(), ClinVar_Type.SAME_NUCLEOTIDE
+        ClinVar_same_nucleotide = create_ClinVar_from_records(
+            [], ClinVar_Type.SAME_NUCLEOTIDE
         )
-        ClinVar_same_splice_site = create_ClinVar(
-            pd.DataFrame(), ClinVar_Type.SAME_SPLICE_SITE
+        ClinVar_same_splice_site = create_ClinVar_from_records(
+            [], ClinVar_Type.SAME_SPLICE_SITE
         )
         return {
             ClinVar_Type.SAME_NUCLEOTIDE: ClinVar_same_nucleotide,
@@ -211,71 +232,56 @@ def annotate_clinvar_spliceai_splicing(
         logger.warning(
             "Variant is not predicted to have an effect on splicing. Therefore, PS1_splicing does not apply."
         )
-        ClinVar_same_nucleotide = create_ClinVar(
-            pd.DataFrame(), ClinVar_Type.SAME_NUCLEOTIDE
+        ClinVar_same_nucleotide = create_ClinVar_from_records(
+            [], ClinVar_Type.SAME_NUCLEOTIDE
         )
-        ClinVar_same_splice_site = create_ClinVar(
-            pd.DataFrame(), ClinVar_Type.SAME_SPLICE_SITE
+        ClinVar_same_splice_site = create_ClinVar_from_records(
+            [], ClinVar_Type.SAME_SPLICE_SITE
         )
         return {
             ClinVar_Type.SAME_NUCLEOTIDE: ClinVar_same_nucleotide,
             ClinVar_Type.SAME_SPLICE_SITE: ClinVar_same_splice_site,
         }
 
-    clinvar = VCF(path_clinvar)
     ### Check ClinVar for pathogenic variants with same nucleotide change
     ### The predicted of the variant under assessment must be similar or higher than the prediction of the known variant
-    clinvar_same_pos = clinvar(
-        f"{variant.chr}:{variant.genomic_start}-{variant.genomic_end}"
+    clinvar_same_pos = get_clinvar_records(
+        path_clinvar, variant.chr, variant.genomic_start, variant.genomic_end
+    )
+    # Filter ClinVar entries for SpliceAI score
+    clinvar_same_pos_spliceai = [
+        entry
+        for entry, spliceai_max in format_spliceai_records(clinvar_same_pos)
+        if spliceai_max <= var_spliceai
+    ]
+    # Filter out ClinVar variants with the same nucleotide change
+    clinvar_not_same_nucleotide = filter_same_nucleotide_records(
+        clinvar_same_pos_spliceai, variant
+    )
+    ClinVar_same_pos = create_ClinVar_from_records(
+        clinvar_not_same_nucleotide, ClinVar_Type.SAME_NUCLEOTIDE
     )
-    clinvar_same_pos_df = convert_vcf_gen_to_df(clinvar_same_pos)
-    if not clinvar_same_pos_df.empty:
-        clinvar_same_pos_formatted = format_spliceai(clinvar_same_pos_df)
-        # Filter ClinVar entries for SpliceAI score
-        clinvar_same_pos_spliceai = clinvar_same_pos_formatted[
-            clinvar_same_pos_formatted.SpliceAI_max <= var_spliceai
-        ]
-        # Filter out ClinVar variants with the same nucleotide change
-        clinvar_not_same_nucleotide = clinvar_same_pos_spliceai[
-            ~(
-                (clinvar_same_pos_spliceai.alt == variant.var_obs)
-                & (clinvar_same_pos_spliceai.pos == str(variant.genomic_start))
-            )
-        ]
-        ClinVar_same_pos = create_ClinVar(
-            clinvar_not_same_nucleotide, ClinVar_Type.SAME_NUCLEOTIDE
-        )
-    else:
-        ClinVar_same_pos = create_ClinVar(pd.DataFrame(), ClinVar_Type.SAME_NUCLEOTIDE)
 
     ### Check ClinVar for pathogenic variant in same / closest splice site
     (start_splice_site, end_splice_site) = find_corresponding_splice_site(
         affected_transcript, ref_transcript, variant
     )
-    clinvar_splice_site = clinvar(
-        f"{variant.chr}:{start_splice_site}-{end_splice_site}"
+    clinvar_splice_site = get_clinvar_records(
+        path_clinvar, variant.chr, start_splice_site, end_splice_site
+    )
+    # Filter ClinVar entries for SpliceAI score
+    clinvar_splice_site_spliceai = [
+        entry
+        for entry, spliceai_max in format_spliceai_records(clinvar_splice_site)
+        if spliceai_max <= var_spliceai
+    ]
+    # Filter out ClinVar entries with the same nucleotide change
+    clinvar_not_same_nucleotide = filter_same_nucleotide_records(
+        clinvar_splice_site_spliceai, variant
+    )
+    ClinVar_splice_site = create_ClinVar_from_records(
+        clinvar_not_same_nucleotide, ClinVar_Type.SAME_SPLICE_SITE
     )
-    clinvar_splice_site_df = convert_vcf_gen_to_df(clinvar_splice_site)
-    if not clinvar_splice_site_df.empty:
-        clinvar_splice_site_formatted = format_spliceai(clinvar_splice_site_df)
-        # Filter ClinVar entries for SpliceAI score
-        clinvar_splice_site_spliceai = clinvar_splice_site_formatted[
-            clinvar_splice_site_formatted.SpliceAI_max <= var_spliceai
-        ]
-        # Filter out ClinVar entries with the same nucleotide change
-        clinvar_not_same_nucleotide = clinvar_splice_site_spliceai[
-            ~(
-                (clinvar_splice_site_spliceai.alt == variant.var_obs)
-                & (clinvar_splice_site_spliceai.pos == str(variant.genomic_start))
-            )
-        ]
-        ClinVar_splice_site = create_ClinVar(
-            clinvar_not_same_nucleotide, ClinVar_Type.SAME_SPLICE_SITE
-        )
-    else:
-        ClinVar_splice_site = create_ClinVar(
-            pd.DataFrame(), ClinVar_Type.SAME_SPLICE_SITE
-        )
     return {
         ClinVar_Type.SAME_NUCLEOTIDE: ClinVar_same_pos,
         ClinVar_Type.SAME_SPLICE_SITE: ClinVar_splice_site,
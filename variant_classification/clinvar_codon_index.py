@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+import logging
+import pathlib
+from dataclasses import dataclass, field
+from typing import Optional
+
+import pandas as pd
+
+from resource_registry import resource_registry
+from index_source import Index_Source, read_index_sources
+
+logger = logging.getLogger("GenOtoScope_Classify.clinvar_codon_index")
+
+CODON_COLUMNS = [
+    "pos",
+    "ref",
+    "alt",
+    "id",
+    "CLNSIG",
+    "GENEINFO",
+    "prot_ref",
+    "prot_alt",
+    "SpliceAI_max",
+]
+
+
+@dataclass
+class ClinVar_Codon_Index:
+    """
+    (Likely) pathogenic ClinVar SNVs with their amino acid change keyed by ClinVar file, transcript and codon
+    The index holds all (likely) pathogenic SNVs of the ClinVar files it was created from
+    """
+
+    path: str
+    sources: dict[str, Index_Source]
+    codons: dict[tuple[str, str, int], list[tuple]] = field(default_factory=dict)
+
+    def covers(self, path_clinvar: pathlib.Path) -> bool:
+        """
+        Check if index was created from this version of ClinVar file
+        """
+        index_source = self.sources.get(pathlib.Path(path_clinvar).name)
+        return index_source is not None and index_source.matches(path_clinvar)
+
+    def get_codon(
+        self, path_clinvar: pathlib.Path, transcript_id: str, codon: int
+    ) -> pd.DataFrame:
+        """
+        Get ClinVar entries in codon of transcript
+        Returns the columns of construct_clinvar_prot_change, SpliceAI_max is NaN for entries without SpliceAI score
+        """
+        key = (pathlib.Path(path_clinvar).name, transcript_id, codon)
+        entries = self.codons.get(key, [])
+        return pd.DataFrame(entries, columns=CODON_COLUMNS).assign(prot_start=codon)
+
+
+def load_clinvar_codon_index(path: pathlib.Path) -> ClinVar_Codon_Index:
+    """
+    Load index created by install_dependencies/data_create_clinvar_codon_index.py
+    """
+    sources, num_header_lines = read_index_sources(path)
+    entries = pd.read_csv(
+        path,
+        sep="\t",
+        skiprows=num_header_lines,
+        dtype={
+            "source": str,
+            "transcript_id": str,
+            "pos": str,
+            "id": str,
+            "CLNSIG": str,
+            "GENEINFO": str,
+        },
+        keep_default_na=False,
+        na_values={"SpliceAI_max": [""]},
+    )
+    spliceai_max = entries.SpliceAI_max.to_numpy(dtype=float)
+    codons = {}
+    for row, score in zip(
+        entries[["source", "transcript_id", "codon"] + CODON_COLUMNS[:-1]].itertuples(
+            index=False, name=None
+        ),
+        spliceai_max,
+    ):
+        source, transcript_id, codon = row[:3]
+        codons.setdefault((source, transcript_id, int(codon)), []).append(
+            row[3:] + (score,)
+        )
+    logger.info(f"Loaded {len(entries)} ClinVar entries in {len(codons)} codons")
+    return ClinVar_Codon_Index(str(path), sources, codons)
+
+
+def get_clinvar_codon_index(path: pathlib.Path) -> ClinVar_Codon_Index:
+    """
+    Get index of ClinVar amino acid changes, load it on first access
+    """
+    return resource_registry.get("clinvar_codon_index", path, load_clinvar_codon_index)
+
+
+def get_covering_codon_index(
+    path_clinvar_codon_index: Optional[pathlib.Path], path_clinvar: pathlib.Path
+) -> Optional[ClinVar_Codon_Index]:
+    """
+    Get index of ClinVar amino acid changes, in case it is configured and was created from this version of ClinVar file
+    """
+    if path_clinvar_codon_index is None:
+        return None
+    codon_index = get_clinvar_codon_index(path_clinvar_codon_index)
+    if not codon_index.covers(path_clinvar):
+        logger.debug(
+            f"ClinVar codon index {path_clinvar_codon_index} was not created from {path_clinvar}"
+        )
+        return None
+    return codon_index
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+
+import logging
+import pathlib
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from collections.abc import Iterable
+
+import numpy as np
+from cyvcf2 import VCF
+
+from clinvar_reader import (
+    CLINVAR_INFO_KEYS,
+    VCF_COLUMNS,
+    collect_vcf_records,
+    query_clinvar,
+)
+from ensembl import ensembl
+from lru_cache import LRU_Cache
+from resource_registry import resource_registry, get_file_version
+
+logger = logging.getLogger("GenOtoScope_Classify.clinvar_index")
+
+
+@dataclass
+class ClinVar_Contig_Index:
+    """
+    ClinVar entries of one chromosome sorted by position
+    ends holds the last reference position covered by each entry
+    """
+
+    positions: np.ndarray
+    ends: np.ndarray
+    max_length: int
+    columns: dict[str, np.ndarray]
+
+    def query(self, start: int, end: int) -> dict[str, list]:
+        """
+        Get entries overlapping region, same as a tabix query on the VCF file
+        """
+        lo = np.searchsorted(self.positions, start - self.max_length + 1, side="left")
+        hi = np.searchsorted(self.positions, end, side="right")
+        overlap = self.ends[lo:hi] >= start
+        return {
+            name: column[lo:hi][overlap].tolist()
+            for name, column in self.columns.items()
+        }
+
+    def query_batch(self, intervals: list[tuple[int, int]]) -> list[dict[str, list]]:
+        """
+        Get entries overlapping each of the regions, the bounds of all regions are searched at once
+        """
+        starts = np.array([start for start, _ in intervals], dtype=np.int64)
+        ends = np.array([end for _, end in intervals], dtype=np.int64)
+        los = np.searchsorted(self.positions, starts - self.max_length + 1, side="left")
+        his = np.searchsorted(self.positions, ends, side="right")
+        hits = []
+        for start, lo, hi in zip(starts, los, his):
+            overlap = self.ends[lo:hi] >= start
+            hits.append(
+                {
+                    name: column[lo:hi][overlap].tolist()
+                    for name, column in self.columns.items()
+                }
+            )
+        return hits
+
+
+@dataclass
+class ClinVar_Index:
+    """
+    In memory copy of ClinVar entries within the regions of the loaded genes
+    """
+
+    path: str
+    regions: dict[str, list[tuple[int, int]]] = field(default_factory=dict)
+    contigs: dict[str, ClinVar_Contig_Index] = field(default_factory=dict)
+
+    def covers(self, chrom: str, start: int, end: int) -> bool:
+        """
+        Check if region lies completely within the loaded regions
+        """
+        regions = self.regions.get(chrom, [])
+        idx = bisect_right(regions, (start, float("inf"))) - 1
+        return idx >= 0 and regions[idx][0] <= start and end <= regions[idx][1]
+
+    def query(self, chrom: str, start: int, end: int) -> dict[str, list]:
+        """
+        Get ClinVar entries in region
+        """
+        contig = self.contigs.get(chrom)
+        if contig is None:
+            return {name: [] for name in VCF_COLUMNS + list(CLINVAR_INFO_KEYS)}
+        return contig.query(start, end)
+
+    def query_batch(
+        self, chrom: str, intervals: list[tuple[int, int]]
+    ) -> list[dict[str, list]]:
+        """
+        Get ClinVar entries in each of the regions
+        """
+        contig = self.contigs.get(chrom)
+        if contig is None:
+            return [
+                {name: [] for name in VCF_COLUMNS + list(CLINVAR_INFO_KEYS)}
+                for _ in intervals
+            ]
+        return contig.query_batch(intervals)
+
+
+CLINVAR_QUERY_CACHE_SIZE = 4096
+
+clinvar_query_cache = LRU_Cache(CLINVAR_QUERY_CACHE_SIZE)
+
+
+def load_clinvar_index(
+    path_clinvar: pathlib.Path, regions: Iterable[tuple[str, int, int]]
+) -> ClinVar_Index:
+    """
+    Load all ClinVar entries overlapping the regions into sorted arrays
+    """
+    path = str(pathlib.Path(path_clinvar).expanduser())
+    merged_regions = merge_regions(regions)
+    clinvar = VCF(path)
+    index = ClinVar_Index(path, merged_regions)
+    for chrom, chrom_regions in merged_regions.items():
+        records = {name: [] for name in VCF_COLUMNS + list(CLINVAR_INFO_KEYS)}
+        for start, end in chrom_regions:
+            region_records = collect_vcf_records(clinvar(f"{chrom}:{start}-{end}"))
+            for name, column in region_records.items():
+                records[name].extend(column)
+        index.contigs[chrom] = create_contig_index(records)
+    clinvar.close()
+    logger.info(
+        f"Loaded {sum(len(contig.positions) for contig in index.contigs.values())} ClinVar entries from {path}"
+    )
+    return index
+
+
+def create_contig_index(records: dict[str, list]) -> ClinVar_Contig_Index:
+    """
+    Convert ClinVar entries of one chromosome into sorted arrays
+    """
+    positions = np.array(records["pos"], dtype=np.int64)
+    lengths = np.array([len(ref) for ref in records["ref"]], dtype=np.int64)
+    order = np.argsort(positions, kind="stable")
+    columns = {}
+    for name, column in records.items():
+        array = np.empty(len(column), dtype=object)
+        array[:] = column
+        columns[name] = array[order]
+    return ClinVar_Contig_Index(
+        positions=positions[order],
+        ends=(positions + lengths - 1)[order],
+        max_length=int(lengths.max()) if len(lengths) else 1,
+        columns=columns,
+    )
+
+
+def merge_regions(
+    regions: Iterable[tuple[str, int, int]],
+) -> dict[str, list[tuple[int, int]]]:
+    """
+    Merge overlapping regions per chromosome
+    """
+    merged = {}
+    for chrom, start, end in sorted(regions):
+        chrom_regions = merged.setdefault(chrom, [])
+        if chrom_regions and start <= chrom_regions[-1][1] + 1:
+            chrom_regions[-1] = (chrom_regions[-1][0], max(end, chrom_regions[-1][1]))
+        else:
+            chrom_regions.append((start, end))
+    return merged
+
+
+def get_gene_regions(genes: Iterable[str]) -> list[tuple[str, int, int]]:
+    """
+    Get genomic regions of genes from Ensembl
+    """
+    regions = []
+    for gene_name in genes:
+        try:
+            genes_ensembl = ensembl.genes_by_name(gene_name.upper())
+        except ValueError:
+            logger.warning(f"Gene {gene_name} not found in Ensembl.")
+            continue
+        for gene in genes_ensembl:
+            regions.append((gene.contig, gene.start, gene.end))
+    return regions
+
+
+def preload_clinvar_index(
+    paths_clinvar: Iterable[pathlib.Path], genes: Iterable[str]
+) -> None:
+    """
+    Load ClinVar entries of genes into memory, following queries in these genes use the index
+    """
+    regions = get_gene_regions(genes)
+    for path_clinvar in paths_clinvar:
+        resource_registry.load(
+            "clinvar_index",
+            path_clinvar,
+            lambda path: load_clinvar_index(path, regions),
+        )
+
+
+def preload_clinvar_index_from_config(config: dict) -> None:
+    """
+    Load ClinVar files in configuration for all genes with a gene specific configuration
+    """
+    root = pathlib.Path(config["annotation_files"]["root"])
+    clinvar_config = config["annotation_files"]["clinvar"]
+    dir_clinvar = root / pathlib.Path(clinvar_config["root"])
+    paths_clinvar = [
+        (dir_clinvar / clinvar_config[key]).expanduser()
+        for key in ["clinvar_snv", "clinvar_indel", "clinvar_snv_spliceai"]
+        if key in clinvar_config
+    ]
+    genes = [
+        gene
+        for gene in config.get("gene_specific_configs", {}).keys()
+        if gene != "root"
+    ]
+    preload_clinvar_index(
+        [path for path in paths_clinvar if path.exists()],
+        genes,
+    )
+
+
+def fetch_clinvar_region(
+    path_clinvar: pathlib.Path, chrom: str, start: int, end: int
+) -> dict[str, list]:
+    """
+    Get ClinVar entries in region as columns
+    Results of VCF queries are cached, the returned columns must not be modified
+    """
+    path = pathlib.Path(path_clinvar).expanduser()
+    # Modification time and size identify the file version, a replaced file is queried again
+    key = (get_file_version(path), chrom, start, end)
+    return clinvar_query_cache.get(
+        key, lambda: query_clinvar_region(path, chrom, start, end)
+    )
+
+
+def fetch_clinvar_regions(
+    path_clinvar: pathlib.Path, chrom: str, intervals: list[tuple[int, int]]
+) -> list[dict[str, list]]:
+    """
+    Get ClinVar entries in each of the regions as columns
+    Entries of all regions are fetched with one query spanning the regions and split into the regions afterwards
+    """
+    if not intervals:
+        return []
+    path = pathlib.Path(path_clinvar).expanduser()
+    span_start = min(start for start, _ in intervals)
+    span_end = max(end for _, end in intervals)
+    index = resource_registry.peek("clinvar_index", path)
+    if index is not None and index.covers(chrom, span_start, span_end):
+        return index.query_batch(chrom, intervals)
+    records = fetch_clinvar_region(path, chrom, span_start, span_end)
+    return create_contig_index(records).query_batch(intervals)
+
+
+def query_clinvar_region(
+    path_clinvar: pathlib.Path, chrom: str, start: int, end: int
+) -> dict[str, list]:
+    """
+    Get ClinVar entries in region as columns
+    Use in memory index if region was loaded, otherwise query the VCF file
+    """
+    index = resource_registry.peek("clinvar_index", path_clinvar)
+    if index is not None and index.covers(chrom, start, end):
+        return index.query(chrom, start, end)
+    return collect_vcf_records(query_clinvar(path_clinvar, chrom, start, end))
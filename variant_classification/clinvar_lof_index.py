@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+
+import logging
+import pathlib
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from clinvar_utils import ClinVar, ClinVar_Status, ClinVar_Type
+from resource_registry import resource_registry
+from index_source import Index_Source, read_index_sources
+
+logger = logging.getLogger("GenOtoScope_Classify.clinvar_lof_index")
+
+SOURCES = ["snv", "indel"]
+
+
+@dataclass
+class ClinVar_LoF_Entries:
+    """
+    (Likely) pathogenic loss of function ClinVar entries of one gene and chromosome sorted by position
+    Cumulative counts of pathogenic and likely pathogenic entries allow counting entries in a region by binary search
+    """
+
+    positions: np.ndarray
+    ends: np.ndarray
+    ids: np.ndarray
+    max_length: int
+    count_pathogenic: np.ndarray
+    count_likely_pathogenic: np.ndarray
+    is_pathogenic: np.ndarray
+    is_likely_pathogenic: np.ndarray
+    contains_likely_pathogenic: np.ndarray
+
+    @classmethod
+    def from_df(cls, entries: pd.DataFrame):
+        entries = entries.sort_values("pos", kind="stable")
+        clnsig = entries.CLNSIG.to_numpy(dtype=object)
+        is_pathogenic = clnsig == "Pathogenic"
+        is_likely_pathogenic = (clnsig == "Likely_pathogenic") | (
+            clnsig == "Pathogenic/Likely_pathogenic"
+        )
+        contains_likely_pathogenic = np.array(
+            ["Likely_pathogenic" in sig for sig in clnsig], dtype=bool
+        )
+        positions = entries.pos.to_numpy(dtype=np.int64)
+        ends = entries.end.to_numpy(dtype=np.int64)
+        return cls(
+            positions=positions,
+            ends=ends,
+            ids=entries.id.to_numpy(dtype=object),
+            max_length=int((ends - positions).max()) + 1 if len(positions) else 1,
+            count_pathogenic=np.concatenate(([0], np.cumsum(is_pathogenic))),
+            count_likely_pathogenic=np.concatenate(
+                ([0], np.cumsum(is_likely_pathogenic))
+            ),
+            is_pathogenic=is_pathogenic,
+            is_likely_pathogenic=is_likely_pathogenic,
+            contains_likely_pathogenic=contains_likely_pathogenic,
+        )
+
+    def get_region(self, start: int, end: int) -> tuple[np.ndarray, int, int]:
+        """
+        Get entries overlapping the region
+        Entries starting upstream of the region and reaching into it are returned as indices, all other entries as a slice
+        """
+        lo = np.searchsorted(self.positions, start - self.max_length + 1, side="left")
+        lo_start = np.searchsorted(self.positions, start, side="left")
+        hi = max(np.searchsorted(self.positions, end, side="right"), lo_start)
+        upstream = np.arange(lo, lo_start)
+        upstream = upstream[self.ends[lo:lo_start] >= start]
+        return upstream, int(lo_start), int(hi)
+
+    def count(self, start: int, end: int) -> tuple[int, int]:
+        """
+        Count pathogenic and likely pathogenic entries in region
+        """
+        upstream, lo, hi = self.get_region(start, end)
+        num_pathogenic = self.count_pathogenic[hi] - self.count_pathogenic[lo]
+        num_likely_pathogenic = (
+            self.count_likely_pathogenic[hi] - self.count_likely_pathogenic[lo]
+        )
+        num_pathogenic += int(self.is_pathogenic[upstream].sum())
+        num_likely_pathogenic += int(self.is_likely_pathogenic[upstream].sum())
+        return int(num_pathogenic), int(num_likely_pathogenic)
+
+    def get_ids(self, start: int, end: int, mask: np.ndarray) -> list[str]:
+        """
+        Get IDs of entries in region, that match the classification mask
+        """
+        upstream, lo, hi = self.get_region(start, end)
+        indices = np.concatenate((upstream, np.arange(lo, hi)))
+        indices.sort(kind="stable")
+        return list(self.ids[indices[mask[indices]]])
+
+
+@dataclass
+class ClinVar_LoF_Index:
+    """
+    Index of (likely) pathogenic loss of function ClinVar entries from SNV and indel ClinVar file
+    """
+
+    path: str
+    entries: pd.DataFrame
+    sources: dict[str, Index_Source] = field(default_factory=dict)
+    genes: dict[tuple[str, str, str], ClinVar_LoF_Entries] = field(default_factory=dict)
+
+    def covers(
+        self, path_clinvar_snv: pathlib.Path, path_clinvar_indel: pathlib.Path
+    ) -> bool:
+        """
+        Check if index was created from this version of ClinVar SNV and indel file
+        """
+        return all(
+            source in self.sources and self.sources[source].matches(path_clinvar)
+            for source, path_clinvar in zip(
+                SOURCES, [path_clinvar_snv, path_clinvar_indel]
+            )
+        )
+
+    def get_entries(self, source: str, chrom: str, gene: str) -> ClinVar_LoF_Entries:
+        """
+        Get entries of one ClinVar file for gene, entries are filtered as in filter_gene_records
+        """
+        key = (source, chrom, gene)
+        if key not in self.genes:
+            entries = self.entries[
+                (self.entries.source == source)
+                & (self.entries.chrom == chrom)
+                & (self.entries.GENEINFO.str.contains(gene))
+            ]
+            self.genes[key] = ClinVar_LoF_Entries.from_df(entries)
+        return self.genes[key]
+
+    def check_region(self, chrom: str, gene: str, start: int, end: int) -> ClinVar:
+        """
+        Assess (likely) pathogenic loss of function entries in region
+        Result equals create_ClinVar_from_records on the loss of function entries from SNV and indel file
+        """
+        gene_entries = [self.get_entries(source, chrom, gene) for source in SOURCES]
+        num_pathogenic = 0
+        num_likely_pathogenic = 0
+        for entries in gene_entries:
+            pathogenic, likely_pathogenic = entries.count(start, end)
+            num_pathogenic += pathogenic
+            num_likely_pathogenic += likely_pathogenic
+        if num_pathogenic > 0:
+            ids = [
+                id
+                for entries in gene_entries
+                for id in entries.get_ids(start, end, entries.is_pathogenic)
+            ]
+            associated_ids = [
+                id
+                for entries in gene_entries
+                for id in entries.get_ids(
+                    start, end, entries.contains_likely_pathogenic
+                )
+            ]
+            return ClinVar(
+                True,
+                ClinVar_Type.REGION,
+                ClinVar_Status.PATHOGENIC,
+                ids,
+                associated_ids,
+            )
+        elif num_likely_pathogenic > 0:
+            ids = [
+                id
+                for entries in gene_entries
+                for id in entries.get_ids(
+                    start, end, entries.contains_likely_pathogenic
+                )
+            ]
+            return ClinVar(
+                True, ClinVar_Type.REGION, ClinVar_Status.LIKELY_PATHOGENIC, ids, []
+            )
+        return ClinVar(False, ClinVar_Type.REGION, None, [], [])
+
+
+def load_clinvar_lof_index(path: pathlib.Path) -> ClinVar_LoF_Index:
+    """
+    Load index created by install_dependencies/data_create_clinvar_lof_index.py
+    """
+    sources, num_header_lines = read_index_sources(path)
+    entries = pd.read_csv(
+        path,
+        sep="\t",
+        skiprows=num_header_lines,
+        dtype={"chrom": str, "id": str, "CLNSIG": str, "GENEINFO": str},
+        keep_default_na=False,
+    )
+    return ClinVar_LoF_Index(str(path), entries, sources)
+
+
+def get_clinvar_lof_index(path: pathlib.Path) -> ClinVar_LoF_Index:
+    """
+    Get index of loss of function ClinVar entries, load it on first access
+    """
+    return resource_registry.get("clinvar_lof_index", path, load_clinvar_lof_index)
+
+
+def get_covering_lof_index(
+    path_clinvar_lof_index: Optional[pathlib.Path],
+    path_clinvar_snv: pathlib.Path,
+    path_clinvar_indel: pathlib.Path,
+) -> Optional[ClinVar_LoF_Index]:
+    """
+    Get index of loss of function ClinVar entries, in case it is configured and was created from this version of ClinVar SNV and indel file
+    """
+    if path_clinvar_lof_index is None:
+        return None
+    lof_index = get_clinvar_lof_index(path_clinvar_lof_index)
+    if not lof_index.covers(path_clinvar_snv, path_clinvar_indel):
+        logger.debug(
+            f"ClinVar loss of function index {path_clinvar_lof_index} was not created from {path_clinvar_snv} and {path_clinvar_indel}"
+        )
+        return None
+    return lof_index
@@ -3,11 +3,12 @@
 from math import ceil
 import logging
 import pathlib
+from typing import Optional
+
 import pandas as pd
 
 from Bio.Seq import Seq
 from Bio.Data import IUPACData
-from cyvcf2 import VCF
 import pyensembl
 
 from variant import VariantInfo, TranscriptInfo
@@ -20,16 +21,21 @@ from clinvar_utils import (
     ClinVar_Type,
     filter_gene,
     create_ClinVar,
-    convert_vcf_gen_to_df,
+    get_clinvar_df,
     get_affected_transcript,
 )
+from clinvar_codon_index import get_covering_codon_index
+from exon_index import get_exon_index
 from custom_exceptions import No_transcript_with_var_type_found
 
 logger = logging.getLogger("GenOtoScope_Classify.clinvar.missense")
 
 
 def check_clinvar_missense(
-    variant: VariantInfo, transcripts: list[TranscriptInfo], path_clinvar: pathlib.Path
+    variant: VariantInfo,
+    transcripts: list[TranscriptInfo],
+    path_clinvar: pathlib.Path,
+    path_clinvar_codon_index: Optional[pathlib.Path] = None,
 ) -> tuple[ClinVar, ClinVar]:
     """
     Check ClinVar for entries supporting pathogenicity of missense variant
@@ -55,16 +61,12 @@ def check_clinvar_missense(
     var_codon_info = extract_var_codon_info(
         variant, ref_transcript, affected_transcript
     )
-    clinvar_same_codon = extract_clinvar_entries_missense(
+    clinvar_same_codon_aa = get_clinvar_same_codon_aa(
+        variant,
+        affected_transcript,
+        var_codon_info,
         path_clinvar,
-        variant.chr,
-        var_codon_info["genomic_pos"],
-        var_codon_info["intersects_intron_at"],
-    )
-    clinvar_same_codon_aa: pd.DataFrame = clinvar_same_codon.apply(
-        construct_clinvar_prot_change,
-        var_codon_info=var_codon_info,
-        axis=1,
+        path_clinvar_codon_index,
     )
     # Filter out all ClinVar entries with termination codon
     if not clinvar_same_codon_aa.empty:
@@ -101,6 +103,36 @@ def check_clinvar_missense(
     return (ClinVar_same_aa, ClinVar_diff_aa)
 
 
+def get_clinvar_same_codon_aa(
+    variant: VariantInfo,
+    transcript: TranscriptInfo,
+    var_codon_info: dict,
+    path_clinvar: pathlib.Path,
+    path_clinvar_codon_index: Optional[pathlib.Path] = None,
+) -> pd.DataFrame:
+    """
+    Get ClinVar entries in codon of variant with their amino acid change
+    Use precomputed codon index if it was created from the ClinVar file
+    """
+    codon_index = get_covering_codon_index(path_clinvar_codon_index, path_clinvar)
+    if codon_index is not None:
+        return codon_index.get_codon(
+            path_clinvar, transcript.transcript_id, var_codon_info["prot_start"]
+        )
+    clinvar_same_codon = extract_clinvar_entries_missense(
+        path_clinvar,
+        variant.chr,
+        var_codon_info["genomic_pos"],
+        var_codon_info["intersects_intron_at"],
+    )
+    clinvar_same_codon_aa: pd.DataFrame = clinvar_same_codon.apply(
+        construct_clinvar_prot_change,
+        var_codon_info=var_codon_info,
+        axis=1,
+    )
+    return clinvar_same_codon_aa
+
+
 def extract_var_codon_info(
     variant_info: VariantInfo,
     ref_transcript: pyensembl.transcript.Transcript,
@@ -304,17 +336,14 @@ def extract_clinvar_entries_missense(
     """
     Extract matching ClinVar entries for missense variants
     """
-    clinvar = VCF(path_clinvar)
     if not codon_intersects_intron:
-        clinvar_same_codon = clinvar(
-            f"{chrom}:{genomic_positions[0]}-{genomic_positions[2]}"
+        clinvar_same_codon_df = get_clinvar_df(
+            path_clinvar, chrom, genomic_positions[0], genomic_positions[2]
         )
-        clinvar_same_codon_df = convert_vcf_gen_to_df(clinvar_same_codon)
     else:
         clinvar_same_codon_df = pd.DataFrame()
         for position in genomic_positions:
-            clinvar_one_nucleotide = clinvar(f"{chrom}:{position}-{position}")
-            clinvar_df = convert_vcf_gen_to_df(clinvar_one_nucleotide)
+            clinvar_df = get_clinvar_df(path_clinvar, chrom, position, position)
             clinvar_same_codon_df = pd.concat([clinvar_same_codon_df, clinvar_df])
     return clinvar_same_codon_df
 
@@ -393,24 +422,25 @@ def normalize_codon_exonic_pos(
 
     # for coding_range in transcript.coding_sequence_position_ranges:
     codon_intersects_intron_at = -1
-    coding_seq_positions = []
-    for exon in ref_transcript.exons:
-        if transcript_strand == +1:
-            coding_seq_positions.append(
-                [exon.to_dict()["start"], exon.to_dict()["end"]]
-            )
-        else:
-            coding_seq_positions.append(
-                [exon.to_dict()["end"], exon.to_dict()["start"]]
-            )
+    exon_index = get_exon_index(ref_transcript)
+    coding_seq_positions = exon_index.get_exon_offsets(is_genomic=True)
 
     ### ### ### ### ### ### ### ### ### ### ### ### ###
     # find at which exon (or between which two exons) #
     # the codon lies in                               #
+    # only exons containing codon start or end can    #
+    # contain the codon                               #
     ### ### ### ### ### ### ### ### ### ### ### ### ###
+    codon_exon_idxs = sorted(
+        {
+            exon_index.find_exon_genomic(codon_start),
+            exon_index.find_exon_genomic(codon_end),
+        }
+        - {-1}
+    )
     codon_pos_corrected_tmp = []
-    for cod_seq_idx, coding_seq_range in enumerate(coding_seq_positions):
-        coding_seq_start, coding_seq_end = coding_seq_range[0], coding_seq_range[1]
+    for cod_seq_idx in codon_exon_idxs:
+        coding_seq_start, coding_seq_end = coding_seq_positions[cod_seq_idx]
         normalized_exon_interval = range(
             coding_seq_start, coding_seq_end + transcript_strand, transcript_strand
         )
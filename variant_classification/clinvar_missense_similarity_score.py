@@ -2,6 +2,7 @@
 
 import pathlib
 import logging
+from typing import Optional
 from collections.abc import Callable
 
 import pandas as pd
@@ -19,8 +20,7 @@ from clinvar_utils import (
 from custom_exceptions import No_transcript_with_var_type_found
 from clinvar_missense import (
     extract_var_codon_info,
-    extract_clinvar_entries_missense,
-    construct_clinvar_prot_change,
+    get_clinvar_same_codon_aa,
 )
 from similarity_score import (
     get_similarity_score,
@@ -39,6 +39,7 @@ def check_clinvar_missense_similarity(
     path_similarity_score: pathlib.Path,
     direction_similarity_score: str,
     threshold: Threshold,
+    path_clinvar_codon_index: Optional[pathlib.Path] = None,
 ) -> ClinVar:
     """
     Check ClinVar for entries supporting pathogenicity of missense variant
@@ -65,16 +66,12 @@ def check_clinvar_missense_similarity(
     var_codon_info = extract_var_codon_info(
         variant, ref_transcript, affected_transcript
     )
-    clinvar_same_codon = extract_clinvar_entries_missense(
+    clinvar_same_codon_aa = get_clinvar_same_codon_aa(
+        variant,
+        affected_transcript,
+        var_codon_info,
         path_clinvar,
-        variant.chr,
-        var_codon_info["genomic_pos"],
-        var_codon_info["intersects_intron_at"],
-    )
-    clinvar_same_codon_aa: pd.DataFrame = clinvar_same_codon.apply(
-        construct_clinvar_prot_change,
-        var_codon_info=var_codon_info,
-        axis=1,
+        path_clinvar_codon_index,
     )
     # Filter out all ClinVar entries with termination codon
     if not clinvar_same_codon_aa.empty:
@@ -155,5 +152,6 @@ def get_check_clinvar_missense_similarity(
             class_info.SIMILARITY_SCORE_PATH,
             class_info.SIMILARITY_SOCRE_DIRECTION,
             class_info.THRESHOLD_SPLICING_PREDICTION_BENIGN,
+            class_info.CLINVAR_CODON_INDEX_PATH,
         ),
     )
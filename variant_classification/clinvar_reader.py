@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+import logging
+import pathlib
+import threading
+from typing import Generator
+from collections.abc import Iterable
+
+from cyvcf2 import VCF
+
+from resource_registry import resource_registry, get_file_version, resolve_path
+
+logger = logging.getLogger("GenOtoScope_Classify.clinvar_reader")
+
+VCF_COLUMNS = ["chrom", "pos", "id", "ref", "alt", "qual", "filter"]
+CLINVAR_INFO_KEYS = ("CLNSIG", "GENEINFO", "MC", "SpliceAI", "SpliceAI_max")
+
+
+class VCF_Reader_Pool:
+    """
+    Pool of opened VCF files keyed by resolved file path
+    cyvcf2 handles are not thread safe, therefore each thread holds its own handle per file
+    Handles are opened again once modification time or size of the file changed or the path was dropped
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._handles: list[VCF] = []
+        self._generations: dict[str, int] = {}
+
+    def get(self, path: pathlib.Path) -> VCF:
+        """
+        Get handle for VCF file, open it on first access in the current thread and after the file changed
+        """
+        version = get_file_version(path)
+        key = version[0]
+        with self._lock:
+            generation = self._generations.get(key, 0)
+        readers = getattr(self._local, "readers", None)
+        if readers is None:
+            readers = {}
+            self._local.readers = readers
+        entry = readers.get(key)
+        if entry is not None:
+            reader_version, reader_generation, reader = entry
+            if reader_version == version and reader_generation == generation:
+                return reader
+            logger.debug(f"VCF file {key} changed, open it again")
+            self._close_handle(reader)
+        logger.debug(f"Open VCF file {key}")
+        reader = VCF(key)
+        readers[key] = (version, generation, reader)
+        with self._lock:
+            self._handles.append(reader)
+        return reader
+
+    def drop(self, path: pathlib.Path) -> None:
+        """
+        Drop handles of file in all threads, each thread opens the file again on its next access
+        """
+        key = str(resolve_path(path))
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def _close_handle(self, handle: VCF) -> None:
+        with self._lock:
+            self._handles = [
+                other_handle
+                for other_handle in self._handles
+                if other_handle is not handle
+            ]
+        handle.close()
+
+    def close(self) -> None:
+        """
+        Close all handles opened by the pool
+        """
+        with self._lock:
+            for handle in self._handles:
+                handle.close()
+            self._handles = []
+        self._local = threading.local()
+
+
+clinvar_pool = VCF_Reader_Pool()
+
+# ClinVar files replaced on disk are read through new handles
+resource_registry.add_invalidation_listener(lambda kind, path: clinvar_pool.drop(path))
+
+
+def query_clinvar(
+    path_clinvar: pathlib.Path, chrom: str, start: int, end: int
+) -> Generator:
+    """
+    Query ClinVar region using pooled file handle
+    """
+    clinvar = clinvar_pool.get(path_clinvar)
+    return clinvar(f"{chrom}:{start}-{end}")
+
+
+def collect_vcf_records(
+    vcf_generator: Generator, info_keys: Iterable[str] = CLINVAR_INFO_KEYS
+) -> dict[str, list]:
+    """
+    Collect cyvcf records into one list per column in a single pass
+    Only the INFO fields in info_keys are parsed, missing INFO fields are set to None
+    """
+    info_keys = list(info_keys)
+    columns = {name: [] for name in VCF_COLUMNS + info_keys}
+    fixed_columns = [columns[name] for name in VCF_COLUMNS]
+    info_columns = [columns[key] for key in info_keys]
+    for entry in vcf_generator:
+        fields = str(entry).rstrip("\n").split("\t", 8)
+        for column, value in zip(fixed_columns, fields):
+            column.append(value)
+        info = parse_info(fields[7], info_keys)
+        for key, column in zip(info_keys, info_columns):
+            column.append(info.get(key))
+    return columns
+
+
+def parse_info(info: str, info_keys: Iterable[str]) -> dict[str, str]:
+    """
+    Parse requested key value pairs from INFO column of ClinVar.vcf file
+    """
+    info_dict = {}
+    for item in info.split(";"):
+        key, sep, value = item.partition("=")
+        if sep and key in info_keys:
+            info_dict[key] = value
+    return info_dict
@@ -1,17 +1,19 @@
 #!/usr/bin/env python3
 
 import pathlib
+from typing import Optional
 
-from cyvcf2 import VCF
 import pyensembl
-import pandas as pd
 
+from clinvar_lof_index import get_covering_lof_index
 from clinvar_utils import (
     ClinVar,
+    ClinVar_Record,
     ClinVar_Type,
-    convert_vcf_gen_to_df,
-    filter_gene,
-    create_ClinVar,
+    get_clinvar_records,
+    get_clinvar_records_batch,
+    filter_gene_records,
+    create_ClinVar_from_records,
     summarise_ClinVars,
 )
 from variant import VariantInfo
@@ -47,22 +49,11 @@ def check_clinvar_inframe_variant(
     start = variant.genomic_start
     stop = variant.genomic_end
     if start == stop:
-        ClinVar_empty = create_ClinVar(pd.DataFrame(), ClinVar_Type.REGION)
+        ClinVar_empty = create_ClinVar_from_records([], ClinVar_Type.REGION)
         return ClinVar_empty
-    clinvar_region_snv_df = get_clinvar_region_df(
-        variant, start, stop, path_clinvar_snv
+    ClinVar_truncated_region = check_clinvar_lof_region(
+        variant, start, stop, path_clinvar_snv, path_clinvar_indel
     )
-    clinvar_region_indel_df = get_clinvar_region_df(
-        variant, start, stop, path_clinvar_indel
-    )
-    clinvar_region_df = pd.concat([clinvar_region_snv_df, clinvar_region_indel_df])
-    if not clinvar_region_df.empty:
-        clinvar_region_df_lof = filter_lof_variants(clinvar_region_df)
-        ClinVar_truncated_region = create_ClinVar(
-            clinvar_region_df_lof, ClinVar_Type.REGION
-        )
-    else:
-        ClinVar_truncated_region = create_ClinVar(pd.DataFrame(), ClinVar_Type.REGION)
     return ClinVar_truncated_region
 
 
@@ -71,25 +62,20 @@ def check_clinvar_truncated_region(
     ref_transcript: pyensembl.transcript.Transcript,
     path_clinvar_snv: pathlib.Path,
     path_clinvar_indel: pathlib.Path,
+    path_clinvar_lof_index: Optional[pathlib.Path] = None,
 ) -> ClinVar:
     """
     For exonic pvs1 variant coordinate appropriate clinvar entries
     """
     start, stop = define_range_truncation(ref_transcript, variant)
-    clinvar_region_snv_df = get_clinvar_region_df(
-        variant, start, stop, path_clinvar_snv
+    ClinVar_truncated_region = check_clinvar_lof_region(
+        variant,
+        start,
+        stop,
+        path_clinvar_snv,
+        path_clinvar_indel,
+        path_clinvar_lof_index,
     )
-    clinvar_region_indel_df = get_clinvar_region_df(
-        variant, start, stop, path_clinvar_indel
-    )
-    clinvar_region_df = pd.concat([clinvar_region_snv_df, clinvar_region_indel_df])
-    if not clinvar_region_df.empty:
-        clinvar_region_df_lof = filter_lof_variants(clinvar_region_df)
-        ClinVar_truncated_region = create_ClinVar(
-            clinvar_region_df_lof, ClinVar_Type.REGION
-        )
-    else:
-        ClinVar_truncated_region = create_ClinVar(pd.DataFrame(), ClinVar_Type.REGION)
     return ClinVar_truncated_region
 
 
@@ -98,26 +84,22 @@ def check_clinvar_NMD_exon(
     NMD_affected_exons: list[dict],
     path_clinvar_snv: pathlib.Path,
     path_clinvar_indel: pathlib.Path,
+    path_clinvar_lof_index: Optional[pathlib.Path] = None,
 ) -> ClinVar:
     """
     Check if exon contains any pathogenic variants
     """
     if NMD_affected_exons:
-        ClinVar_exons = []
-        for exon in NMD_affected_exons:
-            clinvar_exon_snv_df = get_clinvar_region_df(
-                variant, exon["exon_start"], exon["exon_end"], path_clinvar_snv
-            )
-            clinvar_exon_indel_df = get_clinvar_region_df(
-                variant, exon["exon_start"], exon["exon_end"], path_clinvar_indel
-            )
-            clinvar_exon_df = pd.concat([clinvar_exon_snv_df, clinvar_exon_indel_df])
-            if not clinvar_exon_df.empty:
-                clinvar_exon_df_lof = filter_lof_variants(clinvar_exon_df)
-                ClinVar_exon = create_ClinVar(clinvar_exon_df_lof, ClinVar_Type.REGION)
-            else:
-                ClinVar_exon = create_ClinVar(pd.DataFrame(), ClinVar_Type.REGION)
-            ClinVar_exons.append(ClinVar_exon)
+        intervals = [
+            (exon["exon_start"], exon["exon_end"]) for exon in NMD_affected_exons
+        ]
+        ClinVar_exons = check_clinvar_lof_regions(
+            variant,
+            intervals,
+            path_clinvar_snv,
+            path_clinvar_indel,
+            path_clinvar_lof_index,
+        )
         ClinVar_exon_summary = summarise_ClinVars(
             ClinVar_exons, type=ClinVar_Type.REGION
         )
@@ -129,40 +111,125 @@ def check_clinvar_NMD_exon(
         return ClinVar_exon
 
 
+def check_clinvar_lof_region(
+    variant: VariantInfo,
+    start: int,
+    end: int,
+    path_clinvar_snv: pathlib.Path,
+    path_clinvar_indel: pathlib.Path,
+    path_clinvar_lof_index: Optional[pathlib.Path] = None,
+) -> ClinVar:
+    """
+    Get (likely) pathogenic loss of function ClinVar entries in region
+    Use precomputed loss of function index if available and created from the ClinVar files
+    """
+    lof_index = get_covering_lof_index(
+        path_clinvar_lof_index, path_clinvar_snv, path_clinvar_indel
+    )
+    if lof_index is not None:
+        return lof_index.check_region(variant.chr, variant.gene_name, start, end)
+    clinvar_region_snv = get_clinvar_region_records(
+        variant, start, end, path_clinvar_snv
+    )
+    clinvar_region_indel = get_clinvar_region_records(
+        variant, start, end, path_clinvar_indel
+    )
+    clinvar_region_lof = filter_lof_variants(clinvar_region_snv + clinvar_region_indel)
+    ClinVar_lof_region = create_ClinVar_from_records(
+        clinvar_region_lof, ClinVar_Type.REGION
+    )
+    return ClinVar_lof_region
+
+
+def check_clinvar_lof_regions(
+    variant: VariantInfo,
+    intervals: list[tuple[int, int]],
+    path_clinvar_snv: pathlib.Path,
+    path_clinvar_indel: pathlib.Path,
+    path_clinvar_lof_index: Optional[pathlib.Path] = None,
+) -> list[ClinVar]:
+    """
+    Get (likely) pathogenic loss of function ClinVar entries in each of the regions
+    Without precomputed loss of function index, SNV and indel entries of all regions are fetched with one query each
+    """
+    lof_index = get_covering_lof_index(
+        path_clinvar_lof_index, path_clinvar_snv, path_clinvar_indel
+    )
+    if lof_index is not None:
+        return [
+            lof_index.check_region(variant.chr, variant.gene_name, start, end)
+            for start, end in intervals
+        ]
+    clinvar_regions_snv = get_clinvar_regions_records(
+        variant, intervals, path_clinvar_snv
+    )
+    clinvar_regions_indel = get_clinvar_regions_records(
+        variant, intervals, path_clinvar_indel
+    )
+    return [
+        create_ClinVar_from_records(
+            filter_lof_variants(clinvar_region_snv + clinvar_region_indel),
+            ClinVar_Type.REGION,
+        )
+        for clinvar_region_snv, clinvar_region_indel in zip(
+            clinvar_regions_snv, clinvar_regions_indel
+        )
+    ]
+
+
 def check_clinvar_region(
     variant_info: VariantInfo, start: int, end: int, path_clinvar: pathlib.Path
 ) -> ClinVar:
     """
     Get ClinVar entries in region
     """
-    clinvar_region_filter = get_clinvar_region_df(
+    clinvar_region_filter = get_clinvar_region_records(
         variant_info, start, end, path_clinvar
     )
-    ClinVar_region = create_ClinVar(clinvar_region_filter, ClinVar_Type.REGION)
+    ClinVar_region = create_ClinVar_from_records(
+        clinvar_region_filter, ClinVar_Type.REGION
+    )
     return ClinVar_region
 
 
-def get_clinvar_region_df(
+def get_clinvar_region_records(
     variant_info: VariantInfo, start: int, end: int, path_clinvar: pathlib.Path
-) -> pd.DataFrame:
+) -> list[ClinVar_Record]:
     """
-    Get ClinVar dataframe for region
+    Get ClinVar records for region
     Filtered for gene of interest
     """
-    clinvar = VCF(path_clinvar)
-    clinvar_region = clinvar(f"{variant_info.chr}:{start}-{end}")
-    clinvar_region_df = convert_vcf_gen_to_df(clinvar_region)
-    clinvar_region_filter = filter_gene(clinvar_region_df, variant_info.gene_name)
+    clinvar_region = get_clinvar_records(path_clinvar, variant_info.chr, start, end)
+    clinvar_region_filter = filter_gene_records(clinvar_region, variant_info.gene_name)
     return clinvar_region_filter
 
 
-def filter_lof_variants(clinvar_df: pd.DataFrame) -> pd.DataFrame:
+def get_clinvar_regions_records(
+    variant_info: VariantInfo,
+    intervals: list[tuple[int, int]],
+    path_clinvar: pathlib.Path,
+) -> list[list[ClinVar_Record]]:
+    """
+    Get ClinVar records for each of the regions
+    Filtered for gene of interest
+    """
+    clinvar_regions = get_clinvar_records_batch(
+        path_clinvar, variant_info.chr, intervals
+    )
+    return [
+        filter_gene_records(clinvar_region, variant_info.gene_name)
+        for clinvar_region in clinvar_regions
+    ]
+
+
+def filter_lof_variants(clinvar: list[ClinVar_Record]) -> list[ClinVar_Record]:
     """
     Filter for loss of function variants in MC column
     """
-    drop_na = clinvar_df.dropna(subset=["MC"])
-    lof_variants = drop_na[
-        drop_na.MC.str.contains("frameshift") | drop_na.MC.str.contains("nonsense")
+    lof_variants = [
+        entry
+        for entry in clinvar
+        if entry.MC is not None and ("frameshift" in entry.MC or "nonsense" in entry.MC)
     ]
     return lof_variants
 
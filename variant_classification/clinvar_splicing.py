@@ -3,18 +3,17 @@
 import logging
 import pathlib
 from collections.abc import Iterable
-import pandas as pd
 
 import pyensembl
-from cyvcf2 import VCF
 
 from variant import VariantInfo, TranscriptInfo
 from var_type import VARTYPE_GROUPS
 from clinvar_utils import (
     ClinVar,
     ClinVar_Type,
-    convert_vcf_gen_to_df,
-    create_ClinVar,
+    get_clinvar_records,
+    create_ClinVar_from_records,
+    filter_same_nucleotide_records,
     get_affected_transcript,
 )
 from genotoscope_exon_skipping import (
@@ -38,11 +37,11 @@ def check_clinvar_splicing(
         logger.warning(
             "Variant is not a SNV. PS1/PM5 currently not implemented for delins."
         )
-        ClinVar_same_nucleotide = create_ClinVar(
-            pd.DataFrame(), ClinVar_Type.SAME_NUCLEOTIDE
+        ClinVar_same_nucleotide = create_ClinVar_from_records(
+            [], ClinVar_Type.SAME_NUCLEOTIDE
         )
-        ClinVar_same_splice_site = create_ClinVar(
-            pd.DataFrame(), ClinVar_Type.SAME_SPLICE_SITE
+        ClinVar_same_splice_site = create_ClinVar_from_records(
+            [], ClinVar_Type.SAME_SPLICE_SITE
         )
         return (ClinVar_same_nucleotide, ClinVar_same_splice_site)
     try:
@@ -51,43 +50,34 @@ def check_clinvar_splicing(
         )
     except No_transcript_with_var_type_found:
         logger.warning("No transcript with variant type missense found.")
-        ClinVar_same_nucleotide = create_ClinVar(
-            pd.DataFrame(), ClinVar_Type.SAME_NUCLEOTIDE
+        ClinVar_same_nucleotide = create_ClinVar_from_records(
+            [], ClinVar_Type.SAME_NUCLEOTIDE
         )
-        ClinVar_same_splice_site = create_ClinVar(
-            pd.DataFrame(), ClinVar_Type.SAME_SPLICE_SITE
+        ClinVar_same_splice_site = create_ClinVar_from_records(
+            [], ClinVar_Type.SAME_SPLICE_SITE
         )
         return (ClinVar_same_nucleotide, ClinVar_same_splice_site)
-    clinvar = VCF(path_clinvar)
     ### Check ClinVar for pathogenic variants with same nucleotide change
-    clinvar_same_pos = clinvar(
-        f"{variant.chr}:{variant.genomic_start}-{variant.genomic_end}"
+    clinvar_same_pos = get_clinvar_records(
+        path_clinvar, variant.chr, variant.genomic_start, variant.genomic_end
     )
-    clinvar_same_pos_df = convert_vcf_gen_to_df(clinvar_same_pos)
-    clinvar_not_same_nucleotide = clinvar_same_pos_df[
-        ~(
-            (clinvar_same_pos_df.alt == variant.var_obs)
-            & (clinvar_same_pos_df.pos == str(variant.genomic_start))
-        )
-    ]
-    ClinVar_same_pos = create_ClinVar(
+    clinvar_not_same_nucleotide = filter_same_nucleotide_records(
+        clinvar_same_pos, variant
+    )
+    ClinVar_same_pos = create_ClinVar_from_records(
         clinvar_not_same_nucleotide, ClinVar_Type.SAME_NUCLEOTIDE
     )
     ### Check ClinVar for pathogenic variant in same / closest splice site
     (start_splice_site, end_splice_site) = find_corresponding_splice_site(
         affected_transcript, ref_transcript, variant
     )
-    clinvar_splice_site = clinvar(
-        f"{variant.chr}:{start_splice_site}-{end_splice_site}"
+    clinvar_splice_site = get_clinvar_records(
+        path_clinvar, variant.chr, start_splice_site, end_splice_site
     )
-    clinvar_splice_site_df = convert_vcf_gen_to_df(clinvar_splice_site)
-    clinvar_not_same_nucleotide = clinvar_splice_site_df[
-        ~(
-            (clinvar_splice_site_df.alt == variant.var_obs)
-            & (clinvar_splice_site_df.pos == str(variant.genomic_start))
-        )
-    ]
-    ClinVar_splice_site = create_ClinVar(
+    clinvar_not_same_nucleotide = filter_same_nucleotide_records(
+        clinvar_splice_site, variant
+    )
+    ClinVar_splice_site = create_ClinVar_from_records(
         clinvar_not_same_nucleotide, ClinVar_Type.SAME_SPLICE_SITE
     )
     return (ClinVar_same_pos, ClinVar_splice_site)
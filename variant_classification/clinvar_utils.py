@@ -1,18 +1,22 @@
 #!/usr/bin/env python3
 
+import re
 import logging
+import pathlib
 import pandas as pd
-from typing import Generator, Optional
+from typing import Generator, NamedTuple, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 from collections.abc import Iterable
 
 import pyensembl
 
-from variant import TranscriptInfo
+from variant import VariantInfo, TranscriptInfo
 from var_type import VARTYPE_GROUPS
-from ensembl import ensembl
+from ensembl import get_transcript
 from custom_exceptions import No_transcript_with_var_type_found
+from clinvar_reader import CLINVAR_INFO_KEYS, collect_vcf_records
+from clinvar_index import fetch_clinvar_region, fetch_clinvar_regions
 
 logger = logging.getLogger("GenOtoScope_Classify.genotoscope_clinvar")
 
@@ -41,13 +45,33 @@ class ClinVar:
     associated_ids: list[str] = field(default_factory=list)
 
 
+class ClinVar_Record(NamedTuple):
+    """
+    ClinVar entry with the VCF columns and parsed INFO fields
+    Lightweight alternative to a pd.DataFrame row for the few entries returned by region queries
+    """
+
+    chrom: str
+    pos: str
+    id: str
+    ref: str
+    alt: str
+    qual: str
+    filter: str
+    CLNSIG: Optional[str]
+    GENEINFO: Optional[str]
+    MC: Optional[str]
+    SpliceAI: Optional[str]
+    SpliceAI_max: Optional[str]
+
+
 def get_affected_transcript(
     transcripts: Iterable[TranscriptInfo], var_types: VARTYPE_GROUPS
 ) -> tuple[TranscriptInfo, pyensembl.transcript.Transcript]:
     for transcript in transcripts:
         if any(var_type in transcript.var_type for var_type in var_types.value):
             try:
-                ref_transcript = ensembl.transcript_by_id(transcript.transcript_id)
+                ref_transcript = get_transcript(transcript.transcript_id)
                 ref_transcript.coding_sequence
             except ValueError or AttributeError:
                 continue
@@ -55,64 +79,105 @@ def get_affected_transcript(
     raise No_transcript_with_var_type_found
 
 
-def convert_vcf_gen_to_df(vcf_generator: Generator) -> pd.DataFrame:
+def convert_vcf_gen_to_df(
+    vcf_generator: Generator, info_keys: Iterable[str] = CLINVAR_INFO_KEYS
+) -> pd.DataFrame:
     """
     Covnerts cyvcf generator into a pd.DataFrame
     """
-    names = ["chrom", "pos", "id", "ref", "alt", "qual", "filter", "info"]
-    df = pd.DataFrame(columns=names)
-    for entry in vcf_generator:
-        clinvar_split_str = str(entry).split("\t")
-        clinvar_dict = dict(zip(names, clinvar_split_str))
-        df = pd.concat([df, pd.DataFrame([clinvar_dict])], axis=0, ignore_index=True)
-    df_format_info = format_info(df)
-    return df_format_info
+    columns = collect_vcf_records(vcf_generator, info_keys)
+    return pd.DataFrame(columns, dtype=object)
+
+
+def get_clinvar_df(
+    path_clinvar: pathlib.Path, chrom: str, start: int, end: int
+) -> pd.DataFrame:
+    """
+    Get ClinVar entries in region as pd.DataFrame
+    """
+    columns = fetch_clinvar_region(path_clinvar, chrom, start, end)
+    return pd.DataFrame(columns, dtype=object)
 
 
-def format_info(data: pd.DataFrame) -> pd.DataFrame:
+def get_clinvar_records(
+    path_clinvar: pathlib.Path, chrom: str, start: int, end: int
+) -> list[ClinVar_Record]:
     """
-    Format the info column from ClinVar.vcf file as depicted in cyvcf
+    Get ClinVar entries in region as ClinVar_Record
     """
-    info = data["info"]
-    info_split = [entry.split("=") for entry in info]
-    info_split = [entry.split("\n")[0].split(";") for entry in info]
-    processed_info = [[item.split("=") for item in entry] for entry in info_split]
-    dict_info = [
-        {item[0]: item[1] for item in entry if len(item) > 1}
-        for entry in processed_info
+    columns = fetch_clinvar_region(path_clinvar, chrom, start, end)
+    return [
+        ClinVar_Record._make(values)
+        for values in zip(*(columns[name] for name in ClinVar_Record._fields))
+    ]
+
+
+def get_clinvar_records_batch(
+    path_clinvar: pathlib.Path, chrom: str, intervals: list[tuple[int, int]]
+) -> list[list[ClinVar_Record]]:
+    """
+    Get ClinVar entries in each of the regions as ClinVar_Record
+    """
+    return [
+        [
+            ClinVar_Record._make(values)
+            for values in zip(*(columns[name] for name in ClinVar_Record._fields))
+        ]
+        for columns in fetch_clinvar_regions(path_clinvar, chrom, intervals)
     ]
-    return pd.concat([data, pd.DataFrame(dict_info)], axis=1)
 
 
 def create_ClinVar(clinvar: pd.DataFrame, type: ClinVar_Type) -> ClinVar:
     """
     From clinvar entries, get highest classification and IDs of ClinVar entries with that classification
     """
-    is_pathogenic = False
-    highest_classification = None
-    clinvar_ids = []
-    clinvar_associated_ids = []
-    if not clinvar.empty:
-        if any(clinvar.CLNSIG == "Pathogenic"):
-            is_pathogenic = True
-            highest_classification = ClinVar_Status.PATHOGENIC
-            clinvar_ids = list(clinvar[clinvar.CLNSIG == "Pathogenic"].id)
-            clinvar_associated_ids = list(
-                clinvar[clinvar.CLNSIG.str.contains("Likely_pathogenic")].id
-            )
-        elif any(clinvar.CLNSIG == "Likely_pathogenic") or any(
-            clinvar.CLNSIG == "Pathogenic/Likely_pathogenic"
-        ):
-            is_pathogenic = True
-            highest_classification = ClinVar_Status.LIKELY_PATHOGENIC
-            clinvar_ids = list(
-                clinvar[clinvar.CLNSIG.str.contains("Likely_pathogenic")].id
-            )
-    return ClinVar(
-        is_pathogenic, type, highest_classification, clinvar_ids, clinvar_associated_ids
+    if clinvar.empty:
+        return select_highest_classification([], [], type)
+    return select_highest_classification(list(clinvar.CLNSIG), list(clinvar.id), type)
+
+
+def create_ClinVar_from_records(
+    clinvar: Iterable[ClinVar_Record], type: ClinVar_Type
+) -> ClinVar:
+    """
+    From clinvar records, get highest classification and IDs of ClinVar entries with that classification
+    """
+    clinvar = list(clinvar)
+    return select_highest_classification(
+        [entry.CLNSIG for entry in clinvar], [entry.id for entry in clinvar], type
     )
 
 
+def select_highest_classification(
+    clnsigs: list[Optional[str]], ids: list[str], type: ClinVar_Type
+) -> ClinVar:
+    """
+    Get highest classification and IDs of ClinVar entries with that classification
+    """
+    pathogenic_ids = [id for clnsig, id in zip(clnsigs, ids) if clnsig == "Pathogenic"]
+    likely_pathogenic_ids = [
+        id
+        for clnsig, id in zip(clnsigs, ids)
+        if clnsig is not None and "Likely_pathogenic" in clnsig
+    ]
+    if pathogenic_ids:
+        return ClinVar(
+            True,
+            type,
+            ClinVar_Status.PATHOGENIC,
+            pathogenic_ids,
+            likely_pathogenic_ids,
+        )
+    elif any(
+        clnsig in ("Likely_pathogenic", "Pathogenic/Likely_pathogenic")
+        for clnsig in clnsigs
+    ):
+        return ClinVar(
+            True, type, ClinVar_Status.LIKELY_PATHOGENIC, likely_pathogenic_ids, []
+        )
+    return ClinVar(False, type, None, [], [])
+
+
 def filter_gene(clinvar: pd.DataFrame, gene: str) -> pd.DataFrame:
     """
     Filter out ClinVar entries that don't contain gene in GENEINFO
@@ -121,6 +186,35 @@ def filter_gene(clinvar: pd.DataFrame, gene: str) -> pd.DataFrame:
     return clinvar_filtered
 
 
+def filter_gene_records(
+    clinvar: Iterable[ClinVar_Record], gene: str
+) -> list[ClinVar_Record]:
+    """
+    Filter out ClinVar records that don't contain gene in GENEINFO
+    """
+    gene_pattern = re.compile(gene)
+    return [
+        entry
+        for entry in clinvar
+        if entry.GENEINFO is not None and gene_pattern.search(entry.GENEINFO)
+    ]
+
+
+def filter_same_nucleotide_records(
+    clinvar: Iterable[ClinVar_Record], variant: VariantInfo
+) -> list[ClinVar_Record]:
+    """
+    Filter out ClinVar records with the same nucleotide change as the variant
+    """
+    return [
+        entry
+        for entry in clinvar
+        if not (
+            entry.alt == variant.var_obs and entry.pos == str(variant.genomic_start)
+        )
+    ]
+
+
 def summarise_ClinVars(clinvars: list[ClinVar], type: ClinVar_Type) -> ClinVar:
     """
     Summarise a list of ClinVars into one ClinVar object
@@ -1,5 +1,189 @@
 #!/usr/bin/env python3
 
+import sys
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+
 import pyensembl
+from memoized_property import memoized_property
+
+logger = logging.getLogger("GenOtoScope_Classify.ensembl")
 
 ensembl = pyensembl.EnsemblRelease(110)
+
+TRANSCRIPT_CACHE_SIZE = 512
+TRANSCRIPT_CACHE_MEMORY = 256 * 1024 * 1024
+
+# Sources that are asked for transcripts before Ensembl, e.g. transcript snapshots
+transcript_sources: list[Callable] = []
+
+
+class Transcript_Model(pyensembl.transcript.Transcript):
+    """
+    pyensembl Transcript that keeps its exons and spliced offsets once loaded
+    Sequences and codon positions are memoized by pyensembl on the object itself
+    """
+
+    @memoized_property
+    def exons(self):
+        return pyensembl.transcript.Transcript.exons.fget(self)
+
+    def spliced_offset(self, position: int) -> int:
+        spliced_offsets = self.__dict__.setdefault("_spliced_offsets", {})
+        if position not in spliced_offsets:
+            spliced_offsets[position] = super().spliced_offset(position)
+        return spliced_offsets[position]
+
+    @classmethod
+    def from_transcript(cls, transcript: pyensembl.transcript.Transcript):
+        return cls(
+            transcript_id=transcript.transcript_id,
+            transcript_name=transcript.transcript_name,
+            contig=transcript.contig,
+            start=transcript.start,
+            end=transcript.end,
+            strand=transcript.strand,
+            biotype=transcript.biotype,
+            gene_id=transcript.gene_id,
+            genome=transcript.genome,
+            support_level=transcript.support_level,
+        )
+
+
+def load_transcript_model(transcript_id: str) -> pyensembl.transcript.Transcript:
+    """
+    Load transcript from first transcript source containing it, fall back to Ensembl
+    """
+    for source in transcript_sources:
+        transcript = source(transcript_id)
+        if transcript is not None:
+            return transcript
+    return Transcript_Model.from_transcript(ensembl.transcript_by_id(transcript_id))
+
+
+def get_memory_usage(transcript: pyensembl.transcript.Transcript) -> int:
+    """
+    Approximate memory used by values loaded for transcript in bytes
+    """
+    memory = sys.getsizeof(transcript)
+    for value in vars(transcript).values():
+        if isinstance(value, (list, dict)):
+            memory += sys.getsizeof(value) + 64 * len(value)
+        else:
+            memory += sys.getsizeof(value)
+    return memory
+
+
+class Transcript_Cache:
+    """
+    Per process cache of transcript models keyed by transcript ID
+    Least recently used transcripts are evicted once the number of transcripts or their memory exceeds the limits
+    """
+
+    def __init__(
+        self,
+        max_transcripts: int = TRANSCRIPT_CACHE_SIZE,
+        max_memory: int = TRANSCRIPT_CACHE_MEMORY,
+        load: Callable[[str], pyensembl.transcript.Transcript] = load_transcript_model,
+    ):
+        self.max_transcripts = max_transcripts
+        self.max_memory = max_memory
+        self.load = load
+        self.hits = 0
+        self.misses = 0
+        self._transcripts: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, transcript_id: str) -> pyensembl.transcript.Transcript:
+        """
+        Get transcript model, load it from Ensembl on first access
+        """
+        with self._lock:
+            if transcript_id in self._transcripts:
+                self._transcripts.move_to_end(transcript_id)
+                self.hits += 1
+                return self._transcripts[transcript_id]
+            self.misses += 1
+        transcript = self.load(transcript_id)
+        with self._lock:
+            self._transcripts[transcript_id] = transcript
+            self._evict()
+        return transcript
+
+    def evict(self, transcript_id: str) -> None:
+        """
+        Remove transcript from cache
+        """
+        with self._lock:
+            self._transcripts.pop(transcript_id, None)
+
+    def clear(self) -> None:
+        """
+        Remove all transcripts and reset counters
+        """
+        with self._lock:
+            self._transcripts.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def memory_usage(self) -> int:
+        """
+        Approximate memory used by cached transcripts in bytes
+        Sequences loaded lazily after caching are included
+        """
+        with self._lock:
+            transcripts = list(self._transcripts.values())
+        return sum(get_memory_usage(transcript) for transcript in transcripts)
+
+    def info(self) -> dict[str, int]:
+        """
+        Get number of hits, misses, cached transcripts and their memory usage
+        """
+        memory = self.memory_usage()
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._transcripts),
+                "memory": memory,
+            }
+
+    def _evict(self) -> None:
+        """
+        Evict least recently used transcripts until cache is within its limits
+        The most recently used transcript is always kept
+        """
+        while len(self._transcripts) > self.max_transcripts:
+            self._transcripts.popitem(last=False)
+        memory = sum(
+            get_memory_usage(transcript) for transcript in self._transcripts.values()
+        )
+        while memory > self.max_memory and len(self._transcripts) > 1:
+            _, transcript = self._transcripts.popitem(last=False)
+            memory -= get_memory_usage(transcript)
+
+
+transcript_cache = Transcript_Cache()
+
+
+def get_transcript(transcript_id: str) -> pyensembl.transcript.Transcript:
+    """
+    Get transcript from per process transcript cache
+    """
+    return transcript_cache.get(transcript_id)
+
+
+def clear_ensembl_cache() -> None:
+    """
+    Clear gene, transcript and exon objects and query results memoized by pyensembl to bound memory usage between classifications
+    The database connection, loaded sequences and transcripts in the transcript cache are kept
+    """
+    ensembl._genes.clear()
+    ensembl._transcripts.clear()
+    ensembl._exons.clear()
+    database = ensembl._db
+    if database is not None:
+        type(database).query.clear_cache(database)
+        type(database).query_feature_values.clear_cache(database)
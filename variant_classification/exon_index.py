@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+import logging
+from bisect import bisect_right
+from typing import Optional
+
+import pyensembl
+
+from transcript_cache import get_transcript_cached
+
+logger = logging.getLogger("GenOtoScope_Classify.exon_index")
+
+
+class Exon_Index:
+    """
+    Precomputed exon coordinates of a transcript
+    Exons are stored in transcript order, genomic offsets follow the strand direction (start > end on negative strand)
+    cDNA offsets are 1-based and cumulative over all exons
+    Position lookups are bisect searches over the sorted exon boundaries
+    Returned offsets are shared and must not be modified
+    """
+
+    def __init__(self, transcript: pyensembl.transcript.Transcript):
+        exons = transcript.exons
+        self.strand = +1 if exons[0].strand == "+" else -1
+        self.genomic_offsets = []
+        self.cdna_offsets = []
+        end = 0
+        for exon in exons:
+            if self.strand == +1:
+                self.genomic_offsets.append([exon.start, exon.end])
+            else:
+                self.genomic_offsets.append([exon.end, exon.start])
+            start = end + 1
+            end = start + exon.end - exon.start
+            self.cdna_offsets.append([start, end])
+        genomic_order = sorted(range(len(exons)), key=lambda idx: exons[idx].start)
+        self._genomic_idx = genomic_order
+        self._genomic_starts = [exons[idx].start for idx in genomic_order]
+        self._genomic_ends = [exons[idx].end for idx in genomic_order]
+        self._cdna_starts = [offset[0] for offset in self.cdna_offsets]
+        self._transcript = transcript
+        self._coding_starts: Optional[list[int]] = None
+        self._coding_ends: Optional[list[int]] = None
+
+    def get_exon_offsets(self, is_genomic: bool) -> list[list[int]]:
+        """
+        Get start and end of all exons as genomic or cDNA offsets
+        """
+        if is_genomic:
+            return self.genomic_offsets
+        return self.cdna_offsets
+
+    def find_exon_genomic(self, genomic_pos: int) -> int:
+        """
+        Get index (0-based, transcript order) of exon containing genomic position, -1 if position is not exonic
+        """
+        sorted_idx = bisect_right(self._genomic_starts, genomic_pos) - 1
+        if sorted_idx >= 0 and genomic_pos <= self._genomic_ends[sorted_idx]:
+            return self._genomic_idx[sorted_idx]
+        return -1
+
+    def find_exon_cdna(self, cdna_pos: int) -> int:
+        """
+        Get index (0-based) of exon containing cDNA position, -1 if position is outside of the transcript
+        """
+        exon_idx = bisect_right(self._cdna_starts, cdna_pos) - 1
+        if exon_idx >= 0 and cdna_pos <= self.cdna_offsets[exon_idx][1]:
+            return exon_idx
+        return -1
+
+    def find_exon(self, pos: int, is_genomic: bool) -> tuple[int, int]:
+        """
+        Get index (0-based) of exon containing position and offset of position in this exon
+        Return (-1, -1) if no exon contains the position
+        """
+        if is_genomic:
+            exon_idx = self.find_exon_genomic(pos)
+        else:
+            exon_idx = self.find_exon_cdna(pos)
+        if exon_idx == -1:
+            return (-1, -1)
+        exon_start = self.get_exon_offsets(is_genomic)[exon_idx][0]
+        return (exon_idx, abs(pos - exon_start))
+
+    def is_in_coding_exon(self, genomic_pos: int) -> bool:
+        """
+        Check if genomic position is contained in coding exon
+        Coding intervals are extended by one position in strand direction and the last coding interval ends at the stop codon
+        """
+        if self._coding_starts is None:
+            self._create_coding_intervals()
+        interval_idx = bisect_right(self._coding_starts, genomic_pos) - 1
+        return interval_idx >= 0 and genomic_pos <= self._coding_ends[interval_idx]
+
+    def _create_coding_intervals(self) -> None:
+        """
+        Create sorted and merged coding intervals, coding sequence ranges are only loaded on first use
+        """
+        transcript = self._transcript
+        coding_ranges = transcript.coding_sequence_position_ranges
+        intervals = []
+        for coding_idx, coding_range in enumerate(coding_ranges):
+            is_last = coding_idx + 1 == len(coding_ranges)
+            if self.strand == +1:
+                end = (
+                    transcript.stop_codon_positions[-1] if is_last else coding_range[1]
+                )
+                intervals.append((coding_range[0], end + 1))
+            else:
+                end = transcript.stop_codon_positions[0] if is_last else coding_range[0]
+                intervals.append((end - 1, coding_range[1]))
+        starts, ends = [], []
+        for start, end in sorted(
+            interval for interval in intervals if interval[0] <= interval[1]
+        ):
+            if ends and start <= ends[-1] + 1:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        self._coding_starts = starts
+        self._coding_ends = ends
+
+
+def get_exon_index(transcript: pyensembl.transcript.Transcript) -> Exon_Index:
+    """
+    Get exon index of transcript, the index is created on first use and kept on the transcript object
+    """
+    return get_transcript_cached(transcript, "exon_index", Exon_Index)
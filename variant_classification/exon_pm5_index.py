@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+import pathlib
+import logging
+from bisect import bisect_right
+from typing import NamedTuple, Optional
+
+import pandas as pd
+
+from resource_registry import resource_registry
+
+logger = logging.getLogger("GenOtoScope_Classify.exon_pm5_index")
+
+# Evidence strengths in PM5 exon tables from strongest to weakest
+PM5_EVIDENCE_STRENGTHS = ["very_strong", "strong", "moderate", "supporting"]
+
+
+class Exon_PM5_Entry(NamedTuple):
+    """
+    PM5 classification of PTC in region
+    """
+
+    rule_status: bool
+    evidence_strength: str
+    comment: str
+
+
+class Exon_PM5_Index:
+    """
+    PM5 classifications of PTC positions in PM5 exon table
+    The table is split into segments at the start and after the end of each region
+    The entry with strongest evidence of the regions covering a segment is resolved on first query of the segment
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        exon_pm5 = pd.read_csv(path, sep="\t")
+        entries = [
+            (int(start), int(end), Exon_PM5_Entry(bool(rule_status), strength, comment))
+            for start, end, rule_status, strength, comment in zip(
+                exon_pm5.start,
+                exon_pm5.end,
+                exon_pm5.rule_status,
+                exon_pm5.evidence_strength,
+                exon_pm5.comment,
+            )
+        ]
+        self.bounds = sorted(
+            {start for start, _, _ in entries} | {end + 1 for _, end, _ in entries}
+        )
+        self.covering_entries: list[list[Exon_PM5_Entry]] = [
+            [entry for start, end, entry in entries if start <= segment_start <= end]
+            for segment_start in self.bounds[:-1]
+        ]
+        self.segments: dict[int, Optional[Exon_PM5_Entry]] = {}
+
+    def get_entry(self, ptc: int) -> Optional[Exon_PM5_Entry]:
+        """
+        Get PM5 classification of PTC, None if PTC is not in any region of the table
+        Raise ValueError if the evidence strengths of the regions covering the PTC do not match
+        """
+        idx = bisect_right(self.bounds, ptc) - 1
+        if idx < 0 or idx >= len(self.covering_entries):
+            return None
+        if idx not in self.segments:
+            self.segments[idx] = select_entry_with_strongest_evidence(
+                self.covering_entries[idx]
+            )
+        return self.segments[idx]
+
+
+def select_entry_with_strongest_evidence(
+    entries: list[Exon_PM5_Entry],
+) -> Optional[Exon_PM5_Entry]:
+    """
+    From entries select entry with strongest evidence strength
+    In case several entries have the strongest evidence strength, return the first with the comments of all of them joined
+    """
+    if len(entries) <= 1:
+        return entries[0] if entries else None
+    for strength in PM5_EVIDENCE_STRENGTHS:
+        strongest_entries = [
+            entry for entry in entries if entry.evidence_strength == strength
+        ]
+        if len(strongest_entries) == 1:
+            return strongest_entries[0]
+        elif len(strongest_entries) > 1:
+            comment = "".join(" " + entry.comment for entry in strongest_entries)
+            return strongest_entries[0]._replace(comment=comment)
+    raise ValueError(f"The evidence strength does not match.")
+
+
+def get_exon_pm5_index(path: pathlib.Path) -> Exon_PM5_Index:
+    """
+    Get index of PM5 exon table, load it on first access
+    """
+    return resource_registry.get("exon_pm5", path, Exon_PM5_Index)
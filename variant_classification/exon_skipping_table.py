@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+
+import pathlib
+import logging
+from dataclasses import dataclass
+from collections.abc import Callable
+from typing import Optional
+
+import pyensembl
+
+from variant import VariantInfo, TranscriptInfo
+from genotoscope_exon_skipping import assess_exon_skipping, get_splice_site
+from genotoscope_construct_variant_sequence import (
+    construct_variant_coding_seq_intronic_variant,
+)
+from genotoscope_assess_NMD import assess_NMD_intronic_variant, get_affected_exon
+from genotoscope_reading_frame_preservation import assess_reading_frame_preservation
+from genotoscope_protein_len_diff import calculate_prot_len_diff
+from genotoscope_protein_len_diff_repetitive_region import (
+    check_prot_len_change_in_repetitive_region_exon,
+)
+from variant_in_critical_region import check_variant_in_critical_region_exon
+from clinvar_region import check_clinvar_NMD_exon
+from check_exon_disease_relevant import check_exon_disease_relevant
+from transcript_cache import get_transcript_cached
+from resource_registry import get_file_version
+from lru_cache import LRU_Cache
+
+logger = logging.getLogger("GenOtoScope_Classify.exon_skipping_table")
+
+# Consequences and region verdicts kept per transcript, verdicts of outdated annotation files are evicted first
+EXON_SKIPPING_TABLE_SIZE = 256
+
+
+@dataclass
+class Exon_Skipping_Consequence:
+    """
+    Consequence of splice variant on the transcript
+    For splice variants on the splice sites +/- 1,2 it only depends on the skipped exon
+    """
+
+    exons_skipped: list[int]
+    are_exons_skipped: bool
+    start_codon_exon_skipped: bool
+    stop_codon_exon_skipped: bool
+    coding_exon_skipped: bool
+    diff_len: int
+    diff_len_protein_percent: float
+    ptc: int
+    is_reading_frame_preserved: bool
+    is_NMD: bool
+    NMD_affected_exons: list[dict]
+    affected_exon: dict
+
+
+@dataclass
+class Exon_Skipping_Region_Verdict:
+    """
+    Disease relevance of the region affected by splice variant
+    """
+
+    is_truncated_region_disease_relevant: bool
+    comment_truncated_region: str
+    is_affected_exon_disease_relevant: bool
+    len_change_in_repetitive_region: bool
+
+
+class Exon_Skipping_Table:
+    """
+    Consequences and region verdicts of skipping each exon of a transcript, filled on first use
+    Least recently used entries are evicted once more than maxsize consequences or verdicts are stored
+    Consequences are keyed by skipped exons, region verdicts additionally by path, modification time and size of the annotation files
+    Stored consequences and verdicts are shared and must not be modified
+    """
+
+    def __init__(self, maxsize: int = EXON_SKIPPING_TABLE_SIZE):
+        self.consequences = LRU_Cache(maxsize)
+        self.region_verdicts = LRU_Cache(maxsize)
+
+    def get_consequence(
+        self,
+        exons_skipped: tuple[int, ...],
+        assess: Callable[[], Exon_Skipping_Consequence],
+    ) -> Exon_Skipping_Consequence:
+        return self.consequences.get(exons_skipped, assess)
+
+    def get_region_verdict(
+        self,
+        key: tuple,
+        assess: Callable[[], Exon_Skipping_Region_Verdict],
+    ) -> Exon_Skipping_Region_Verdict:
+        return self.region_verdicts.get(key, assess)
+
+
+def get_exon_skipping_table(
+    transcript: pyensembl.transcript.Transcript,
+) -> Exon_Skipping_Table:
+    """
+    Get exon skipping table of transcript, the table is created on first use and kept on the transcript object
+    """
+    return get_transcript_cached(
+        transcript, "exon_skipping_table", lambda _: Exon_Skipping_Table()
+    )
+
+
+def get_exon_skipping_consequence(
+    transcript: TranscriptInfo,
+    variant: VariantInfo,
+    ref_transcript: pyensembl.transcript.Transcript,
+) -> Exon_Skipping_Consequence:
+    """
+    Get consequence of splice variant, look up consequence in exon skipping table for variants on the splice sites +/- 1,2
+    """
+    exon_skipping = assess_exon_skipping(transcript, variant, ref_transcript)
+    if get_splice_site(transcript) is None:
+        return assess_exon_skipping_consequence(
+            transcript, variant, ref_transcript, exon_skipping
+        )
+    return get_exon_skipping_table(ref_transcript).get_consequence(
+        tuple(exon_skipping[0]),
+        lambda: assess_exon_skipping_consequence(
+            transcript, variant, ref_transcript, exon_skipping
+        ),
+    )
+
+
+def assess_exon_skipping_consequence(
+    transcript: TranscriptInfo,
+    variant: VariantInfo,
+    ref_transcript: pyensembl.transcript.Transcript,
+    exon_skipping: tuple,
+) -> Exon_Skipping_Consequence:
+    """
+    Assess consequence of splice variant from observed coding sequence
+    """
+    (
+        exons_skipped,
+        are_exons_skipped,
+        skipped_exon_start,
+        skipped_exon_end,
+        start_codon_exon_skipped,
+        stop_codon_exon_skipped,
+        coding_exon_skipped,
+    ) = exon_skipping
+    var_seq, diff_len = construct_variant_coding_seq_intronic_variant(
+        transcript,
+        variant,
+        ref_transcript,
+        skipped_exon_start,
+        skipped_exon_end,
+        are_exons_skipped,
+        start_codon_exon_skipped,
+        stop_codon_exon_skipped,
+        coding_exon_skipped,
+    )
+    diff_len_protein_percent, ptc = calculate_prot_len_diff(
+        ref_transcript, var_seq, diff_len
+    )
+    is_NMD, NMD_affected_exons = assess_NMD_intronic_variant(
+        transcript,
+        variant,
+        ref_transcript,
+        are_exons_skipped,
+        exons_skipped,
+        start_codon_exon_skipped,
+        stop_codon_exon_skipped,
+        coding_exon_skipped,
+        var_seq,
+        diff_len,
+    )
+    if not NMD_affected_exons:
+        affected_exon = get_affected_exon(
+            ref_transcript, transcript, variant, diff_len
+        )[0]
+    else:
+        affected_exon = NMD_affected_exons[0]
+    is_reading_frame_preserved, _ = assess_reading_frame_preservation(diff_len)
+    return Exon_Skipping_Consequence(
+        exons_skipped=exons_skipped,
+        are_exons_skipped=are_exons_skipped,
+        start_codon_exon_skipped=start_codon_exon_skipped,
+        stop_codon_exon_skipped=stop_codon_exon_skipped,
+        coding_exon_skipped=coding_exon_skipped,
+        diff_len=diff_len,
+        diff_len_protein_percent=diff_len_protein_percent,
+        ptc=ptc,
+        is_reading_frame_preserved=is_reading_frame_preserved,
+        is_NMD=is_NMD,
+        NMD_affected_exons=NMD_affected_exons,
+        affected_exon=affected_exon,
+    )
+
+
+def get_exon_skipping_region_verdict(
+    transcript: TranscriptInfo,
+    variant: VariantInfo,
+    ref_transcript: pyensembl.transcript.Transcript,
+    consequence: Exon_Skipping_Consequence,
+    path_clinvar_snv: pathlib.Path,
+    path_clinvar_indel: pathlib.Path,
+    path_clinvar_lof_index: Optional[pathlib.Path],
+    path_uniprot_rep: pathlib.Path,
+    path_disease_irrelevant_exons: Optional[pathlib.Path],
+    path_critical_region: Optional[pathlib.Path],
+) -> Exon_Skipping_Region_Verdict:
+    """
+    Get region verdict of splice variant, look up verdict in exon skipping table for variants on the splice sites +/- 1,2
+    """
+    paths = (
+        path_clinvar_snv,
+        path_clinvar_indel,
+        path_clinvar_lof_index,
+        path_uniprot_rep,
+        path_disease_irrelevant_exons,
+        path_critical_region,
+    )
+    if get_splice_site(transcript) is None:
+        return assess_exon_skipping_region_verdict(
+            variant, ref_transcript, consequence, *paths
+        )
+    # Verdicts are keyed by the versions of the annotation files, so that they are assessed again after a file changed
+    key = (tuple(consequence.exons_skipped),) + tuple(
+        get_file_version(path) for path in paths
+    )
+    return get_exon_skipping_table(ref_transcript).get_region_verdict(
+        key,
+        lambda: assess_exon_skipping_region_verdict(
+            variant, ref_transcript, consequence, *paths
+        ),
+    )
+
+
+def assess_exon_skipping_region_verdict(
+    variant: VariantInfo,
+    ref_transcript: pyensembl.transcript.Transcript,
+    consequence: Exon_Skipping_Consequence,
+    path_clinvar_snv: pathlib.Path,
+    path_clinvar_indel: pathlib.Path,
+    path_clinvar_lof_index: Optional[pathlib.Path],
+    path_uniprot_rep: pathlib.Path,
+    path_disease_irrelevant_exons: Optional[pathlib.Path],
+    path_critical_region: Optional[pathlib.Path],
+) -> Exon_Skipping_Region_Verdict:
+    """
+    Assess disease relevance of region affected by splice variant using critical regions or ClinVar
+    """
+    NMD_affected_exons = consequence.NMD_affected_exons
+    if path_critical_region is not None:
+        (
+            is_truncated_region_disease_relevant,
+            comment_truncated_region_disease_relevant,
+        ) = check_variant_in_critical_region_exon(
+            variant,
+            ref_transcript,
+            NMD_affected_exons,
+            path_critical_region,
+        )
+    else:
+        skipped_exon_ClinVar = check_clinvar_NMD_exon(
+            variant,
+            NMD_affected_exons,
+            path_clinvar_snv,
+            path_clinvar_indel,
+            path_clinvar_lof_index,
+        )
+        is_truncated_region_disease_relevant = skipped_exon_ClinVar.pathogenic
+        comment_truncated_region_disease_relevant = f"The following relevant ClinVar are (likely) pathogenic: {skipped_exon_ClinVar.ids}"
+    if consequence.is_NMD and path_disease_irrelevant_exons is not None:
+        is_affected_exon_disease_relevant = check_exon_disease_relevant(
+            path_disease_irrelevant_exons, NMD_affected_exons
+        )
+    else:
+        is_affected_exon_disease_relevant = True
+    if consequence.diff_len != 0:
+        len_change_in_repetitive_region = (
+            check_prot_len_change_in_repetitive_region_exon(
+                variant, ref_transcript, NMD_affected_exons, path_uniprot_rep
+            )
+        )
+    else:
+        len_change_in_repetitive_region = False
+    return Exon_Skipping_Region_Verdict(
+        is_truncated_region_disease_relevant=is_truncated_region_disease_relevant,
+        comment_truncated_region=comment_truncated_region_disease_relevant,
+        is_affected_exon_disease_relevant=is_affected_exon_disease_relevant,
+        len_change_in_repetitive_region=len_change_in_repetitive_region,
+    )
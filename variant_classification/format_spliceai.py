@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 
 import re
+from typing import Any, Optional
+from collections.abc import Iterable
 
 import pandas as pd
 
 
 def format_spliceai(df: pd.DataFrame) -> pd.DataFrame:
+    if "SpliceAI_max" in df.columns:
+        return format_spliceai_precomputed(df)
     df_nonan = df.dropna(subset=["SpliceAI"])
     df_nonan.SpliceAI = df_nonan.SpliceAI.str.replace("&", ",")
     two_spliceai = df_nonan[df_nonan.SpliceAI.str.contains(",", na=False)]
@@ -22,6 +26,23 @@ def format_spliceai(df: pd.DataFrame) -> pd.DataFrame:
     return df_spliceai_max
 
 
+def format_spliceai_precomputed(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Use SpliceAI_max precomputed by install_dependencies/data_add_spliceai_max.py
+    Missing value "." marks entries without usable SpliceAI score
+    Entries of files without precomputed score are formatted from the SpliceAI column
+    """
+    is_precomputed = df.SpliceAI_max.notna()
+    df_precomputed = df[is_precomputed]
+    df_precomputed = df_precomputed.assign(
+        SpliceAI_max=pd.to_numeric(df_precomputed.SpliceAI_max, errors="coerce")
+    ).dropna(subset=["SpliceAI_max"])
+    df_missing = df[~is_precomputed].drop(columns="SpliceAI_max")
+    if "SpliceAI" not in df_missing.columns or df_missing.SpliceAI.isna().all():
+        return df_precomputed
+    return pd.concat([df_precomputed, format_spliceai(df_missing)])
+
+
 def format_spliceai_singel(df: pd.DataFrame) -> pd.DataFrame:
     """
     Format SpliceAI entry for a single splice site observation
@@ -64,3 +85,60 @@ def format_spliceai_multiple(df: pd.DataFrame) -> pd.DataFrame:
             global_max = max(local_max)
             df.loc[i, ["SpliceAI_max"]] = global_max
     return df
+
+
+def format_spliceai_records(records: Iterable[Any]) -> list[tuple[Any, float]]:
+    """
+    Get maximum SpliceAI score for ClinVar records with SpliceAI and SpliceAI_max field
+    Records without usable SpliceAI score are discarded, same as in format_spliceai
+    """
+    precomputed = []
+    one_spliceai = []
+    two_spliceai = []
+    for record in records:
+        if record.SpliceAI_max is not None:
+            try:
+                precomputed.append((record, float(record.SpliceAI_max)))
+            except ValueError:
+                continue
+        else:
+            spliceai_max = get_spliceai_max(record.SpliceAI)
+            if spliceai_max is None:
+                continue
+            elif "," in record.SpliceAI.replace("&", ","):
+                two_spliceai.append((record, spliceai_max))
+            else:
+                one_spliceai.append((record, spliceai_max))
+    return precomputed + one_spliceai + two_spliceai
+
+
+def get_spliceai_max(spliceai: Optional[str]) -> Optional[float]:
+    """
+    Get maximum SpliceAI score of SpliceAI field as computed by format_spliceai
+    Returns None for entries that format_spliceai discards
+    Entries with multiple SpliceAI predictions without any score get a score of 0
+    """
+    if spliceai is None:
+        return None
+    spliceai = spliceai.replace("&", ",")
+    if "," in spliceai:
+        return get_spliceai_max_multiple(spliceai)
+    if "|.|" in spliceai:
+        return None
+    return float(max(spliceai.split("|")[2:6]))
+
+
+def get_spliceai_max_multiple(spliceai: str) -> float:
+    """
+    Get maximum SpliceAI score for multiple splice site observations
+    """
+    local_max = []
+    for prediction in spliceai.split(","):
+        scores = prediction.split("|")[2:6]
+        try:
+            local_max.append(float(max(scores)))
+        except ValueError:
+            continue
+    if local_max:
+        return max(local_max)
+    return 0.0
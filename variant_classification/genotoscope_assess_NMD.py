@@ -10,11 +10,25 @@ from genotoscope_exon_skipping import (
     find_exon_by_var_pos,
 )
 from variant import TranscriptInfo, VariantInfo
+from exon_index import get_exon_index
+from nmd_boundary import get_nmd_boundary
+from genotoscope_protein_len_diff import get_observed_position_ptc
+from termination_codon import search_termination_codon
+from variant_coding_sequence import Variant_Coding_Sequence
 from var_type import VARTYPE_GROUPS
+from lru_cache import LRU_Cache
 
 
 logger = logging.getLogger("GenOtoScope_Classify.PVS1.assess_NMD")
 
+# Verify NMD prediction from NMD boundaries against NMD prediction from observed exon sequences
+verify_NMD_boundary = False
+
+NMD_MEMO_SIZE = 10000
+
+# NMD verdicts of exonic variants keyed by transcript ID, PTC and length difference of the observed coding sequence
+NMD_memo = LRU_Cache(NMD_MEMO_SIZE)
+
 
 def get_affected_exon(
     ref_transcript: pyensembl.transcript.Transcript,
@@ -58,6 +72,58 @@ def assess_NMD_threshold(
         return False, []
 
 
+def assess_NMD_boundary(
+    transcript: TranscriptInfo,
+    variant: VariantInfo,
+    ptc: int,
+    ref_transcript: pyensembl.transcript.Transcript,
+    var_coding_seq: Variant_Coding_Sequence,
+    diff_len: int,
+) -> tuple:
+    """
+    Examine if "non sense mediated mRNA decay" (NMD) will occur for exonic variant
+    Position of PTC, corrected to reference codons as returned by calculate_prot_len_diff, is compared to the precomputed NMD boundaries of the transcript
+    Verdicts are memoized by transcript and PTC, affected exons depend on the variant position and are assessed for each variant
+    The prediction differs from assess_NMD_exonic_variant for PTC in the penultimate exon and for transcripts with introns in the 3' UTR, see NMD_Boundary
+    If verify_NMD_boundary is set, the prediction is compared to assess_NMD_exonic_variant
+    """
+    logger.debug(
+        f"Assess NMD by NMD boundaries for transcript: {transcript.transcript_id}"
+    )
+    exons_containing_var = find_exons_containing_exonic_var(
+        transcript, variant, ref_transcript, diff_len
+    )
+    if is_exonic_var_type(transcript):
+        affected_exons_pos = find_pos_affected_exons(
+            ref_transcript,
+            exons_containing_var,
+            variant,
+        )
+        # PTC is corrected to reference codons by calculate_prot_len_diff, NMD boundaries are assessed on the observed PTC
+        observed_ptc = get_observed_position_ptc(diff_len, ptc)
+        NMD_occurs, NMD_comment = NMD_memo.get(
+            (transcript.transcript_id, ptc, diff_len),
+            lambda: get_nmd_boundary(ref_transcript).assess_ptc(observed_ptc, diff_len),
+        )
+        logger.debug(f"NMD is predicted to occur: {NMD_occurs}, comment: {NMD_comment}")
+    else:
+        logger.debug("Variant type not applicable for stop codon search")
+        NMD_occurs = False
+        affected_exons_pos = []
+    if verify_NMD_boundary:
+        NMD_occurs_exon_seq, _ = assess_NMD_exonic_variant(
+            transcript, variant, ref_transcript, var_coding_seq, diff_len
+        )
+        if NMD_occurs != NMD_occurs_exon_seq:
+            logger.warning(
+                f"NMD prediction from NMD boundaries ({NMD_occurs}) differs from prediction from observed exon sequences ({NMD_occurs_exon_seq})\n=> variant position: {variant.to_string()}"
+            )
+    return (
+        NMD_occurs,
+        affected_exons_pos,
+    )
+
+
 def assess_NMD_intronic_variant(
     transcript: TranscriptInfo,
     variant: VariantInfo,
@@ -67,7 +133,7 @@ def assess_NMD_intronic_variant(
     start_codon_exon_skipped: bool,
     stop_codon_exon_skipped,
     coding_exon_skipped: bool,
-    var_coding_seq: str,
+    var_coding_seq: Variant_Coding_Sequence,
     diff_len: int,
 ) -> tuple:
     """
@@ -173,7 +239,7 @@ def assess_NMD_exonic_variant(
     transcript: TranscriptInfo,
     variant: VariantInfo,
     ref_transcript: pyensembl.transcript.Transcript,
-    var_coding_seq: str,
+    var_coding_seq: Variant_Coding_Sequence,
     diff_len: int,
 ) -> tuple:
     """
@@ -197,42 +263,13 @@ def assess_NMD_exonic_variant(
     # construct exon positions using chromosome position
     exon_positions = get_transcript_exon_offsets(ref_transcript, True)
     num_exon_positions = len(exon_positions)
-    if is_genomic_pos_in_coding_exon(
-        ref_transcript, variant.genomic_start
-    ) and is_genomic_pos_in_coding_exon(ref_transcript, variant.genomic_end):
-        # exonic variant with both genomic start and stop in exonic range
-        logger.debug(
-            "Exonic type of variant and its genomic start and stop both overlap exonic range"
-        )
-        (
-            exons_containing_var,
-            var_exon_start_offset,
-            var_exon_end_offset,
-        ) = find_exon_by_var_pos(ref_transcript, transcript, variant, True, diff_len)
-    elif is_genomic_pos_in_coding_exon(
-        ref_transcript, variant.genomic_start
-    ) or is_genomic_pos_in_coding_exon(ref_transcript, variant.genomic_end):
-        # exonic variant with either genomic start or stop in exonic range
-        logger.debug(
-            "Exonic type of variant and its genomic start or stop overlaps exonic range"
-        )
-        (
-            exons_containing_var,
-            var_exon_start_offset,
-            var_exon_end_offset,
-        ) = find_exon_by_var_pos(ref_transcript, transcript, variant, False, diff_len)
-    else:
-        raise ValueError(
-            f"Genomic position in transcript coding region expected, but variant no located in coding region. {transcript}"
-        )
+    exons_containing_var = find_exons_containing_exonic_var(
+        transcript, variant, ref_transcript, diff_len
+    )
 
     NMD_comment = "NMD is not predicted"
 
-    if any(
-        var_type_exonic.value == var_type.value
-        for var_type_exonic in VARTYPE_GROUPS.EXONIC.value
-        for var_type in transcript.var_type
-    ):
+    if is_exonic_var_type(transcript):
         logger.debug("Variant applicable for stop codon searching")
         logger.debug(
             "Update exon positions for variant that skips both start and stop exons or does not skip start codon exon"
@@ -297,6 +334,57 @@ def assess_NMD_exonic_variant(
     )
 
 
+def find_exons_containing_exonic_var(
+    transcript: TranscriptInfo,
+    variant: VariantInfo,
+    ref_transcript: pyensembl.transcript.Transcript,
+    diff_len: int,
+) -> list[int]:
+    """
+    Find indices of exons (1-based) containing exonic variant
+    """
+    if is_genomic_pos_in_coding_exon(
+        ref_transcript, variant.genomic_start
+    ) and is_genomic_pos_in_coding_exon(ref_transcript, variant.genomic_end):
+        # exonic variant with both genomic start and stop in exonic range
+        logger.debug(
+            "Exonic type of variant and its genomic start and stop both overlap exonic range"
+        )
+        (
+            exons_containing_var,
+            var_exon_start_offset,
+            var_exon_end_offset,
+        ) = find_exon_by_var_pos(ref_transcript, transcript, variant, True, diff_len)
+    elif is_genomic_pos_in_coding_exon(
+        ref_transcript, variant.genomic_start
+    ) or is_genomic_pos_in_coding_exon(ref_transcript, variant.genomic_end):
+        # exonic variant with either genomic start or stop in exonic range
+        logger.debug(
+            "Exonic type of variant and its genomic start or stop overlaps exonic range"
+        )
+        (
+            exons_containing_var,
+            var_exon_start_offset,
+            var_exon_end_offset,
+        ) = find_exon_by_var_pos(ref_transcript, transcript, variant, False, diff_len)
+    else:
+        raise ValueError(
+            f"Genomic position in transcript coding region expected, but variant no located in coding region. {transcript}"
+        )
+    return exons_containing_var
+
+
+def is_exonic_var_type(transcript: TranscriptInfo) -> bool:
+    """
+    Examine if variant type of transcript is exonic
+    """
+    return any(
+        var_type_exonic.value == var_type.value
+        for var_type_exonic in VARTYPE_GROUPS.EXONIC.value
+        for var_type in transcript.var_type
+    )
+
+
 def is_genomic_pos_in_coding_exon(
     transcript: pyensembl.transcript.Transcript, genomic_pos: int
 ) -> bool:
@@ -304,47 +392,14 @@ def is_genomic_pos_in_coding_exon(
     Examine if genomic position is contained in coding exon
     """
 
-    pos_in_coding_exon = False
     logger.debug(
         f"Examine if genomic pos: {genomic_pos} is contained in coding exon sequence"
     )
-    if is_transcript_in_positive_strand(transcript):
-        strand_direction = +1
-    else:
-        strand_direction = -1
-    num_coding_exons = len(transcript.coding_sequence_position_ranges)
-
     ### ### ###
-    # loop through values and check if variant overlap a coding exonic range
+    # coding exon ranges are extended by one position in strand direction
+    # and the last coding exon ends at the stop codon
     ### ### ###
-    for coding_exon_idx, coding_interval in enumerate(
-        transcript.coding_sequence_position_ranges
-    ):
-        # set up exon coding start and end positions
-        if strand_direction == 1:
-            exon_coding_start = coding_interval[0]
-            if coding_exon_idx + 1 == num_coding_exons:
-                # update end of last exon to be the highest chromosomal position of the stop codon
-                exon_coding_end = transcript.stop_codon_positions[-1]
-            else:
-                exon_coding_end = coding_interval[1]
-        else:
-            exon_coding_start = coding_interval[1]
-            if coding_exon_idx + 1 == num_coding_exons:
-                # update end of last exon to be the lowest chromosomal position of the stop codon
-                exon_coding_end = transcript.stop_codon_positions[0]
-            else:
-                exon_coding_end = coding_interval[0]
-        normalized_coding_interval = range(
-            exon_coding_start, exon_coding_end + 2 * strand_direction, strand_direction
-        )
-
-        logger.debug(f"normalized interval: {normalized_coding_interval}")
-        if genomic_pos in normalized_coding_interval:
-            logger.debug(f"position in exon with offset: {coding_exon_idx}")
-            pos_in_coding_exon = True
-            break
-    return pos_in_coding_exon
+    return get_exon_index(transcript).is_in_coding_exon(genomic_pos)
 
 
 def find_pos_affected_exons(
@@ -391,7 +446,7 @@ def search_stop_codon(
     are_exons_skipped: bool,
     exons_containing_var: list[int],
     stop_codon_exon_skipped: bool,
-    var_coding_seq: str,
+    var_coding_seq: Variant_Coding_Sequence,
     diff_len: int,
 ):
     """
@@ -575,7 +630,7 @@ def search_stop_codon(
             # self.logger.debug("remaining: {}".format(
             # 	var_coding_seq[last_start + current_codon_length:len(var_coding_seq)]))
 
-            observed_codons = extract_codons(obs_exon_coding_seq.upper())
+            observed_coding_seq = obs_exon_coding_seq.upper()
 
             if exon_idx == stop_codon_exon_idx - 1:
                 logger.debug("Process penultimate exon")
@@ -584,13 +639,13 @@ def search_stop_codon(
                 (
                     termination_codon_exists,
                     termination_codon_index,
-                ) = search_termination_codon(observed_codons, True)
+                ) = search_termination_codon(observed_coding_seq, True)
             else:
                 # search termination codon on any other exon
                 (
                     termination_codon_exists,
                     termination_codon_index,
-                ) = search_termination_codon(observed_codons, False)
+                ) = search_termination_codon(observed_coding_seq, False)
 
             if termination_codon_exists:
                 # to create absolute termination codon indices
@@ -628,75 +683,6 @@ def search_stop_codon(
     return exon2termination_codon_pos, num_exons
 
 
-def search_termination_codon(
-    exon_codons: list[str], is_penultimate_exon: bool
-) -> tuple:
-    """
-    Search termination codon in exon codons
-
-    Returns
-    -------
-    bool
-        termination codon exists in exon codons (True), otherwise it doesn't (False)
-    int
-        termination codon index (1-index), if termination codon doesn't exist equals the length of the search coding region
-    """
-
-    if is_penultimate_exon:
-        logger.debug("Search termination codon in penultimate exon")
-    termination_codon_exists = False
-    if is_penultimate_exon:
-        # start from the most 3' 50 base ~= 50/3 = 17 codons
-        search_start = len(exon_codons) - 17
-        sequence_limit = "the most 3' 50 bases = 17 codons"
-    # print("Current exon observed sequence ")
-    else:
-        # not penultimate exon
-        search_start = 0
-        sequence_limit = "all sequence"
-    logger.debug(
-        f"Current exon observed sequence ({sequence_limit}) is: {exon_codons[search_start : len(exon_codons)]}"
-    )
-    # find the left most (5'-most) termination codon in sequence's codons
-    term_codons_indices = [
-        get_codon_index(exon_codons[search_start : len(exon_codons)], term_codon)
-        for term_codon in ["TAG", "TAA", "TGA"]
-    ]
-    left_most_term_index = min(term_codons_indices)
-
-    # update termination codon existence flag and position
-    if left_most_term_index == len(exon_codons[search_start : len(exon_codons)]):
-        termination_codon_exists = False
-        termination_codon_index = -1
-    else:
-        termination_codon_exists = True
-        termination_codon_index = left_most_term_index
-    logger.debug(f"Termination codon found: {termination_codon_exists}")
-    return termination_codon_exists, termination_codon_index
-
-
-def get_codon_index(seq_codons: list[str], target_codon: str) -> int:
-    """
-    Search target codon on sequence codons
-    and return its index
-    """
-    try:
-        codon_index = seq_codons.index(target_codon) + 1
-    except ValueError:
-        codon_index = len(seq_codons)
-    return codon_index
-
-
-def extract_codons(sequence: str) -> list[str]:
-    """
-    Extract codons from given sequence, which start where the frame start offset is
-    """
-    codons = []
-    for pos in range(0, len(sequence), 3):
-        codons.append(sequence[pos : pos + 3])
-    return codons
-
-
 def construct_observed_exon_seq(
     ref_transcript: pyensembl.transcript.Transcript,
     exon_idx: int,
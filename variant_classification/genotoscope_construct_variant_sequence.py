@@ -8,6 +8,7 @@ from genotoscope_exon_skipping import (
 )
 from genotoscope_assess_NMD import is_genomic_pos_in_coding_exon
 from variant import TranscriptInfo, VariantInfo
+from variant_coding_sequence import Variant_Coding_Sequence
 
 logger = logging.getLogger("GenOtoScope_Classify.PVS1.construct_variant_coding_seq")
 
@@ -29,10 +30,11 @@ def construct_variant_coding_seq_intronic_variant(
 
     Then return variant-integrated coding sequence in the forward strand
     r the reverse complement, based on the transcript directionality
+    The variant coding sequence is represented by the reference coding sequence and the variant edit
 
     Returns
     -------
-    str
+    Variant_Coding_Sequence
         variant coding sequence
     int
         diff_len
@@ -40,14 +42,16 @@ def construct_variant_coding_seq_intronic_variant(
     logger.debug("Constructing coding sequence for intronic variant")
     ref_coding_seq = str(ref_transcript.coding_sequence)
     logger.debug(f"Coding seq: {ref_coding_seq}, len={len(ref_coding_seq)}")
-    var_coding_seq = ""
+    var_coding_seq = Variant_Coding_Sequence("")
     diff_len = 0
     var_edit = str(transcript.var_hgvs.edit)
     if start_codon_exon_skipped and stop_codon_exon_skipped:
         ### ### ### ###
         # variant skips both exon containing both start and stop codon
         ### ### ### ###
-        var_coding_seq = ""
+        var_coding_seq = Variant_Coding_Sequence(
+            ref_coding_seq, [(0, len(ref_coding_seq), "")]
+        )
         diff_len = len(ref_coding_seq)
     elif coding_exon_skipped:
         ### ### ### ###
@@ -58,9 +62,8 @@ def construct_variant_coding_seq_intronic_variant(
             # exon is skipped => delete exon from coding sequence
             logger.debug("Delete the skipped exon from the coding sequence")
             if var_start >= 1:
-                var_coding_seq = (
-                    ref_coding_seq[0 : var_start - 1]
-                    + ref_coding_seq[var_end : len(ref_coding_seq)]
+                var_coding_seq = Variant_Coding_Sequence(
+                    ref_coding_seq, [(var_start - 1, var_end, "")]
                 )
                 logger.debug(
                     f"Deleting sequence: {ref_coding_seq[var_start -1 : var_end]}"
@@ -88,11 +91,11 @@ def construct_variant_coding_seq_intronic_variant(
                 )
         diff_len = -1 * del_length
     else:
-        var_coding_seq = ref_coding_seq
+        var_coding_seq = Variant_Coding_Sequence(ref_coding_seq)
 
     if coding_exon_skipped:
         try:
-            assert ref_coding_seq.upper() != var_coding_seq.upper()
+            assert not var_coding_seq.is_reference()
         except AssertionError:
             logger.error(
                 f"Coding sequence of reference and sample should be different\n variant position: {variant.to_string()}",
@@ -148,10 +151,11 @@ def construct_variant_coding_seq_exonic_variant(
 
     Then return variant-integrated coding sequence in the forward strand
     r the reverse complement, based on the transcript directionality
+    The variant coding sequence is represented by the reference coding sequence and the variant edit
 
     Returns
     -------
-    str
+    Variant_Coding_Sequence
         variant coding sequence
     int
         diff_len
@@ -160,7 +164,7 @@ def construct_variant_coding_seq_exonic_variant(
     ref_coding_seq = str(ref_transcript.coding_sequence)
     logger.debug(f"Coding seq: {ref_coding_seq}, len={len(ref_coding_seq)}")
     vep_coordinates_used = True
-    var_coding_seq = ""
+    var_coding_seq = Variant_Coding_Sequence("")
     diff_len = 0
     var_edit = str(transcript.var_hgvs.edit)
     logger.debug("Constructing variant start and stop position")
@@ -181,14 +185,12 @@ def construct_variant_coding_seq_exonic_variant(
         # get directionally corrected reference and observed bases for SNP
         [ref_seq, obs_seq] = var_edit.split(">")
         if var_start > 1:
-            var_coding_seq = (
-                ref_coding_seq[0 : var_start - 1]
-                + obs_seq.lower()
-                + ref_coding_seq[var_start : len(ref_coding_seq)]
+            var_coding_seq = Variant_Coding_Sequence(
+                ref_coding_seq, [(var_start - 1, var_start, obs_seq.lower())]
             )
         elif var_start == 1:
-            var_coding_seq = (
-                obs_seq.lower() + ref_coding_seq[var_start : len(ref_coding_seq)]
+            var_coding_seq = Variant_Coding_Sequence(
+                ref_coding_seq, [(0, var_start, obs_seq.lower())]
             )
         else:
             try:
@@ -218,12 +220,11 @@ def construct_variant_coding_seq_exonic_variant(
         logger.debug(f"Deleting: {ref_coding_seq[var_start -1 :var_end]}")
         logger.debug(f"Region being delete is: {var_start} - {var_end}")
         if var_start >= 1:
-            var_coding_seq = (
-                ref_coding_seq[0 : var_start - 1]
-                + ref_coding_seq[var_end : len(ref_coding_seq)]
+            var_coding_seq = Variant_Coding_Sequence(
+                ref_coding_seq, [(var_start - 1, var_end, "")]
             )
         elif var_start == 0:
-            var_coding_seq = ref_coding_seq[var_end : len(ref_coding_seq)]
+            var_coding_seq = Variant_Coding_Sequence(ref_coding_seq, [(0, var_end, "")])
         else:
             try:
                 assert var_start >= 0
@@ -236,9 +237,7 @@ def construct_variant_coding_seq_exonic_variant(
         # assert deletion by resulted sequence length
         del_length = var_end - var_start + 1
         try:
-            logger.debug(
-                f"var_coding_seq: {var_coding_seq}, len: {len(var_coding_seq)}"
-            )
+            logger.debug(f"var_coding_seq len: {len(var_coding_seq)}")
             assert len(ref_coding_seq) - len(var_coding_seq) == del_length
         except AssertionError:
             logger.error(
@@ -258,10 +257,9 @@ def construct_variant_coding_seq_exonic_variant(
             )
         logger.debug(f"Insert sequence: {obs_seq}")
         if var_start >= 1:
-            var_coding_seq_ins = (
-                var_coding_seq[0 : var_start - 1]
-                + obs_seq.lower()
-                + var_coding_seq[var_start - 1 : len(ref_coding_seq)]
+            # insertion is placed at the position of the deletion
+            var_coding_seq_ins = Variant_Coding_Sequence(
+                ref_coding_seq, [(var_start - 1, var_end, obs_seq.lower())]
             )
         else:
             try:
@@ -285,9 +283,7 @@ def construct_variant_coding_seq_exonic_variant(
         # assert the length difference for both operations
         diff_len = ins_length - del_length
         try:
-            logger.debug(
-                f"var_coding_seq: {var_coding_seq}, len: {len(var_coding_seq)}"
-            )
+            logger.debug(f"var_coding_seq len: {len(var_coding_seq)}")
             assert len(var_coding_seq) - len(ref_coding_seq) == diff_len
         except AssertionError:
             logger.error(
@@ -324,9 +320,8 @@ def construct_variant_coding_seq_exonic_variant(
         # perform deletion
         ### ### ###
         if var_start >= 1:
-            var_coding_seq = (
-                ref_coding_seq[0 : var_start - 1]
-                + ref_coding_seq[var_end : len(ref_coding_seq)]
+            var_coding_seq = Variant_Coding_Sequence(
+                ref_coding_seq, [(var_start - 1, var_end, "")]
             )
         else:
             try:
@@ -338,9 +333,7 @@ def construct_variant_coding_seq_exonic_variant(
                 )
         del_length = var_end - var_start + 1
         try:
-            logger.debug(
-                f"var_coding_seq: {var_coding_seq}, len: {len(var_coding_seq)}"
-            )
+            logger.debug(f"var_coding_seq len: {len(var_coding_seq)}")
             assert len(ref_coding_seq) - len(var_coding_seq) == del_length
         except AssertionError:
             logger.error(
@@ -399,29 +392,21 @@ def construct_variant_coding_seq_exonic_variant(
             if var_start == var_end:
                 # start equal ends so the rest part, after the insertion, should start on end position
                 if vep_coordinates_used:
-                    var_coding_seq = (
-                        ref_coding_seq[0:var_start]
-                        + obs_seq.lower()
-                        + ref_coding_seq[var_end : len(ref_coding_seq)]
+                    var_coding_seq = Variant_Coding_Sequence(
+                        ref_coding_seq, [(var_start, var_end, obs_seq.lower())]
                     )
                 else:
-                    var_coding_seq = (
-                        ref_coding_seq[0:var_start]
-                        + obs_seq.lower()
-                        + ref_coding_seq[var_end : len(ref_coding_seq)]
+                    var_coding_seq = Variant_Coding_Sequence(
+                        ref_coding_seq, [(var_start, var_end, obs_seq.lower())]
                     )
             else:
                 if vep_coordinates_used:
-                    var_coding_seq = (
-                        ref_coding_seq[0:var_start]
-                        + obs_seq.lower()
-                        + ref_coding_seq[var_end - 1 : len(ref_coding_seq)]
+                    var_coding_seq = Variant_Coding_Sequence(
+                        ref_coding_seq, [(var_start, var_end - 1, obs_seq.lower())]
                     )
                 else:
-                    var_coding_seq = (
-                        ref_coding_seq[0:var_start]
-                        + obs_seq.lower()
-                        + ref_coding_seq[var_end - 1 : len(ref_coding_seq)]
+                    var_coding_seq = Variant_Coding_Sequence(
+                        ref_coding_seq, [(var_start, var_end - 1, obs_seq.lower())]
                     )
         else:
             try:
@@ -494,10 +479,8 @@ def construct_variant_coding_seq_exonic_variant(
             # duplication of one nucleotide
             logger.debug("Duplication of one nucleotide")
             if var_start >= 1:
-                var_coding_seq = (
-                    ref_coding_seq[0:var_start]
-                    + obs_seq.lower()
-                    + ref_coding_seq[var_start : len(ref_coding_seq)]
+                var_coding_seq = Variant_Coding_Sequence(
+                    ref_coding_seq, [(var_start, var_start, obs_seq.lower())]
                 )
             else:
                 try:
@@ -512,16 +495,12 @@ def construct_variant_coding_seq_exonic_variant(
             logger.debug("Duplication of multiple nucleotides")
             if var_start >= 1:
                 if vep_coordinates_used:
-                    var_coding_seq = (
-                        ref_coding_seq[0:var_end]
-                        + obs_seq.lower()
-                        + ref_coding_seq[var_end : len(ref_coding_seq)]
+                    var_coding_seq = Variant_Coding_Sequence(
+                        ref_coding_seq, [(var_end, var_end, obs_seq.lower())]
                     )
                 else:
-                    var_coding_seq = (
-                        ref_coding_seq[0 : var_end + 1]
-                        + obs_seq.lower()
-                        + ref_coding_seq[var_end + 1 : len(ref_coding_seq)]
+                    var_coding_seq = Variant_Coding_Sequence(
+                        ref_coding_seq, [(var_end + 1, var_end + 1, obs_seq.lower())]
                     )
             else:
                 try:
@@ -545,7 +524,7 @@ def construct_variant_coding_seq_exonic_variant(
     # check that indeed is different from the reference
     ### ### ### ###
     try:
-        assert ref_coding_seq.upper() != var_coding_seq.upper()
+        assert not var_coding_seq.is_reference()
     except AssertionError:
         logger.error(
             f"Coding sequence of reference and sample should be different\n variant position: {variant.to_string()} in transcript {transcript.transcript_id} with variant {transcript.var_hgvs}",
@@ -577,7 +556,7 @@ def check_if_start_stop_codon_exists_in_var_sequence(
     var_start: int,
     var_end: int,
     ref_coding_seq: str,
-    var_coding_seq: str,
+    var_coding_seq: Variant_Coding_Sequence,
 ) -> None:
     if var_start == var_end:
         var_positions = range(var_start, var_start + 1)
@@ -624,7 +603,7 @@ def check_if_start_stop_codon_exists_in_var_sequence(
 
 def print_ref_observed_seq(
     ref_coding_seq: str,
-    var_coding_seq: str,
+    var_coding_seq: Variant_Coding_Sequence,
     transcript: TranscriptInfo,
     var_start: int,
     var_end: int,
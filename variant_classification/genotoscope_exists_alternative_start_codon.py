@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 
 import logging
+from typing import Union
 import pyensembl
 
 from variant import VariantInfo
+from variant_coding_sequence import Variant_Coding_Sequence
+from start_codon_index import get_start_codon_index
 from genotoscope_exon_skipping import (
-    extract_codons,
     is_transcript_in_positive_strand,
     find_exon_by_ref_pos,
 )
@@ -16,7 +18,7 @@ logger = logging.getLogger("GenOtoScope_Classify.PVS1.find_alternative_start_cod
 def assess_alternative_start_codon(
     variant: VariantInfo,
     ref_transcript: pyensembl.transcript.Transcript,
-    var_coding_seq: str,
+    var_coding_seq: Union[str, Variant_Coding_Sequence],
 ) -> tuple[bool, list[int], list[int]]:
     (
         alternative_start_codons_cDNA,
@@ -34,23 +36,17 @@ def assess_alternative_start_codon(
 def find_alternative_start_codons(
     variant: VariantInfo,
     ref_transcript: pyensembl.transcript.Transcript,
-    var_coding_seq: str,
+    var_coding_seq: Union[str, Variant_Coding_Sequence],
 ) -> tuple[list[int], list[int]]:
     """
     First seach for alternative start codon in other reference transcripts
     If no start codon is found, search in sequence for other start codons
-    First seach in the first 200 codons, then search in whole sequence
+    The closest start codon is looked up in the ATG positions of the reference coding sequence
     Return genomic positions of start codon
     """
-    downstream_codons = get_codons_downstream_start(var_coding_seq, 201)
-    codon_position_start_codon = search_closest_start_codon(downstream_codons, variant)
-    if 0 > codon_position_start_codon:
-        all_downstream_codons = get_codons_downstream_start(
-            var_coding_seq, len(var_coding_seq)
-        )
-        codon_position_start_codon = search_closest_start_codon(
-            all_downstream_codons, variant
-        )
+    codon_position_start_codon = search_closest_start_codon(
+        ref_transcript, var_coding_seq, variant
+    )
     if codon_position_start_codon >= 0:
         alternative_start_codon = covnert_codon_position_to_genomic_position(
             ref_transcript, codon_position_start_codon
@@ -112,32 +108,27 @@ def examine_start_codon_other_transcripts(ref_transcript) -> list[int]:
         return []
 
 
-def get_codons_downstream_start(
-    var_coding_seq: str, downstream_length: int
-) -> list[str]:
-    """
-    Get codons in downstream region from start codon of transcript
-    """
-
-    return extract_codons(var_coding_seq[0:downstream_length])
-
-
-def search_closest_start_codon(codons: list[str], variant: VariantInfo) -> int:
+def search_closest_start_codon(
+    ref_transcript: pyensembl.transcript.Transcript,
+    var_coding_seq: Union[str, Variant_Coding_Sequence],
+    variant: VariantInfo,
+) -> int:
     """
-    Search for start codon in input codons
+    Search for start codon in codons of input sequence
     if exists, return the closest to the start
 
-    positive value = index of start codon in input list of codons,
-    negative value = start codon is not contained in the input list of codons
+    positive value = index of start codon in codons of input sequence,
+    negative value = start codon is not contained in the input sequence
     """
 
-    try:
-        return codons.index("ATG")
-    except ValueError:
+    codon_position_start_codon = get_start_codon_index(ref_transcript).find_start_codon(
+        var_coding_seq
+    )
+    if codon_position_start_codon < 0:
         logger.debug(
             f"Codons do not contain start codon\n=> variant position: {variant.to_string()}"
         )
-        return -1
+    return codon_position_start_codon
 
 
 def covnert_codon_position_to_genomic_position(
@@ -1,15 +1,25 @@
 #!/usr/bin/env python3
 
+import copy
 import logging
+from typing import Optional
 
 import pyensembl
 import hgvs.posedit
 
 from variant import VariantInfo, TranscriptInfo
 from var_type import VARTYPE, VARTYPE_GROUPS
+from exon_index import get_exon_index
+from termination_codon import search_termination_codon
+from lru_cache import LRU_Cache
 
 logger = logging.getLogger("GenOtoScope_Classify.PVS1.exon_skipping")
 
+EXON_SKIPPING_MEMO_SIZE = 10000
+
+# Exon skipping outcomes keyed by disrupted splice site
+exon_skipping_memo = LRU_Cache(EXON_SKIPPING_MEMO_SIZE)
+
 
 def assess_exon_skipping(
     transcript: TranscriptInfo,
@@ -18,6 +28,46 @@ def assess_exon_skipping(
 ) -> tuple:
     """
     Assess if exon will be skipped
+    Outcomes for variants on the same splice site of a transcript are memoized
+    Memoized outcomes are copied, so that callers can not modify them
+    """
+    splice_site = get_splice_site(transcript)
+    if splice_site is None:
+        return predict_exon_skipping(transcript, variant, ref_transcript)
+    exon_skipping = exon_skipping_memo.get(
+        splice_site,
+        lambda: predict_exon_skipping(transcript, variant, ref_transcript),
+    )
+    return copy.deepcopy(exon_skipping)
+
+
+def get_splice_site(transcript: TranscriptInfo) -> Optional[tuple]:
+    """
+    Get splice site disrupted by splice acceptor or donor variant as (transcript ID, exon, intron, direction to exon)
+    Return None if variant is not located on the splice sites: +/- 1,2
+    """
+    if not is_transcript_type_splice_acceptor_donor(transcript.var_type):
+        return None
+    if not (transcript.exon or transcript.intron):
+        return None
+    _, intron_offset, direction2exon = parse_variant_intron_pos(transcript.var_hgvs)
+    if intron_offset not in [1, 2]:
+        return None
+    return (
+        transcript.transcript_id,
+        transcript.exon,
+        transcript.intron,
+        direction2exon,
+    )
+
+
+def predict_exon_skipping(
+    transcript: TranscriptInfo,
+    variant: VariantInfo,
+    ref_transcript: pyensembl.transcript.Transcript,
+) -> tuple:
+    """
+    Predict if exon will be skipped
     By examining if the affected intron position in on the splice sites: +/- 1,2
     """
 
@@ -117,7 +167,7 @@ def assess_exon_skipping(
                     skipped_exon_start - 1 + inframe_start : skipped_exon_end
                 ]
                 logger.debug(f"skipped inframe coding seq: {skipped_inframe_seq}")
-                if search_termination_codon(extract_codons(skipped_inframe_seq), False):
+                if search_termination_codon(skipped_inframe_seq, False):
                     # for stop codon exon skipping, normalize exon end to stop codon position
                     stop_codon_exon_skipped = True
                     skipped_exon_end = len(str(ref_transcript.coding_sequence))
@@ -134,46 +184,6 @@ def assess_exon_skipping(
     )
 
 
-def search_termination_codon(
-    exon_codons: list[str], is_penultimate_exon: bool
-) -> tuple[bool, int]:
-    """
-    Search termination codon in exon codons
-    Return if termination codon was found and if so where
-    """
-    if is_penultimate_exon:
-        logger.debug("Search termination codon in penultimate exon")
-    termination_codon_exists = False
-    if is_penultimate_exon:
-        # start from the most 3' 50 base ~= 50/3 = 17 codons
-        search_start = len(exon_codons) - 17
-        sequence_limit = "the most 3' 50 bases = 17 codons"
-    # print("Current exon observed sequence ")
-    else:
-        # not penultimate exon
-        search_start = 0
-        sequence_limit = "all sequence"
-    logger.debug(
-        f"Current exon observed sequence ({sequence_limit}) is: {exon_codons[search_start : len(exon_codons)]}"
-    )
-    # find the left most (5'-most) termination codon in sequence's codons
-    term_codons_indices = [
-        get_codon_index(exon_codons[search_start : len(exon_codons)], term_codon)
-        for term_codon in ["TAG", "TAA", "TGA"]
-    ]
-    left_most_term_index = min(term_codons_indices)
-
-    # update termination codon existence flag and position
-    if left_most_term_index == len(exon_codons[search_start : len(exon_codons)]):
-        termination_codon_exists = False
-        termination_codon_index = -1
-    else:
-        termination_codon_exists = True
-        termination_codon_index = left_most_term_index
-    logger.debug(f"Termination codon found: {termination_codon_exists}")
-    return termination_codon_exists, termination_codon_index
-
-
 def find_exon_by_ref_pos(
     ref_transcript: pyensembl.transcript.Transcript, ref_pos: int, is_genomic: bool
 ) -> tuple[int, int]:
@@ -185,30 +195,18 @@ def find_exon_by_ref_pos(
     """
 
     logger.debug(f"Find exon containing reference position: {ref_pos}")
-    if is_transcript_in_positive_strand(ref_transcript):
-        strand_direction = +1
-    else:
-        strand_direction = -1
-    exon_positions = get_transcript_exon_offsets(ref_transcript, is_genomic)
-    overlap_exon_index, pos_in_overlap_exon = -1, -1
 
     # reference position is found using pyensembl coding sequence,
     # this coding sequence does not contain the untranslated region of the starting exons
     # thus you need to add the length of the sequence of the first exons up to start codon (ATG)
     if not is_genomic:
-        # for cDNA position don't need to reverse exon start and end
-        strand_direction = +1
         len_first_exons_up_start_codon = ref_transcript.start_codon_spliced_offsets[0]
         ref_pos = ref_pos + len_first_exons_up_start_codon
 
     # find reference position into exon intervals
-    for exon_idx, exon_interval in enumerate(exon_positions):
-        normalized_exon_interval = range(
-            exon_interval[0], exon_interval[1] + strand_direction, strand_direction
-        )
-        if ref_pos in normalized_exon_interval:
-            overlap_exon_index = exon_idx
-            pos_in_overlap_exon = abs(ref_pos - exon_interval[0])
+    overlap_exon_index, pos_in_overlap_exon = get_exon_index(ref_transcript).find_exon(
+        ref_pos, is_genomic
+    )
 
     try:
         assert overlap_exon_index >= 0 and pos_in_overlap_exon >= 0
@@ -226,50 +224,11 @@ def get_transcript_exon_offsets(
     """
     Get all exons cDNA or genomic offsets of transcript
     Return all exons start and end position
+    Genomic positions follow strand direction: exon_i start > exon_i end for negative strand
+    cDNA offsets start from 1
+    The offsets are shared by all callers and must not be modified
     """
-
-    if is_genomic:
-        ### ### ###
-        # follow strand direction for chromosomal positions:
-        # exon_i start < exon_i end for positive strand
-        # exon_i start > exon_i end for negative strand
-        ### ### ###
-        coding_exons_chrom_ranges = []
-        for exon in ref_transcript.exons:
-            if is_transcript_in_positive_strand(ref_transcript):
-                coding_exons_chrom_ranges.append(
-                    [exon.to_dict()["start"], exon.to_dict()["end"]]
-                )
-            else:
-                coding_exons_chrom_ranges.append(
-                    [exon.to_dict()["end"], exon.to_dict()["start"]]
-                )
-        return coding_exons_chrom_ranges
-    else:
-        # create cDNA exon positions
-        # offsets starting from 1
-        exon_positions = []
-        is_first_exon = True
-        for exon in ref_transcript.exons:
-            if is_first_exon:
-                start = 1
-                is_first_exon = False
-            else:
-                start = end + 1
-            end = start + exon.to_dict()["end"] - exon.to_dict()["start"]
-            exon_positions.append([start, end])
-            try:
-                assert end - start == exon.to_dict()["end"] - exon.to_dict()["start"]
-            except AssertionError:
-                logger.error(
-                    "Exon genomic regions and coding regions should be equal in size",
-                    exc_info=True,
-                )
-        # sum = 0
-        # for exon_position in exon_positions:
-        #   sum += exon_position[1] - exon_position[0] + 1
-        logger.debug(f"Exon positions: {exon_positions}")
-        return exon_positions
+    return get_exon_index(ref_transcript).get_exon_offsets(is_genomic)
 
 
 def is_transcript_in_positive_strand(
@@ -309,18 +268,6 @@ def is_transcript_type_splice_acceptor_donor(transcript_type: list[VARTYPE]) ->
         return False
 
 
-def get_codon_index(seq_codons: list[str], target_codon: str) -> int:
-    """
-    Search target codon on sequence codons
-    and return its index
-    """
-    try:
-        codon_index = seq_codons.index(target_codon) + 1
-    except ValueError:
-        codon_index = len(seq_codons)
-    return codon_index
-
-
 def parse_variant_intron_pos(var_coding: hgvs.posedit.PosEdit) -> tuple[str, int, int]:
     """
     Parse variant offset in intron
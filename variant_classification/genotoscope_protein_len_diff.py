@@ -2,19 +2,18 @@
 
 import logging
 import math
+from typing import Union
 import pyensembl
 
-from genotoscope_assess_NMD import (
-    search_termination_codon,
-    extract_codons,
-)
+from termination_codon import find_termination_codon_with_utr
+from variant_coding_sequence import Variant_Coding_Sequence
 
 logger = logging.getLogger("GenOtoScope_Classify.PVS1.prot_len_diff")
 
 
 def calculate_prot_len_diff(
     ref_transcript: pyensembl.transcript.Transcript,
-    var_coding_seq: str,
+    var_coding_seq: Union[str, Variant_Coding_Sequence],
     diff_len: int,
 ) -> tuple[float, int]:
     """
@@ -51,7 +50,8 @@ def calculate_prot_len_diff_start_loss(
 
 
 def get_position_ptc(
-    ref_transcript: pyensembl.transcript.Transcript, var_coding_seq: str
+    ref_transcript: pyensembl.transcript.Transcript,
+    var_coding_seq: Union[str, Variant_Coding_Sequence],
 ) -> int:
     """
     Calculate the protein length of the observed coding sequence based on the (premature) termination codon
@@ -59,14 +59,7 @@ def get_position_ptc(
     """
     # after variant edit, the termination codon can be found even in the 3' UTR region
     # thus, search for the very first termination codon on the constructed observed coding sequence pluts the 3' UTR
-    var_coding_3_utr = var_coding_seq + ref_transcript.three_prime_utr_sequence
-    _, premature_term_codon_index = search_termination_codon(
-        extract_codons(var_coding_3_utr), False
-    )
-    if premature_term_codon_index == -1:
-        return 0
-    else:
-        return premature_term_codon_index
+    return find_termination_codon_with_utr(ref_transcript, var_coding_seq)
 
 
 def correct_position_ptc_for_indels(
@@ -78,15 +71,27 @@ def correct_position_ptc_for_indels(
     Adjust the PTC codon by codons added/substracted by the variant
     Non-complete codons are rounded up, as the start/end of the codon is still affected
     """
+    return codon_positon_ptc + get_codon_shift_for_indels(diff_len)
+
+
+def get_observed_position_ptc(diff_len: int, corrected_codon_position_ptc: int) -> int:
+    """
+    Revert correct_position_ptc_for_indels, to get the position of the PTC in the observed coding sequence
+    """
+    return corrected_codon_position_ptc - get_codon_shift_for_indels(diff_len)
+
+
+def get_codon_shift_for_indels(diff_len: int) -> int:
+    """
+    Number of codons added to the position of the PTC to correct it for insertion, deletion, indels
+    """
     if diff_len == 0:
-        return codon_positon_ptc
+        return 0
     elif diff_len > 0:
         # In case of an insertion the number of codons inserted needs to be substraced to get the position of the PTC in the original transcript
-        codon_shift = math.floor(diff_len / 3) * -1
-        return codon_positon_ptc + codon_shift
+        return math.floor(diff_len / 3) * -1
     elif diff_len < 0:
         # In case of a deletion the number of codons deleted needs to be added to get the position of the PTC in the original transcript
-        codon_shift = math.floor(abs(diff_len) / 3)
-        return codon_positon_ptc + codon_shift
+        return math.floor(abs(diff_len) / 3)
     else:
         raise ValueError("Error whilst correcting PTC position.")
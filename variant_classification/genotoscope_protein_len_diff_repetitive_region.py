@@ -6,7 +6,7 @@ import logging
 import pyensembl
 
 from variant import VariantInfo
-from utils import check_intersection_with_bed
+from utils import check_intersections_with_bed
 
 
 logger = logging.getLogger("GenOtoScope_Classify.protein_len_diff_repetitive_region")
@@ -19,14 +19,15 @@ def check_prot_len_change_in_repetitive_region_exon(
     path_rep_uniprot: pathlib.Path,
 ):
     if NMD_affected_exons:
-        are_exons_in_repetitive_region = []
-        for exon in NMD_affected_exons:
-            gen_start = exon["exon_start"]
-            gen_end = exon["exon_end"]
-            is_exon_in_repetitive_region, _ = check_intersection_with_bed(
-                variant, gen_start, gen_end, ref_transcript, path_rep_uniprot
+        intervals = [
+            (exon["exon_start"], exon["exon_end"]) for exon in NMD_affected_exons
+        ]
+        are_exons_in_repetitive_region = [
+            is_exon_in_repetitive_region
+            for is_exon_in_repetitive_region, _ in check_intersections_with_bed(
+                variant, intervals, ref_transcript, path_rep_uniprot
             )
-            are_exons_in_repetitive_region.append(is_exon_in_repetitive_region)
+        ]
         if all(are_exons_in_repetitive_region):
             return True
         else:
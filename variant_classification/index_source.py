@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+import pathlib
+import logging
+from typing import NamedTuple
+
+import pandas as pd
+
+logger = logging.getLogger("GenOtoScope_Classify.index_source")
+
+# Header lines of index files describing the ClinVar files the index was created from
+SOURCE_HEADER_PREFIX = "##"
+
+# Index sources and file versions that were already reported as outdated
+warned_outdated_sources: set[tuple["Index_Source", int, int]] = set()
+
+
+class Index_Source(NamedTuple):
+    """
+    ClinVar file an index was created from
+    Size and modification time identify the version of the file
+    """
+
+    source: str
+    file: str
+    size: int
+    mtime_ns: int
+
+    def matches(self, path: pathlib.Path) -> bool:
+        """
+        Check if path points to the version of the file the index was created from
+        """
+        path = pathlib.Path(path)
+        if path.name != self.file:
+            return False
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return False
+        if stat.st_size != self.size or stat.st_mtime_ns != self.mtime_ns:
+            outdated = (self, stat.st_size, stat.st_mtime_ns)
+            if outdated not in warned_outdated_sources:
+                warned_outdated_sources.add(outdated)
+                logger.warning(
+                    f"Index was created from a different version of {path}, recreate the index."
+                )
+            return False
+        return True
+
+
+def create_index_source(source: str, path: pathlib.Path) -> Index_Source:
+    """
+    Describe ClinVar file an index is created from
+    """
+    path = pathlib.Path(path)
+    stat = path.stat()
+    return Index_Source(source, path.name, stat.st_size, stat.st_mtime_ns)
+
+
+def format_index_source(index_source: Index_Source) -> str:
+    """
+    Format index source as header line of index file
+    """
+    return SOURCE_HEADER_PREFIX + "\t".join(
+        f"{key}={value}" for key, value in index_source._asdict().items()
+    )
+
+
+def write_index(
+    index: pd.DataFrame, index_sources: list[Index_Source], out_path: pathlib.Path
+) -> None:
+    """
+    Write index with header lines describing the ClinVar files it was created from
+    """
+    with open(out_path, "w") as out_file:
+        for index_source in index_sources:
+            out_file.write(format_index_source(index_source) + "\n")
+        index.to_csv(out_file, sep="\t", index=False)
+
+
+def read_index_sources(path: pathlib.Path) -> tuple[dict[str, Index_Source], int]:
+    """
+    Read sources from header lines of index file
+    Returns sources keyed by source name and number of header lines
+    """
+    sources = {}
+    num_header_lines = 0
+    with open(path) as index_file:
+        for line in index_file:
+            if not line.startswith(SOURCE_HEADER_PREFIX):
+                break
+            num_header_lines += 1
+            fields = dict(
+                field.split("=", 1)
+                for field in line.removeprefix(SOURCE_HEADER_PREFIX)
+                .rstrip("\n")
+                .split("\t")
+            )
+            index_source = Index_Source(
+                fields["source"],
+                fields["file"],
+                int(fields["size"]),
+                int(fields["mtime_ns"]),
+            )
+            sources[index_source.source] = index_source
+    return sources, num_header_lines
@@ -71,6 +71,8 @@ class Classification_Info:
     CLINVAR_PATH: Info
     CLINVAR_PATH_INDEL: Info
     CLINVAR_PATH_SPLICEAI: Info
+    CLINVAR_LOF_INDEX_PATH: Info
+    CLINVAR_CODON_INDEX_PATH: Info
     SIMILARITY_SCORE_PATH: Info
     SIMILARITY_SOCRE_DIRECTION: Info
     UNIPROT_REP_REGION_PATH: Info
@@ -252,6 +254,18 @@ class Classification_Info:
             config_location=("annotation_files", "clinvar", "clinvar_snv_spliceai"),
             group=Classification_Info_Groups.PATH,
         )
+        self.CLINVAR_LOF_INDEX_PATH = Info(
+            "clinvar_lof_index_path",
+            config_location=("annotation_files", "clinvar", "clinvar_lof_index"),
+            group=Classification_Info_Groups.PATH,
+            optional=True,
+        )
+        self.CLINVAR_CODON_INDEX_PATH = Info(
+            "clinvar_codon_index_path",
+            config_location=("annotation_files", "clinvar", "clinvar_codon_index"),
+            group=Classification_Info_Groups.PATH,
+            optional=True,
+        )
         self.SIMILARITY_SCORE_PATH = Info(
             "similarity_score_path",
             config_location=(
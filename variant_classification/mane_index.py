@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+import pathlib
+import logging
+from typing import Optional
+
+import pandas as pd
+
+from resource_registry import resource_registry
+
+logger = logging.getLogger("GenOtoScope_Classify.mane_index")
+
+
+class MANE_Index:
+    """
+    Versionless IDs of MANE transcripts
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        mane_transcripts = pd.read_csv(path, sep="\t").transcript.dropna()
+        self.transcript_ids = frozenset(
+            remove_version(transcript_id) for transcript_id in mane_transcripts
+        )
+
+    def is_mane(self, transcript_id: str) -> bool:
+        """
+        Check if transcript is MANE transcript
+        """
+        return remove_version(transcript_id) in self.transcript_ids
+
+    def select_transcript_id(self, transcript_ids: list[str]) -> Optional[str]:
+        """
+        From a list of transcript ids, select the first MANE transcript id
+        """
+        for transcript_id in transcript_ids:
+            if self.is_mane(transcript_id):
+                return transcript_id
+        return None
+
+
+def remove_version(transcript_id: str) -> str:
+    """
+    Remove version from transcript id, e.g. ENST00000357654.9 to ENST00000357654
+    """
+    return transcript_id.split(".")[0]
+
+
+def get_mane_index(path: pathlib.Path) -> MANE_Index:
+    """
+    Get index of MANE transcripts, load it on first access
+    """
+    return resource_registry.get("mane", path, MANE_Index)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+import logging
+
+import pyensembl
+
+from exon_index import get_exon_index
+from transcript_cache import get_transcript_cached
+
+logger = logging.getLogger("GenOtoScope_Classify.nmd_boundary")
+
+# PTC in the 3'-most 50 bases of the penultimate exon escape NMD
+PENULTIMATE_EXON_NMD_ESCAPE_LENGTH = 50
+
+# PTC in the first 200 bases from start codon escape NMD
+START_CODON_NMD_ESCAPE_LENGTH = 200
+
+
+class NMD_Boundary:
+    """
+    NMD boundaries of a transcript in coding sequence coordinates (1-based)
+    last_exon_junction is the last position of the penultimate exon, it lies after the coding sequence if the stop codon is followed by an exon junction
+    nmd_escape_start is the first position of the 3'-most 50 bases of the penultimate exon
+
+    The boundaries follow the exon junctions of the whole transcript and differ from assess_NMD_exonic_variant:
+    - PTC in the penultimate exon only escape NMD in its 3'-most 50 reference bases, assess_NMD_exonic_variant lets any PTC in the penultimate exon escape
+    - for transcripts with introns in the 3' UTR the last exon junction lies after the stop codon, so PTC in the exon containing the stop codon can lead to NMD
+      assess_NMD_exonic_variant only searches up to the exon containing the stop codon and counts penultimate and last exon over all exons
+    - PTC escape NMD if their last base lies in the first 200 bases of the observed coding sequence, as in assess_NMD_exonic_variant
+    """
+
+    def __init__(self, transcript: pyensembl.transcript.Transcript):
+        cdna_offsets = get_exon_index(transcript).get_exon_offsets(False)
+        self.num_exons = len(cdna_offsets)
+        if self.num_exons > 1:
+            self.last_exon_junction = (
+                cdna_offsets[-2][1] - transcript.first_start_codon_spliced_offset
+            )
+            self.nmd_escape_start = (
+                self.last_exon_junction - PENULTIMATE_EXON_NMD_ESCAPE_LENGTH + 1
+            )
+        else:
+            self.last_exon_junction = None
+            self.nmd_escape_start = None
+
+    def assess_ptc(self, ptc: int, diff_len: int) -> tuple[bool, str]:
+        """
+        Assess NMD for PTC given as codon position (1-based) in the observed coding sequence, not corrected for indels
+        The PTC is shifted by diff_len to its reference coding sequence position for comparison with the last exon junction
+        The distance from the start codon is measured in the observed coding sequence
+        ptc = 0 means that no PTC is found in observed coding sequence and 3' UTR
+        """
+        if self.num_exons == 1:
+            return False, "Single exon"
+        if ptc == 0:
+            return False, "PTC after reference stop codon"
+        ptc_ref_start = ptc * 3 - 2 - diff_len
+        if ptc_ref_start >= self.nmd_escape_start:
+            return False, "PTC in last exon or 3'-most 50 bases of penultimate exon"
+        if ptc * 3 < START_CODON_NMD_ESCAPE_LENGTH:
+            return False, "PTC distance from start codon < 200"
+        return True, "PTC before last EJC"
+
+
+def get_nmd_boundary(transcript: pyensembl.transcript.Transcript) -> NMD_Boundary:
+    """
+    Get NMD boundaries of transcript, the boundaries are computed on first use and kept on the transcript object
+    """
+    return get_transcript_cached(transcript, "nmd_boundary", NMD_Boundary)
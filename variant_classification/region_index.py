@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+
+import pathlib
+import logging
+from bisect import bisect_left, bisect_right
+from typing import NamedTuple, Optional
+
+from resource_registry import resource_registry
+
+logger = logging.getLogger("GenOtoScope_Classify.region_index")
+
+
+class Region(NamedTuple):
+    """
+    Region of BED file, fields contains all columns of the BED line keyed by the header of the BED file
+    """
+
+    chrom: str
+    start: int
+    end: int
+    strand: str
+    fields: dict[str, str]
+
+
+class Region_Index:
+    """
+    In memory index of regions in BED file
+    Regions are sorted by start per chromosome, the running maximum of the region ends bounds the regions that can overlap a query
+    Overlaps follow pybedtools all_hits: region and query overlap if start <= query end and query start <= end
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        self.columns: list[str] = []
+        regions: dict[str, list[Region]] = {}
+        with open(path) as bed_file:
+            for line in bed_file:
+                line = line.rstrip("\n")
+                if line.startswith("#"):
+                    if not self.columns:
+                        self.columns = line.split("\t")
+                    continue
+                if not line.strip() or line.startswith(("track", "browser")):
+                    continue
+                region = self.parse_line(line.split("\t"))
+                regions.setdefault(region.chrom, []).append(region)
+        self.regions: dict[str, list[Region]] = {}
+        self._starts: dict[str, list[int]] = {}
+        self._max_ends: dict[str, list[int]] = {}
+        for chrom, chrom_regions in regions.items():
+            chrom_regions.sort(key=lambda region: (region.start, region.end))
+            self.regions[chrom] = chrom_regions
+            self._starts[chrom] = [region.start for region in chrom_regions]
+            max_ends = []
+            max_end = None
+            for region in chrom_regions:
+                max_end = region.end if max_end is None else max(max_end, region.end)
+                max_ends.append(max_end)
+            self._max_ends[chrom] = max_ends
+        self._column_values: dict[str, frozenset[str]] = {}
+
+    def parse_line(self, line: list[str]) -> Region:
+        """
+        Create region from columns of BED line
+        """
+        if len(self.columns) == len(line):
+            fields = dict(zip(self.columns, line))
+        else:
+            fields = {str(idx): value for idx, value in enumerate(line)}
+        strand = line[5] if len(line) > 5 else "."
+        return Region(line[0], int(line[1]), int(line[2]), strand, fields)
+
+    def get_overlaps(
+        self, chrom: str, start: int, end: int, strand: Optional[str] = None
+    ) -> list[Region]:
+        """
+        Get regions overlapping query, if strand is given only regions on the same strand are returned
+        """
+        if start > end:
+            raise ValueError(f"Start {start} is greater than end {end} of query.")
+        if chrom not in self.regions:
+            return []
+        regions = self.regions[chrom]
+        first = bisect_left(self._max_ends[chrom], start)
+        last = bisect_right(self._starts[chrom], end)
+        return [
+            region
+            for region in regions[first:last]
+            if region.end >= start and (strand is None or region.strand == strand)
+        ]
+
+    def get_overlaps_batch(
+        self,
+        chrom: str,
+        intervals: list[tuple[int, int]],
+        strand: Optional[str] = None,
+    ) -> list[list[Region]]:
+        """
+        Get regions overlapping each of the queries in one sweep over the queries sorted by start
+        Regions are collected in order of their start, regions ending before the current query start can not overlap any following query
+        """
+        if any(start > end for start, end in intervals):
+            raise ValueError("Start is greater than end of query.")
+        hits: list[list[Region]] = [[] for _ in intervals]
+        regions = self.regions.get(chrom, [])
+        order = sorted(range(len(intervals)), key=lambda idx: intervals[idx])
+        active: list[Region] = []
+        next_region = 0
+        for idx in order:
+            start, end = intervals[idx]
+            while next_region < len(regions) and regions[next_region].start <= end:
+                active.append(regions[next_region])
+                next_region += 1
+            active = [region for region in active if region.end >= start]
+            hits[idx] = [
+                region
+                for region in active
+                if region.start <= end and (strand is None or region.strand == strand)
+            ]
+        return hits
+
+    def get_column(self, column: str) -> list[str]:
+        """
+        Get values of column for all regions
+        """
+        return [
+            region.fields[column]
+            for chrom_regions in self.regions.values()
+            for region in chrom_regions
+            if column in region.fields
+        ]
+
+    def get_column_values(self, column: str) -> frozenset[str]:
+        """
+        Get distinct values of column, the values are collected on first access
+        """
+        column_values = self._column_values.get(column)
+        if column_values is None:
+            column_values = frozenset(self.get_column(column))
+            self._column_values[column] = column_values
+        return column_values
+
+
+def get_region_index(path: pathlib.Path) -> Region_Index:
+    """
+    Get region index of BED file, the BED file is loaded once per process and again after it changed
+    """
+    return resource_registry.get("bed", path, Region_Index)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+import pathlib
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from information import Classification_Info, Classification_Info_Groups
+from config_annotation import get_path_from_config
+from load_config import get_gene_specific_config
+from clinvar_index import preload_clinvar_index_from_config
+from clinvar_lof_index import get_clinvar_lof_index
+from clinvar_codon_index import get_clinvar_codon_index
+from region_index import get_region_index
+from splice_table import get_splice_table
+from exon_pm5_index import get_exon_pm5_index
+from mane_index import get_mane_index
+from similarity_score import get_similarity_matrix
+from resource_registry import resource_registry
+
+logger = logging.getLogger("GenOtoScope_Classify.resource_preload")
+
+# Functions loading the annotation file of a path in the configuration, keyed by name of the path
+RESOURCE_LOADERS: dict[str, Callable[[pathlib.Path], Any]] = {
+    "variant_hotspot_annotation_path": get_region_index,
+    "variant_coldspot_annotation_path": get_region_index,
+    "uniprot_rep_region_path": get_region_index,
+    "critical_region_path": get_region_index,
+    "disease_irrelevant_exons_path": get_region_index,
+    "splice_site_table_path": get_splice_table,
+    "splice_site_table_path_pm5": get_splice_table,
+    "exon_pm5_path": get_exon_pm5_index,
+    "mane_transcript_list_path": get_mane_index,
+    "similarity_score_path": get_similarity_matrix,
+    "clinvar_lof_index_path": get_clinvar_lof_index,
+    "clinvar_codon_index_path": get_clinvar_codon_index,
+}
+
+
+def preload_resources_from_config(config: dict) -> None:
+    """
+    Load annotation files of configuration and of all gene specific configurations into the resource registry
+    Files used by several configurations are loaded once
+    """
+    configs = [config] + [
+        get_gene_specific_config(config, gene)
+        for gene in config.get("gene_specific_configs", {}).keys()
+        if gene != "root"
+    ]
+    for path_config in configs:
+        preload_resources(path_config)
+    preload_clinvar_index_from_config(config)
+    for resource in resource_registry.info():
+        logger.info(
+            f"Resource {resource['kind']} {resource['path']} uses {resource['memory']} bytes."
+        )
+
+
+def preload_resources(config: dict) -> None:
+    """
+    Load annotation files of configuration into the resource registry
+    """
+    class_info = Classification_Info()
+    for info in vars(class_info).values():
+        if (
+            info.group is not Classification_Info_Groups.PATH
+            or info.name not in RESOURCE_LOADERS
+            or not is_in_config(info.config_location, config)
+        ):
+            continue
+        path = get_path_from_config(info.config_location, config)
+        if path is not None:
+            RESOURCE_LOADERS[info.name](path)
+
+
+def is_in_config(config_location: tuple[str, ...], config: dict) -> bool:
+    """
+    Check if configuration contains location
+    """
+    entry = config
+    for key in config_location:
+        if not isinstance(entry, dict) or key not in entry:
+            return False
+        entry = entry[key]
+    return True
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+
+import sys
+import hashlib
+import pathlib
+import logging
+import threading
+from dataclasses import dataclass
+from collections.abc import Callable
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger("GenOtoScope_Classify.resource_registry")
+
+# Files up to this size are checksummed, larger files (e.g. ClinVar VCFs) are identified by modification time and size only
+CHECKSUM_MAX_SIZE = 64 * 1024 * 1024
+
+
+@dataclass
+class Resource:
+    """
+    Annotation file parsed into its in memory form
+    Modification time, size and checksum identify the version of the file the resource was loaded from
+    """
+
+    kind: str
+    path: str
+    value: Any
+    mtime_ns: int
+    size: int
+    checksum: Optional[str]
+    memory: int
+
+
+class Resource_Registry:
+    """
+    Registry of annotation resources keyed by kind and resolved file path
+    Configurations pointing to the same file share the resource
+    A resource is loaded again if the modification time or size of its file changed and the checksum differs
+    """
+
+    def __init__(self):
+        self._resources: dict[tuple[str, str], Resource] = {}
+        self._lock = threading.Lock()
+        self._invalidation_listeners: list[Callable[[str, pathlib.Path], None]] = []
+
+    def add_invalidation_listener(
+        self, listener: Callable[[str, pathlib.Path], None]
+    ) -> None:
+        """
+        Add function called with kind and resolved path of a resource that is dropped, because its file changed
+        Allows caches outside the registry, e.g. opened file handles, to drop state of the old file
+        """
+        with self._lock:
+            self._invalidation_listeners.append(listener)
+
+    def get(
+        self, kind: str, path: pathlib.Path, load: Callable[[pathlib.Path], Any]
+    ) -> Any:
+        """
+        Get resource of file, load it on first access and after the file changed
+        """
+        resource = self.get_current(kind, path)
+        if resource is None:
+            resource = self.load(kind, path, load)
+        return resource.value
+
+    def peek(self, kind: str, path: pathlib.Path) -> Optional[Any]:
+        """
+        Get resource of file if it was loaded and the file did not change since
+        """
+        resource = self.get_current(kind, path)
+        if resource is None:
+            return None
+        return resource.value
+
+    def load(
+        self, kind: str, path: pathlib.Path, load: Callable[[pathlib.Path], Any]
+    ) -> Resource:
+        """
+        Load resource of file, an already loaded resource of the file is replaced
+        """
+        resolved_path = resolve_path(path)
+        stat = resolved_path.stat()
+        value = load(resolved_path)
+        resource = Resource(
+            kind=kind,
+            path=str(resolved_path),
+            value=value,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            checksum=compute_checksum(resolved_path, stat.st_size),
+            memory=estimate_memory(value),
+        )
+        with self._lock:
+            self._resources[(kind, resource.path)] = resource
+        logger.info(
+            f"Loaded {kind} resource {resource.path} using {resource.memory} bytes."
+        )
+        return resource
+
+    def get_current(self, kind: str, path: pathlib.Path) -> Optional[Resource]:
+        """
+        Get loaded resource of file, None if it was not loaded or the file changed
+        """
+        resolved_path = resolve_path(path)
+        key = (kind, str(resolved_path))
+        with self._lock:
+            resource = self._resources.get(key)
+        if resource is None:
+            return None
+        stat = resolved_path.stat()
+        if resource.mtime_ns == stat.st_mtime_ns and resource.size == stat.st_size:
+            return resource
+        if (
+            resource.checksum is not None
+            and resource.size == stat.st_size
+            and resource.checksum == compute_checksum(resolved_path, stat.st_size)
+        ):
+            # File was touched or copied without changing its content
+            resource.mtime_ns = stat.st_mtime_ns
+            return resource
+        logger.info(f"The {kind} resource {resource.path} changed and is dropped.")
+        with self._lock:
+            if self._resources.get(key) is resource:
+                del self._resources[key]
+            listeners = list(self._invalidation_listeners)
+        for listener in listeners:
+            listener(kind, resolved_path)
+        return None
+
+    def info(self) -> list[dict[str, Any]]:
+        """
+        Get kind, path, file size and memory footprint of the loaded resources
+        """
+        with self._lock:
+            resources = list(self._resources.values())
+        return [
+            {
+                "kind": resource.kind,
+                "path": resource.path,
+                "file_size": resource.size,
+                "memory": resource.memory,
+            }
+            for resource in resources
+        ]
+
+    def clear(self) -> None:
+        """
+        Remove all resources
+        """
+        with self._lock:
+            self._resources.clear()
+
+
+def resolve_path(path: pathlib.Path) -> pathlib.Path:
+    """
+    Resolve path, so that different paths to the same file share the resource
+    """
+    return pathlib.Path(path).expanduser().resolve()
+
+
+def get_file_version(path: Optional[pathlib.Path]) -> Optional[tuple[str, int, int]]:
+    """
+    Get resolved path, modification time and size of file, which identify the version of the file
+    None for files that are not configured
+    """
+    if path is None:
+        return None
+    resolved_path = resolve_path(path)
+    stat = resolved_path.stat()
+    return str(resolved_path), stat.st_mtime_ns, stat.st_size
+
+
+def compute_checksum(path: pathlib.Path, size: int) -> Optional[str]:
+    """
+    Compute checksum of file content, None for files larger than CHECKSUM_MAX_SIZE
+    """
+    if size > CHECKSUM_MAX_SIZE:
+        return None
+    checksum = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            checksum.update(chunk)
+    return checksum.hexdigest()
+
+
+def estimate_memory(value: Any, seen: Optional[set[int]] = None) -> int:
+    """
+    Estimate memory used by value and all objects referenced by it in bytes
+    Objects referenced several times are counted once
+    """
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    if isinstance(value, np.ndarray):
+        memory = sys.getsizeof(value) if value.base is None else value.nbytes
+        if value.dtype == object:
+            memory += sum(estimate_memory(entry, seen) for entry in value.flat)
+        return memory
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(np.sum(value.memory_usage(deep=True)))
+    memory = sys.getsizeof(value)
+    if isinstance(value, (str, bytes, int, float, bool)) or value is None:
+        return memory
+    if isinstance(value, dict):
+        memory += sum(
+            estimate_memory(key, seen) + estimate_memory(entry, seen)
+            for key, entry in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        memory += sum(estimate_memory(entry, seen) for entry in value)
+    if hasattr(value, "__dict__"):
+        memory += estimate_memory(vars(value), seen)
+    return memory
+
+
+resource_registry = Resource_Registry()
@@ -2,17 +2,96 @@
 
 import pathlib
 import logging
-import pandas as pd
 from typing import Optional
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
 
 from Bio.Seq import IUPACData
 import hgvs.parser
 
+from resource_registry import resource_registry
+
 hgvs_parser = hgvs.parser.Parser()
 
 logger = logging.getLogger("GenOtoScope_Classify.clinvar.missense")
 
 
+class Similarity_Matrix:
+    """
+    Dense matrix of similarity scores indexed by one letter amino acid codes of reference and alternative amino acid
+    Amino acid pairs missing from the similarity score file are NaN
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        similarity_score = pd.read_csv(path, sep="\t")
+        aa_codes = sorted(
+            set(similarity_score.ref_aa.dropna())
+            | set(similarity_score.alt_aa.dropna())
+        )
+        self.aa_index = {aa: idx for idx, aa in enumerate(aa_codes)}
+        self.scores = np.full((len(aa_codes), len(aa_codes)), np.nan)
+        # Iterate in reverse, so that the first entry of an amino acid pair is kept
+        for ref_aa, alt_aa, score in reversed(
+            list(
+                zip(
+                    similarity_score.ref_aa,
+                    similarity_score.alt_aa,
+                    similarity_score.score,
+                )
+            )
+        ):
+            if ref_aa in self.aa_index and alt_aa in self.aa_index:
+                self.scores[self.aa_index[ref_aa], self.aa_index[alt_aa]] = score
+
+    def get_score(self, ref_aa: str, alt_aa: str) -> Optional[int]:
+        """
+        Get similarity score of amino acid exchange
+        """
+        ref_idx = self.aa_index.get(convert_aa_code(ref_aa, "reference"))
+        alt_idx = self.aa_index.get(convert_aa_code(alt_aa, "alternative"))
+        if ref_idx is None or alt_idx is None:
+            return None
+        score = self.scores[ref_idx, alt_idx]
+        if np.isnan(score):
+            return None
+        return int(score)
+
+    def get_scores(self, ref_aas: Iterable[str], alt_aas: Iterable[str]) -> np.ndarray:
+        """
+        Get similarity scores of amino acid exchanges at once, scores of unknown exchanges are NaN
+        """
+        # Unknown amino acids are mapped to an additional row and column of NaN
+        scores = np.pad(self.scores, ((0, 1), (0, 1)), constant_values=np.nan)
+        unknown_idx = len(self.aa_index)
+        ref_idx = np.array(
+            [
+                self.aa_index.get(convert_aa_code(aa, "reference"), unknown_idx)
+                for aa in ref_aas
+            ],
+            dtype=np.intp,
+        )
+        alt_idx = np.array(
+            [
+                self.aa_index.get(convert_aa_code(aa, "alternative"), unknown_idx)
+                for aa in alt_aas
+            ],
+            dtype=np.intp,
+        )
+        return scores[ref_idx, alt_idx]
+
+
+def get_similarity_matrix(path_similarity_score: pathlib.Path) -> Similarity_Matrix:
+    """
+    Get similarity matrix of similarity score file, load it on first access
+    """
+    return resource_registry.get(
+        "similarity_score", path_similarity_score, Similarity_Matrix
+    )
+
+
 def get_similarity_score_clinvar(
     data: pd.DataFrame, path_similarity_score: pathlib.Path
 ) -> pd.DataFrame:
@@ -20,24 +99,10 @@ def get_similarity_score_clinvar(
     For a set of amino acid exchanges produce the similarity score
     The dataframe expected is created from ClinVar entries
     """
-    similarity_score = pd.read_csv(path_similarity_score, sep="\t")
-    data_similarity_score: pd.DataFrame = data.apply(
-        get_similarity_score_df, similarity_score=similarity_score, axis=1
+    similarity_matrix = get_similarity_matrix(path_similarity_score)
+    return data.assign(
+        similarity_score=similarity_matrix.get_scores(data.prot_ref, data.prot_alt)
     )
-    return data_similarity_score
-
-
-def get_similarity_score_df(
-    clinvar_entry: pd.Series, similarity_score: pd.DataFrame
-) -> pd.Series:
-    """
-    Annotate dataframe
-    """
-    ref_aa = clinvar_entry["prot_ref"]
-    alt_aa = clinvar_entry["prot_alt"]
-    score = look_up_similarity_score(ref_aa, alt_aa, similarity_score)
-    clinvar_entry["similarity_score"] = score
-    return clinvar_entry
 
 
 def get_similarity_score(
@@ -46,37 +111,21 @@ def get_similarity_score(
     """
     Get the Grantham score for the current variant
     """
-    similarity_score = pd.read_csv(path_similarity_score, sep="\t")
+    similarity_matrix = get_similarity_matrix(path_similarity_score)
     ref_aa = var_codon_info["prot_ref"]
     alt_aa = var_codon_info["prot_alt"]
-    score = look_up_similarity_score(ref_aa, alt_aa, similarity_score)
-    return score
+    return similarity_matrix.get_score(ref_aa, alt_aa)
 
 
-def look_up_similarity_score(
-    ref_aa: str, alt_aa: str, similarity_score: pd.DataFrame
-) -> Optional[int]:
+def convert_aa_code(aa: str, aa_type: str) -> str:
     """
-    Check similarity file for score
+    Convert three letter amino acid code to one letter code
     """
-    if len(ref_aa) != 1:
-        try:
-            ref_aa = IUPACData.protein_letters_3to1[ref_aa]
-        except KeyError:
-            raise ValueError(
-                f"For the reference amino acid {ref_aa} no matching one letter amino acid code could be found."
-            )
-    if len(alt_aa) != 1:
-        try:
-            alt_aa = IUPACData.protein_letters_3to1[alt_aa]
-        except KeyError:
-            raise ValueError(
-                f"For the alternative amino acid {alt_aa} no matching one letter amino acid code could be found."
-            )
+    if len(aa) == 1:
+        return aa
     try:
-        score = similarity_score[
-            (similarity_score.ref_aa == ref_aa) & (similarity_score.alt_aa == alt_aa)
-        ].score.values[0]
-        return score
-    except Exception:
-        return None
+        return IUPACData.protein_letters_3to1[aa]
+    except KeyError:
+        raise ValueError(
+            f"For the {aa_type} amino acid {aa} no matching one letter amino acid code could be found."
+        )
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+import pathlib
+import logging
+from typing import NamedTuple, Optional
+
+import pandas as pd
+
+from resource_registry import resource_registry
+
+logger = logging.getLogger("GenOtoScope_Classify.splice_table")
+
+
+class Splice_Table_Entry(NamedTuple):
+    """
+    Classification of splice site variant by VCEP
+    """
+
+    rule_status: bool
+    evidence_strength: str
+    comment: str
+
+
+class Splice_Table:
+    """
+    Splice site classification table of VCEP keyed by c. position and alternative allele
+    If a position or a position and alternative allele is listed multiple times, the first entry is used
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        self.entries: dict[tuple[str, str], Splice_Table_Entry] = {}
+        self.position_entries: dict[str, Splice_Table_Entry] = {}
+        splice_table = pd.read_csv(path, sep="\t")
+        for position, alt, rule_status, evidence_strength, comment in zip(
+            splice_table.position,
+            splice_table.alternative_allele,
+            splice_table.rule_status,
+            splice_table.evidence_strength,
+            splice_table.comment,
+        ):
+            if pd.isna(position):
+                continue
+            entry = Splice_Table_Entry(bool(rule_status), evidence_strength, comment)
+            position = normalize_position(position)
+            self.position_entries.setdefault(position, entry)
+            if not pd.isna(alt):
+                self.entries.setdefault((position, alt), entry)
+
+    def get_entry(self, position, alt: str) -> Optional[Splice_Table_Entry]:
+        """
+        Get entry for c. position and alternative allele
+        """
+        return self.entries.get((normalize_position(position), alt))
+
+    def get_position_entry(self, position) -> Optional[Splice_Table_Entry]:
+        """
+        Get first entry for c. position independent of alternative allele
+        """
+        return self.position_entries.get(normalize_position(position))
+
+
+def normalize_position(position) -> str:
+    """
+    Normalize c. position, e.g. hgvs position or position in splice table, to string without c. prefix
+    """
+    return str(position).strip().removeprefix("c.")
+
+
+def get_splice_table(path_splice_table: pathlib.Path) -> Splice_Table:
+    """
+    Get splice table, the table is parsed on first access and after the file was modified
+    """
+    return resource_registry.get("splice_table", path_splice_table, Splice_Table)
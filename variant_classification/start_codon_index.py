@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+import re
+import logging
+from bisect import bisect_left
+from typing import Union
+
+import pyensembl
+
+from variant_coding_sequence import Variant_Coding_Sequence
+from transcript_cache import get_transcript_cached
+
+logger = logging.getLogger("GenOtoScope_Classify.start_codon_index")
+
+START_CODON = "ATG"
+
+# Matches codon by codon from the sequence start up to the first in frame start codon
+START_CODON_PATTERN = re.compile(r"(?:...)*?ATG", re.DOTALL)
+
+
+class Start_Codon_Index:
+    """
+    Positions (0-based) of all ATG in the reference coding sequence of a transcript
+    Positions are sorted and grouped by reading frame (position % 3)
+    """
+
+    def __init__(self, transcript: pyensembl.transcript.Transcript):
+        self.coding_sequence = transcript.coding_sequence
+        self.atg_positions = ([], [], [])
+        pos = self.coding_sequence.find(START_CODON)
+        while pos != -1:
+            self.atg_positions[pos % 3].append(pos)
+            pos = self.coding_sequence.find(START_CODON, pos + 1)
+
+    def find_start_codon(
+        self, var_coding_seq: Union[str, Variant_Coding_Sequence]
+    ) -> int:
+        """
+        Find first in frame start codon in observed coding sequence
+        Reference segments of the observed sequence are looked up in the ATG positions, only inserted sequences and codons spanning two segments are read
+        Return 0-based codon index, -1 if no start codon is found
+        """
+        if not isinstance(var_coding_seq, Variant_Coding_Sequence):
+            match = START_CODON_PATTERN.match(var_coding_seq)
+            return -1 if match is None else (match.end() - 3) // 3
+        if not self._is_indexed(var_coding_seq.reference):
+            return var_coding_seq.find_codon(START_CODON_PATTERN)
+        for (
+            segment_start,
+            source,
+            source_start,
+            source_end,
+        ) in var_coding_seq.segments():
+            segment_end = segment_start + source_end - source_start
+            first_codon_start = segment_start + (-segment_start) % 3
+            if source is var_coding_seq.reference:
+                frame = (source_start - segment_start) % 3
+                positions = self.atg_positions[frame]
+                idx = bisect_left(positions, source_start)
+                if idx < len(positions) and positions[idx] + 3 <= source_end:
+                    return (segment_start + positions[idx] - source_start) // 3
+                # only the codon spanning into the next segment is left
+                first_codon_start = max(
+                    first_codon_start,
+                    segment_end - (segment_end - first_codon_start) % 3,
+                )
+            for codon_start in range(first_codon_start, segment_end, 3):
+                if var_coding_seq[codon_start : codon_start + 3] == START_CODON:
+                    return codon_start // 3
+        return -1
+
+    def _is_indexed(self, reference: str) -> bool:
+        return reference is self.coding_sequence or reference == self.coding_sequence
+
+
+def get_start_codon_index(
+    transcript: pyensembl.transcript.Transcript,
+) -> Start_Codon_Index:
+    """
+    Get ATG positions of transcript, the index is created on first use and kept on the transcript object
+    """
+    return get_transcript_cached(transcript, "start_codon_index", Start_Codon_Index)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+import re
+import logging
+from typing import Union
+
+import pyensembl
+
+from variant_coding_sequence import Variant_Coding_Sequence
+from transcript_cache import get_transcript_cached
+
+logger = logging.getLogger("GenOtoScope_Classify.termination_codon")
+
+# Matches codon by codon from the search start up to the first in frame termination codon
+TERMINATION_CODON_PATTERN = re.compile(r"(?:...)*?(?:TAG|TAA|TGA)", re.DOTALL)
+
+# Most 3' 50 bases ~= 50/3 = 17 codons of penultimate exon are searched for termination codons
+PENULTIMATE_EXON_CODONS = 17
+
+
+def find_termination_codon(
+    sequence: Union[str, Variant_Coding_Sequence], start: int = 0
+) -> int:
+    """
+    Find first in frame termination codon in sequence, reading frame starts at start
+    Return 0-based codon index relative to start, -1 if no termination codon is found
+    """
+    if isinstance(sequence, str):
+        match = TERMINATION_CODON_PATTERN.match(sequence, start)
+        if match is None:
+            return -1
+        return (match.end() - 3 - start) // 3
+    return sequence.find_codon(TERMINATION_CODON_PATTERN, start)
+
+
+def get_num_codons(sequence_length: int) -> int:
+    """
+    Number of codons in sequence, including a last incomplete codon
+    """
+    return -(-sequence_length // 3)
+
+
+def search_termination_codon(
+    sequence: Union[str, Variant_Coding_Sequence], is_penultimate_exon: bool
+) -> tuple:
+    """
+    Search termination codon in exon coding sequence
+    For penultimate exons only the last 17 codons are searched
+
+    Returns
+    -------
+    bool
+        termination codon exists in exon codons (True), otherwise it doesn't (False)
+    int
+        termination codon index (1-index) in searched codons, -1 if termination codon doesn't exist
+        a termination codon in the last searched codon is not reported
+    """
+    num_codons = get_num_codons(len(sequence))
+    if is_penultimate_exon:
+        logger.debug("Search termination codon in penultimate exon")
+        # window of codons follows slicing of codon list by len(codons) - 17
+        search_start = num_codons - PENULTIMATE_EXON_CODONS
+        if search_start < 0:
+            search_start = max(search_start + num_codons, 0)
+    else:
+        search_start = 0
+    num_searched_codons = num_codons - search_start
+    termination_codon_index = find_termination_codon(sequence, search_start * 3) + 1
+    if termination_codon_index in [0, num_searched_codons]:
+        logger.debug("Termination codon found: False")
+        return False, -1
+    logger.debug("Termination codon found: True")
+    return True, termination_codon_index
+
+
+def get_utr_termination_codons(
+    ref_transcript: pyensembl.transcript.Transcript,
+) -> tuple[int, int, int]:
+    """
+    Get first termination codon in 3' UTR of reference transcript for each reading frame offset
+    Termination codons are given as position in 3' UTR, -1 if reading frame contains no termination codon
+    Positions are computed on first use and kept on the transcript object
+    """
+    return get_transcript_cached(
+        ref_transcript, "utr_termination_codons", find_utr_termination_codons
+    )
+
+
+def find_utr_termination_codons(
+    ref_transcript: pyensembl.transcript.Transcript,
+) -> tuple[int, int, int]:
+    """
+    Find first termination codon in 3' UTR of reference transcript for each reading frame offset
+    """
+    utr = ref_transcript.three_prime_utr_sequence
+    utr_termination_codons = []
+    for frame in range(3):
+        codon_index = find_termination_codon(utr, frame)
+        if codon_index == -1:
+            utr_termination_codons.append(-1)
+        else:
+            utr_termination_codons.append(frame + 3 * codon_index)
+    return tuple(utr_termination_codons)
+
+
+def find_termination_codon_with_utr(
+    ref_transcript: pyensembl.transcript.Transcript,
+    var_coding_seq: Union[str, Variant_Coding_Sequence],
+) -> int:
+    """
+    Find first in frame termination codon in observed coding sequence followed by the reference 3' UTR
+    Only the observed coding sequence and the codon spanning into the 3' UTR are scanned,
+    the 3' UTR is looked up in the precomputed termination codons of the reference transcript
+    Return termination codon index (1-index), 0 if no termination codon is found or it is the last codon
+    """
+    utr_length = len(ref_transcript.three_prime_utr_sequence)
+    num_codons = get_num_codons(len(var_coding_seq) + utr_length)
+    termination_codon_index = find_termination_codon(var_coding_seq)
+    if termination_codon_index == -1:
+        incomplete_length = len(var_coding_seq) % 3
+        utr_frame = (3 - incomplete_length) % 3
+        if incomplete_length != 0:
+            spanning_codon = (
+                var_coding_seq[-incomplete_length:]
+                + ref_transcript.three_prime_utr_sequence[:utr_frame]
+            )
+            if find_termination_codon(spanning_codon) == 0:
+                termination_codon_index = len(var_coding_seq) // 3
+        if termination_codon_index == -1:
+            utr_termination_codon = get_utr_termination_codons(ref_transcript)[
+                utr_frame
+            ]
+            if utr_termination_codon != -1:
+                termination_codon_index = (
+                    len(var_coding_seq) + utr_termination_codon
+                ) // 3
+    if termination_codon_index == -1 or termination_codon_index + 1 == num_codons:
+        return 0
+    return termination_codon_index + 1
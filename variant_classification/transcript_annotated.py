@@ -6,19 +6,18 @@ import pyensembl
 import pathlib
 import logging
 from dataclasses import dataclass, field
+from functools import partial
 from collections.abc import Callable
 from typing import Optional
 
 from variant import VariantInfo, TranscriptInfo, Variant
-from ensembl import ensembl
+from ensembl import get_transcript
 from genotoscope_construct_variant_sequence import (
     construct_variant_coding_seq_exonic_variant,
-    construct_variant_coding_seq_intronic_variant,
 )
 from genotoscope_assess_NMD import (
     assess_NMD_threshold,
-    assess_NMD_exonic_variant,
-    assess_NMD_intronic_variant,
+    assess_NMD_boundary,
     get_affected_exon,
 )
 from genotoscope_reading_frame_preservation import (
@@ -42,9 +41,9 @@ from clinvar_region import (
     check_clinvar_start_alt_start,
     check_clinvar_truncated_region,
 )
-from genotoscope_exon_skipping import assess_exon_skipping
-from genotoscope_protein_len_diff_repetitive_region import (
-    check_prot_len_change_in_repetitive_region_exon,
+from exon_skipping_table import (
+    get_exon_skipping_consequence,
+    get_exon_skipping_region_verdict,
 )
 from genotoscope_exists_alternative_start_codon import (
     assess_alternative_start_codon,
@@ -57,10 +56,20 @@ from check_exon_disease_relevant import check_exon_disease_relevant
 from var_type import VARTYPE_GROUPS
 from information import Classification_Info, Info
 
-
 logger = logging.getLogger("GenOtoScope_Classify.config_annotation")
 
 
+def annotate_with_clinvar_lof_index(
+    annotate: Callable[..., TranscriptInfo_annot],
+    path_clinvar_lof_index: Optional[pathlib.Path],
+    *args,
+) -> TranscriptInfo_annot:
+    """
+    Pass path to ClinVar loss of function index as keyword argument to annotate
+    """
+    return annotate(*args, path_clinvar_lof_index=path_clinvar_lof_index)
+
+
 @dataclass
 class TranscriptInfo_annot(TranscriptInfo):
     """
@@ -135,8 +144,9 @@ class TranscriptInfo_exonic(TranscriptInfo_annot):
         cls, class_info: Classification_Info
     ) -> tuple[Callable, tuple[Info, ...]]:
         return (
-            cls.annotate,
+            partial(annotate_with_clinvar_lof_index, cls.annotate),
             (
+                class_info.CLINVAR_LOF_INDEX_PATH,
                 class_info.VARIANT,
                 class_info.CLINVAR_PATH,
                 class_info.CLINVAR_PATH_INDEL,
@@ -158,12 +168,13 @@ class TranscriptInfo_exonic(TranscriptInfo_annot):
         path_disease_irrelevant_exons: Optional[pathlib.Path],
         nmd_threshold_dict: Optional[dict[str, int]],
         transcript: TranscriptInfo,
+        path_clinvar_lof_index: Optional[pathlib.Path] = None,
     ) -> TranscriptInfo_exonic:
         """
         Perform annotation for exonic variants
         """
         try:
-            ref_transcript = ensembl.transcript_by_id(transcript.transcript_id)
+            ref_transcript = get_transcript(transcript.transcript_id)
         except ValueError:
             raise Pyensembl_transcript_not_found
         try:
@@ -195,8 +206,8 @@ class TranscriptInfo_exonic(TranscriptInfo_annot):
                 transcript, variant, ptc, ref_transcript, diff_len, nmd_threshold
             )
         else:
-            is_NMD, NMD_affected_exons = assess_NMD_exonic_variant(
-                transcript, variant, ref_transcript, var_seq, diff_len
+            is_NMD, NMD_affected_exons = assess_NMD_boundary(
+                transcript, variant, ptc, ref_transcript, var_seq, diff_len
             )
         if path_critical_region is not None:
             # Check if variant is located in defined functionally relevant region from ACMG guidelines
@@ -224,7 +235,11 @@ class TranscriptInfo_exonic(TranscriptInfo_annot):
         else:
             if is_NMD:
                 truncated_exon_ClinVar = check_clinvar_NMD_exon(
-                    variant, NMD_affected_exons, path_clinvar_snv, path_clinvar_indel
+                    variant,
+                    NMD_affected_exons,
+                    path_clinvar_snv,
+                    path_clinvar_indel,
+                    path_clinvar_lof_index,
                 )
                 is_truncated_exon_relevant = truncated_exon_ClinVar.pathogenic
                 comment_truncated_exon_relevant = f"The following relevant ClinVar are (likely) pathogenic: {truncated_exon_ClinVar.ids}"
@@ -234,6 +249,7 @@ class TranscriptInfo_exonic(TranscriptInfo_annot):
                     ref_transcript,
                     path_clinvar_snv,
                     path_clinvar_indel,
+                    path_clinvar_lof_index,
                 )
                 is_truncated_exon_relevant = truncated_exon_ClinVar.pathogenic
                 comment_truncated_exon_relevant = f"The following relevant ClinVar are (likely) pathogenic: {truncated_exon_ClinVar.ids}"
@@ -310,7 +326,7 @@ class TranscriptInfo_exonic_inframe(TranscriptInfo_annot):
         Perform annotation for exonic inframe variants
         """
         try:
-            ref_transcript = ensembl.transcript_by_id(transcript.transcript_id)
+            ref_transcript = get_transcript(transcript.transcript_id)
         except ValueError:
             raise Pyensembl_transcript_not_found
         try:
@@ -393,8 +409,9 @@ class TranscriptInfo_intronic(TranscriptInfo_annot):
         cls, class_info: Classification_Info
     ) -> tuple[Callable, tuple[Info, ...]]:
         return (
-            cls.annotate,
+            partial(annotate_with_clinvar_lof_index, cls.annotate),
             (
+                class_info.CLINVAR_LOF_INDEX_PATH,
                 class_info.VARIANT,
                 class_info.CLINVAR_PATH,
                 class_info.CLINVAR_PATH_INDEL,
@@ -414,90 +431,32 @@ class TranscriptInfo_intronic(TranscriptInfo_annot):
         path_disease_irrelevant_exons: Optional[pathlib.Path],
         path_critical_region: Optional[pathlib.Path],
         transcript: TranscriptInfo,
+        path_clinvar_lof_index: Optional[pathlib.Path] = None,
     ) -> TranscriptInfo_intronic:
         """
         Perform annotation specific for intronic variants
         """
         try:
-            ref_transcript = ensembl.transcript_by_id(transcript.transcript_id)
+            ref_transcript = get_transcript(transcript.transcript_id)
         except ValueError:
             raise Pyensembl_transcript_not_found
         try:
             ref_transcript.coding_sequence
         except ValueError or AttributeError:
             raise Pyensembl_no_coding_sequence
-        (
-            exons_skipped,
-            are_exons_skipped,
-            skipped_exon_start,
-            skipped_exon_end,
-            start_codon_exon_skipped,
-            stop_codon_exon_skipped,
-            coding_exon_skipped,
-        ) = assess_exon_skipping(transcript, variant, ref_transcript)
-        var_seq, diff_len = construct_variant_coding_seq_intronic_variant(
-            transcript,
-            variant,
-            ref_transcript,
-            skipped_exon_start,
-            skipped_exon_end,
-            are_exons_skipped,
-            start_codon_exon_skipped,
-            stop_codon_exon_skipped,
-            coding_exon_skipped,
-        )
-        is_NMD, NMD_affected_exons = assess_NMD_intronic_variant(
+        consequence = get_exon_skipping_consequence(transcript, variant, ref_transcript)
+        region_verdict = get_exon_skipping_region_verdict(
             transcript,
             variant,
             ref_transcript,
-            are_exons_skipped,
-            exons_skipped,
-            start_codon_exon_skipped,
-            stop_codon_exon_skipped,
-            coding_exon_skipped,
-            var_seq,
-            diff_len,
+            consequence,
+            path_clinvar_snv,
+            path_clinvar_indel,
+            path_clinvar_lof_index,
+            path_uniprot_rep,
+            path_disease_irrelevant_exons,
+            path_critical_region,
         )
-        if path_critical_region is not None:
-            (
-                is_truncated_region_disease_relevant,
-                comment_truncated_region_disease_relevant,
-            ) = check_variant_in_critical_region_exon(
-                variant,
-                ref_transcript,
-                NMD_affected_exons,
-                path_critical_region,
-            )
-        else:
-            skipped_exon_ClinVar = check_clinvar_NMD_exon(
-                variant, NMD_affected_exons, path_clinvar_snv, path_clinvar_indel
-            )
-            is_truncated_region_disease_relevant = skipped_exon_ClinVar.pathogenic
-            comment_truncated_region_disease_relevant = f"The following relevant ClinVar are (likely) pathogenic: {skipped_exon_ClinVar.ids}"
-        if not NMD_affected_exons:
-            affected_exon = get_affected_exon(
-                ref_transcript, transcript, variant, diff_len
-            )[0]
-        else:
-            affected_exon = NMD_affected_exons[0]
-        if is_NMD and path_disease_irrelevant_exons is not None:
-            is_affected_exon_disease_relevant = check_exon_disease_relevant(
-                path_disease_irrelevant_exons, NMD_affected_exons
-            )
-        else:
-            is_affected_exon_disease_relevant = True
-        is_reading_frame_preserved, _ = assess_reading_frame_preservation(diff_len)
-        diff_len_protein_percent, ptc = calculate_prot_len_diff(
-            ref_transcript, var_seq, diff_len
-        )
-        if diff_len != 0:
-            len_change_in_repetitive_region = (
-                check_prot_len_change_in_repetitive_region_exon(
-                    variant, ref_transcript, NMD_affected_exons, path_uniprot_rep
-                )
-            )
-        else:
-            len_change_in_repetitive_region = False
         return TranscriptInfo_intronic(
             transcript_id=transcript.transcript_id,
             var_type=transcript.var_type,
@@ -508,18 +467,18 @@ class TranscriptInfo_intronic(TranscriptInfo_annot):
             exon=transcript.exon,
             intron=transcript.intron,
             ref_transcript=ref_transcript,
-            diff_len_protein_percent=diff_len_protein_percent,
-            ptc=ptc,
-            are_exons_skipped=are_exons_skipped,
-            coding_exon_skipped=coding_exon_skipped,
-            start_codon_exon_skipped=start_codon_exon_skipped,
-            len_change_in_repetitive_region=len_change_in_repetitive_region,
-            is_NMD=is_NMD,
-            affected_exon=affected_exon,
-            is_truncated_region_disease_relevant=is_truncated_region_disease_relevant,
-            is_affected_exon_disease_relevant=is_affected_exon_disease_relevant,
-            comment_truncated_region=comment_truncated_region_disease_relevant,
-            is_reading_frame_preserved=is_reading_frame_preserved,
+            diff_len_protein_percent=consequence.diff_len_protein_percent,
+            ptc=consequence.ptc,
+            are_exons_skipped=consequence.are_exons_skipped,
+            coding_exon_skipped=consequence.coding_exon_skipped,
+            start_codon_exon_skipped=consequence.start_codon_exon_skipped,
+            len_change_in_repetitive_region=region_verdict.len_change_in_repetitive_region,
+            is_NMD=consequence.is_NMD,
+            affected_exon=consequence.affected_exon,
+            is_truncated_region_disease_relevant=region_verdict.is_truncated_region_disease_relevant,
+            is_affected_exon_disease_relevant=region_verdict.is_affected_exon_disease_relevant,
+            comment_truncated_region=region_verdict.comment_truncated_region,
+            is_reading_frame_preserved=consequence.is_reading_frame_preserved,
         )
 
 
@@ -556,7 +515,7 @@ class TranscriptInfo_start_loss(TranscriptInfo_annot):
         transcript: TranscriptInfo,
     ) -> TranscriptInfo_start_loss:
         try:
-            ref_transcript = ensembl.transcript_by_id(transcript.transcript_id)
+            ref_transcript = get_transcript(transcript.transcript_id)
         except ValueError:
             raise Pyensembl_transcript_not_found
         try:
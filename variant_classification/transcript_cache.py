@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+
+from collections.abc import Callable
+from typing import Any
+
+import pyensembl
+
+
+def get_transcript_cached(
+    transcript: pyensembl.transcript.Transcript,
+    name: str,
+    factory: Callable[[pyensembl.transcript.Transcript], Any],
+) -> Any:
+    """
+    Get value derived from transcript, the value is created by factory on first use and kept on the transcript object
+    Values are stored as attribute "_{name}", so they are dropped together with the transcript
+    """
+    key = f"_{name}"
+    value = transcript.__dict__.get(key)
+    if value is None:
+        value = factory(transcript)
+        transcript.__dict__[key] = value
+    return value
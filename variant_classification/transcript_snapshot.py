@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+
+import json
+import mmap
+import pathlib
+import logging
+from typing import Optional
+
+import pyensembl
+
+from ensembl import ensembl, Transcript_Model, transcript_sources, transcript_cache
+
+logger = logging.getLogger("GenOtoScope_Classify.transcript_snapshot")
+
+# Values exported as list of ranges, JSON turns the ranges into lists
+SNAPSHOT_RANGES = ["exon_intervals", "coding_sequence_position_ranges"]
+
+
+class Snapshot_Value:
+    """
+    Transcript property read from the snapshot instead of the Ensembl database
+    Properties that could not be determined on export raise the original ValueError
+    """
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, transcript, owner=None):
+        if transcript is None:
+            return self
+        value = transcript.snapshot_values[self.name]
+        if isinstance(value, dict) and "error" in value:
+            raise ValueError(value["error"])
+        return value
+
+
+class Snapshot_Sequence:
+    """
+    Transcript sequence read lazily from the memory mapped snapshot
+    """
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, transcript, owner=None):
+        if transcript is None:
+            return self
+        if self.name not in transcript.__dict__:
+            location = transcript.snapshot_sequences[self.name]
+            transcript.__dict__[self.name] = transcript.snapshot.get_sequence(location)
+        return transcript.__dict__[self.name]
+
+
+class Snapshot_Transcript(Transcript_Model):
+    """
+    Transcript restored from a transcript snapshot
+    All properties used in the classification are answered without access to the Ensembl database
+    """
+
+    exon_intervals = Snapshot_Value()
+    contains_start_codon = Snapshot_Value()
+    contains_stop_codon = Snapshot_Value()
+    start_codon_complete = Snapshot_Value()
+    stop_codon_complete = Snapshot_Value()
+    start_codon_positions = Snapshot_Value()
+    stop_codon_positions = Snapshot_Value()
+    coding_sequence_position_ranges = Snapshot_Value()
+    transcript_version = Snapshot_Value()
+    protein_id = Snapshot_Value()
+    sequence = Snapshot_Sequence()
+    protein_sequence = Snapshot_Sequence()
+
+    @property
+    def gene(self) -> pyensembl.gene.Gene:
+        return self.snapshot.get_gene(self.gene_id)
+
+
+class Transcript_Snapshot:
+    """
+    Transcripts of a gene panel exported by install_dependencies/data_create_transcript_snapshot.py
+    The JSON header is parsed on load, sequences stay in the memory mapped file until accessed
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = pathlib.Path(path).expanduser()
+        with open(self.path, "rb") as snapshot_file:
+            self._mmap = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+        header_end = self._mmap.find(b"\n")
+        if header_end == -1:
+            raise ValueError(f"{self.path} is not a transcript snapshot.")
+        header = json.loads(self._mmap[:header_end])
+        self.release = header["release"]
+        self.genes = header["genes"]
+        self.transcripts = header["transcripts"]
+        self._sequence_start = header_end + 1
+        self._genes: dict[str, pyensembl.gene.Gene] = {}
+
+    def __contains__(self, transcript_id: str) -> bool:
+        return transcript_id in self.transcripts
+
+    def get_transcript(self, transcript_id: str) -> Optional[Snapshot_Transcript]:
+        """
+        Restore transcript from snapshot, return None if transcript is not in snapshot
+        """
+        entry = self.transcripts.get(transcript_id)
+        if entry is None:
+            return None
+        transcript = Snapshot_Transcript(
+            transcript_id=transcript_id,
+            transcript_name=entry["transcript_name"],
+            contig=entry["contig"],
+            start=entry["start"],
+            end=entry["end"],
+            strand=entry["strand"],
+            biotype=entry["biotype"],
+            gene_id=entry["gene_id"],
+            genome=ensembl,
+            support_level=entry["support_level"],
+        )
+        transcript.snapshot = self
+        transcript.snapshot_values = restore_values(entry["values"])
+        transcript.snapshot_sequences = entry["sequences"]
+        transcript._exons = [
+            pyensembl.exon.Exon(
+                exon_id=exon_id,
+                contig=entry["contig"],
+                start=start,
+                end=end,
+                strand=entry["strand"],
+                gene_name=self.genes[entry["gene_id"]]["gene_name"],
+                gene_id=entry["gene_id"],
+            )
+            for exon_id, start, end in entry["exons"]
+        ]
+        return transcript
+
+    def get_gene(self, gene_id: str) -> pyensembl.gene.Gene:
+        """
+        Restore gene with all its transcripts from snapshot
+        """
+        if gene_id not in self._genes:
+            entry = self.genes[gene_id]
+            gene = pyensembl.gene.Gene(
+                gene_id=gene_id,
+                gene_name=entry["gene_name"],
+                contig=entry["contig"],
+                start=entry["start"],
+                end=entry["end"],
+                strand=entry["strand"],
+                biotype=entry["biotype"],
+                genome=ensembl,
+            )
+            gene._transcripts = [
+                self.get_transcript(transcript_id)
+                for transcript_id in entry["transcripts"]
+            ]
+            self._genes[gene_id] = gene
+        return self._genes[gene_id]
+
+    def get_sequence(self, location: Optional[list[int]]) -> Optional[str]:
+        """
+        Read sequence at offset and length from snapshot
+        """
+        if location is None:
+            return None
+        offset, length = location
+        start = self._sequence_start + offset
+        return self._mmap[start : start + length].decode()
+
+
+def restore_values(values: dict) -> dict:
+    """
+    Turn ranges back into tuples as returned by pyensembl
+    """
+    restored = dict(values)
+    for name in SNAPSHOT_RANGES:
+        if isinstance(restored.get(name), list):
+            restored[name] = [tuple(interval) for interval in restored[name]]
+    return restored
+
+
+def use_transcript_snapshot(path: pathlib.Path) -> Transcript_Snapshot:
+    """
+    Load transcript snapshot and use it as first source of transcripts
+    Transcripts missing from the snapshot are still loaded from Ensembl
+    """
+    snapshot = Transcript_Snapshot(path)
+    if snapshot.release != ensembl.release:
+        logger.warning(
+            f"Transcript snapshot {snapshot.path} was created from Ensembl release {snapshot.release}, expected {ensembl.release}."
+        )
+    transcript_sources.insert(0, snapshot.get_transcript)
+    transcript_cache.clear()
+    logger.info(
+        f"Loaded {len(snapshot.transcripts)} transcripts from snapshot {snapshot.path}"
+    )
+    return snapshot
@@ -5,10 +5,9 @@ from typing import Optional
 
 import pyensembl
 
-import pandas as pd
-
-from pybedtools import BedTool, Interval
 from variant import TranscriptInfo, VariantInfo
+from region_index import Region, get_region_index
+from mane_index import get_mane_index
 
 
 def check_bed_intersect_start_loss(
@@ -43,60 +42,44 @@ def check_intersection_with_bed(
     """
     Check if variant overlaps UniProt annotated repetitive region
     """
-    variant_interval = BedTool(
-        create_bed_line(variant, gen_start, gen_end, ref_transcript.strand),
-        from_string=True,
-    )[0]
-    bed = BedTool(path_bed).sort()
-    annotation_hits = bed.all_hits(variant_interval, same_strand=True)
+    annotation_hits = get_region_index(path_bed).get_overlaps(
+        "chr" + str(variant.chr), gen_start, gen_end, ref_transcript.strand
+    )
     if len(annotation_hits) > 0:
-        comment = create_comment_from_bed_file(annotation_hits, path_bed)
+        comment = create_comment_from_bed_hits(annotation_hits)
         return True, comment
     return False, ""
 
 
-def create_bed_line(
-    variant: VariantInfo, gen_start: int, gen_end: int, transcript_strand: str
-) -> str:
+def check_intersections_with_bed(
+    variant: VariantInfo,
+    intervals: list[tuple[int, int]],
+    ref_transcript: pyensembl.transcript.Transcript,
+    path_bed: pathlib.Path,
+) -> list[tuple[bool, str]]:
     """
-    Create bed line to represent variant info
-    Credits: http://daler.github.io/pybedtools/intervals.html
+    Check if regions overlap regions in bed file, all regions are queried at once
     """
-    bed_line = " ".join(
-        [
-            "chr" + str(variant.chr),
-            str(gen_start),
-            str(gen_end),
-            variant.gene_name,
-            ".",
-            transcript_strand,
-        ]
+    annotation_hits = get_region_index(path_bed).get_overlaps_batch(
+        "chr" + str(variant.chr), intervals, ref_transcript.strand
     )
-    return bed_line
+    return [
+        (True, create_comment_from_bed_hits(hits)) if len(hits) > 0 else (False, "")
+        for hits in annotation_hits
+    ]
 
 
-def create_comment_from_bed_file(hits: list[Interval], path_bed: pathlib.Path) -> str:
+def create_comment_from_bed_hits(hits: list[Region]) -> str:
     """
     From intersections with bed file, create a comment
     """
-    bed = pd.read_csv(path_bed, sep="\t")
-    hits_df = pd.DataFrame()
+    comments = []
     for hit in hits:
-        chr = hit[0]
-        start = int(hit[1])
-        end = int(hit[2])
-        bed_entries = bed[
-            (bed["#chr"] == chr) & (bed["start"] == start) & (bed["end"] == end)
-        ]
-        hits_df = pd.concat([hits_df, bed_entries])
-    if "domain_name" in bed.columns:
-        hits_df["comment"] = hits_df["domain_name"] + " in " + hits_df["gene"]
-        comment = " ".join(hits_df.comment)
-    elif "comment" in bed.columns:
-        comment = " ".join(hits_df.comment)
-    else:
-        comment = ""
-    return comment
+        if "domain_name" in hit.fields:
+            comments.append(hit.fields["domain_name"] + " in " + hit.fields["gene"])
+        elif "comment" in hit.fields:
+            comments.append(hit.fields["comment"])
+    return " ".join(comments)
 
 
 def select_mane_transcript(
@@ -105,9 +88,8 @@ def select_mane_transcript(
     """
     From a list of transcripts select the MANE transcript
     """
-    mane_transcripts_df = pd.read_csv(mane_path, sep="\t")
-    mane_transcripts = mane_transcripts_df.transcript.dropna()
+    mane_index = get_mane_index(mane_path)
     for transcript in transcripts:
-        if any(mane_transcripts.str.contains(transcript.transcript_id)):
+        if mane_index.is_mane(transcript.transcript_id):
             return transcript
     return None
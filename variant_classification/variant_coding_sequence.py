@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+
+import re
+import logging
+from collections.abc import Iterator, Sequence
+from typing import Union
+
+logger = logging.getLogger("GenOtoScope_Classify.variant_coding_sequence")
+
+
+class Variant_Coding_Sequence:
+    """
+    Observed coding sequence represented as reference coding sequence and edits
+    Each edit (start, end, insertion) replaces reference[start:end] by insertion, positions follow python slicing
+    Edits are applied in order, the reference sequence is never copied
+    Slicing returns str, only the requested part of the sequence is created
+    """
+
+    def __init__(self, reference: str, edits: Sequence[tuple[int, int, str]] = ()):
+        self.reference = reference
+        self.edits = []
+        # segments of observed sequence: (source sequence, start, end)
+        self._segments = []
+        pos = 0
+        for start, end, insertion in edits:
+            start = slice(start, None).indices(len(reference))[0]
+            end = slice(end, None).indices(len(reference))[0]
+            self.edits.append((start, end, insertion))
+            self._add_segment(reference, pos, start)
+            self._add_segment(insertion, 0, len(insertion))
+            pos = end
+        self._add_segment(reference, pos, len(reference))
+        self._segment_starts = []
+        length = 0
+        for _, start, end in self._segments:
+            self._segment_starts.append(length)
+            length += end - start
+        self._length = length
+
+    def _add_segment(self, source: str, start: int, end: int) -> None:
+        if end > start:
+            self._segments.append((source, start, end))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __str__(self) -> str:
+        return self[:]
+
+    def __repr__(self) -> str:
+        return f"Variant_Coding_Sequence(length={self._length}, edits={self.edits})"
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (str, Variant_Coding_Sequence)):
+            return len(self) == len(other) and str(self) == str(other)
+        return NotImplemented
+
+    def __getitem__(self, key: Union[int, slice]) -> str:
+        if isinstance(key, int):
+            if key < 0:
+                key += self._length
+            if not 0 <= key < self._length:
+                raise IndexError("Variant_Coding_Sequence index out of range")
+            return self._get_range(key, key + 1)
+        start, stop, step = key.indices(self._length)
+        if step != 1:
+            return str(self)[key]
+        return self._get_range(start, stop)
+
+    def _get_range(self, start: int, stop: int) -> str:
+        """
+        Get observed sequence from start to stop, both are positions in observed sequence
+        """
+        parts = []
+        for segment_start, (source, source_start, source_end) in zip(
+            self._segment_starts, self._segments
+        ):
+            segment_end = segment_start + source_end - source_start
+            if segment_end <= start:
+                continue
+            if segment_start >= stop:
+                break
+            part_start = source_start + max(start - segment_start, 0)
+            part_end = source_start + min(stop, segment_end) - segment_start
+            parts.append(source[part_start:part_end])
+        return "".join(parts)
+
+    def segments(self) -> Iterator[tuple[int, str, int, int]]:
+        """
+        Iterate over segments of observed sequence as (observed start, source sequence, source start, source end)
+        Source sequence is either the reference or an insertion
+        """
+        for segment_start, (source, source_start, source_end) in zip(
+            self._segment_starts, self._segments
+        ):
+            yield segment_start, source, source_start, source_end
+
+    def upper(self) -> "Variant_Coding_Sequence":
+        """
+        Observed sequence in upper case, the reference is only copied if it contains lower case characters
+        """
+        reference = self.reference
+        if not reference.isupper():
+            reference = reference.upper()
+        return Variant_Coding_Sequence(
+            reference,
+            [(start, end, insertion.upper()) for start, end, insertion in self.edits],
+        )
+
+    def is_reference(self) -> bool:
+        """
+        Check if observed sequence equals reference sequence ignoring case
+        """
+        if self._length != len(self.reference):
+            return False
+        if all(end - start == len(insertion) for start, end, insertion in self.edits):
+            return all(
+                self.reference[start:end].upper() == insertion.upper()
+                for start, end, insertion in self.edits
+            )
+        return str(self).upper() == self.reference.upper()
+
+    def iter_codons(self, start: int = 0) -> Iterator[str]:
+        """
+        Iterate over codons of observed sequence, starting at start
+        """
+        for pos in range(start, self._length, 3):
+            yield self._get_range(pos, pos + 3)
+
+    def find_codon(self, pattern: re.Pattern, start: int = 0) -> int:
+        """
+        Find first in frame codon matched by pattern, reading frame starts at start
+        Pattern has to match codon by codon up to the searched codon, e.g. (?:...)*?ATG
+        Segments are searched in place, only codons spanning two segments are created
+        Return 0-based codon index relative to start, -1 if no codon is found
+        """
+        carry = ""
+        for segment_start, (source, source_start, source_end) in zip(
+            self._segment_starts, self._segments
+        ):
+            segment_end = segment_start + source_end - source_start
+            if segment_end <= start:
+                continue
+            pos = source_start + max(start - segment_start, 0)
+            if carry:
+                # complete codon spanning previous segment
+                missing = 3 - len(carry)
+                codon = carry + source[pos : min(pos + missing, source_end)]
+                pos = min(pos + missing, source_end)
+                if len(codon) < 3:
+                    carry = codon
+                    continue
+                carry = ""
+                if pattern.fullmatch(codon):
+                    codon_start = segment_start + pos - source_start - 3
+                    return (codon_start - start) // 3
+            match = pattern.match(source, pos, source_end)
+            if match is not None:
+                codon_start = segment_start + match.end() - 3 - source_start
+                return (codon_start - start) // 3
+            carry = source[source_end - (source_end - pos) % 3 : source_end]
+        return -1
@@ -6,7 +6,7 @@ import logging
 import pyensembl
 
 from variant import VariantInfo
-from utils import check_intersection_with_bed
+from utils import check_intersections_with_bed
 
 
 logger = logging.getLogger("GenOtoScope_Classify.protein_len_diff_repetitive_region")
@@ -22,15 +22,17 @@ def check_variant_in_critical_region_exon(
     Check if any of the NMD affected are in critical region
     """
     if NMD_affected_exons:
-        are_exons_in_critical_region = []
-        comment = ""
-        for exon in NMD_affected_exons:
-            gen_start = exon["exon_start"]
-            gen_end = exon["exon_end"]
-            is_exon_in_repetitive_region, comment = check_intersection_with_bed(
-                variant, gen_start, gen_end, ref_transcript, path_bed
-            )
-            are_exons_in_critical_region.append(is_exon_in_repetitive_region)
+        intervals = [
+            (exon["exon_start"], exon["exon_end"]) for exon in NMD_affected_exons
+        ]
+        exons_in_critical_region = check_intersections_with_bed(
+            variant, intervals, ref_transcript, path_bed
+        )
+        are_exons_in_critical_region = [
+            is_exon_in_critical_region
+            for is_exon_in_critical_region, _ in exons_in_critical_region
+        ]
+        comment = exons_in_critical_region[-1][1]
         if any(are_exons_in_critical_region):
             comment = f"Truncated exon overlaps the following clinically significant domains: {comment}."
             return True, comment
@@ -9,13 +9,18 @@ from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 
 from classify import classify
+from load_config import load_config
+from resource_preload import preload_resources_from_config
+from resource_registry import resource_registry
+from transcript_snapshot import use_transcript_snapshot
+import genotoscope_assess_NMD
+from genotoscope_exon_skipping import exon_skipping_memo
 from _version import __version__
 
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 import traceback
 
-import pybedtools
 
 app = FastAPI()
 @app.exception_handler(Exception)
@@ -48,6 +53,25 @@ async def _ping():
     pass
 
 
+@app.get("/resources", summary="Loaded annotation resources")
+async def resources() -> list[dict]:
+    """
+    Get kind, path, file size and memory footprint of the loaded annotation resources
+    """
+    return resource_registry.info()
+
+
+@app.get("/memos", summary="Memoized NMD and exon skipping outcomes")
+async def memos() -> dict[str, dict]:
+    """
+    Get hits, misses and size of the memos of NMD verdicts and exon skipping outcomes
+    """
+    return {
+        "NMD": genotoscope_assess_NMD.NMD_memo.info(),
+        "exon_skipping": exon_skipping_memo.info(),
+    }
+
+
 summary = "Classify variant"
 
 
@@ -91,7 +115,6 @@ async def classify_variant(input: Input) -> Result:
         )
     final_config, classification_result = classify(config_path, variant_str)
     date = datetime.date.today().isoformat()
-    pybedtools.cleanup()
     return Result(
         result=classification_result,
         config_file=config_path.name,
@@ -112,6 +135,28 @@ def main():
         "--host", action="store", default="0.0.0.0", help="Hosts to listen on", type=str
     )
 
+    parser.add_argument(
+        "--preload_config",
+        action="store",
+        default="",
+        help="Path to configuration, annotation files of the configuration and its gene specific configurations as well as ClinVar entries of the genes with gene specific configurations are loaded into memory on start up",
+        type=str,
+    )
+
+    parser.add_argument(
+        "--transcript_snapshot",
+        action="store",
+        default="",
+        help="Path to transcript snapshot, transcripts in the snapshot are loaded without querying Ensembl",
+        type=str,
+    )
+
+    parser.add_argument(
+        "--verify_nmd",
+        action="store_true",
+        help="Verify NMD prediction of exonic variants from NMD boundaries against prediction from observed exon sequences, differences are logged",
+    )
+
     parser.add_argument(
         "--version",
         action="version",
@@ -121,6 +166,14 @@ def main():
     # read passed CLI arguments
     args = parser.parse_args()
 
+    if args.preload_config != "":
+        preload_resources_from_config(load_config(pathlib.Path(args.preload_config)))
+
+    if args.transcript_snapshot != "":
+        use_transcript_snapshot(pathlib.Path(args.transcript_snapshot))
+
+    genotoscope_assess_NMD.verify_NMD_boundary = args.verify_nmd
+
     # create and run the web service
     uvicorn.run(app, host=args.host, port=args.port, reload=False)
 